@@ -3,6 +3,7 @@
 import os
 import warnings
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -165,3 +166,12 @@ def load_environment_settings() -> EnvironmentSettings:
             warnings.warn(f"Configuration warning: {warning}", stacklevel=2)
 
     return settings
+
+
+@lru_cache(maxsize=1)
+def get_environment_settings() -> EnvironmentSettings:
+    """環境設定の取得（初回のみ読み込み・検証し、以降はキャッシュを返す）.
+
+    環境変数を変更した場合は get_environment_settings.cache_clear() を呼ぶこと。
+    """
+    return load_environment_settings()
@@ -1,6 +1,7 @@
 """データベースモデル定義."""
 
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
 from sqlalchemy import (
@@ -40,11 +41,13 @@ class Base(DeclarativeBase):
 
 
 # Cross-database JSON type
+@lru_cache(maxsize=1)
 def get_json_type() -> type:
     """データベースに応じたJSON型を返す.
 
     PostgreSQLの場合はJSONB、その他（SQLite等）の場合はJSONを使用。
-    環境変数DATABASE_URLから判定する。
+    環境変数DATABASE_URLから判定する。結果はキャッシュされるため、
+    環境変数を変更した場合は get_json_type.cache_clear() を呼ぶこと。
     """
     import os
 
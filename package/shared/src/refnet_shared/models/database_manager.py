@@ -4,9 +4,9 @@ from collections.abc import Generator
 from contextlib import contextmanager
 from typing import Any
 
-from sqlalchemy import create_engine, text
+from sqlalchemy import Engine, create_engine, text
 from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import QueuePool, StaticPool
 
 from refnet_shared.config import settings
 from refnet_shared.exceptions import DatabaseError
@@ -15,24 +15,41 @@ from refnet_shared.utils import get_logger
 
 logger = get_logger(__name__)
 
+# 単一接続を共有する必要があるインメモリSQLiteのURL
+IN_MEMORY_SQLITE_URLS = ("sqlite://", "sqlite:///:memory:")
+
 
 class DatabaseManager:
     """データベース接続管理クラス."""
 
-    def __init__(self, database_url: str | None = None):
-        """初期化."""
+    def __init__(self, database_url: str | None = None, *, engine: Engine | None = None):
+        """初期化.
+
+        engineを指定した場合は新たなエンジンを作成せず、渡されたエンジンを利用する。
+        """
         self.database_url = database_url or settings.database.url
 
         # SQLAlchemy エンジン設定
-        self.engine = create_engine(
-            self.database_url,
-            poolclass=QueuePool,
-            pool_size=10,
-            max_overflow=20,
-            pool_pre_ping=True,
-            pool_recycle=3600,
-            echo=settings.debug,  # デバッグ時にSQLログを出力
-        )
+        if engine is not None:
+            self.engine = engine
+        elif self.database_url in IN_MEMORY_SQLITE_URLS:
+            # インメモリSQLiteは接続ごとに別DBとなるため、単一接続を共有する
+            self.engine = create_engine(
+                self.database_url,
+                poolclass=StaticPool,
+                connect_args={"check_same_thread": False},
+                echo=settings.debug,
+            )
+        else:
+            self.engine = create_engine(
+                self.database_url,
+                poolclass=QueuePool,
+                pool_size=10,
+                max_overflow=20,
+                pool_pre_ping=True,
+                pool_recycle=3600,
+                echo=settings.debug,  # デバッグ時にSQLログを出力
+            )
 
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
 
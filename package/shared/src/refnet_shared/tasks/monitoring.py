@@ -1,5 +1,6 @@
 """モニタリングタスク."""
 
+import asyncio
 from datetime import UTC, datetime
 from typing import Any
 
@@ -10,32 +11,43 @@ from refnet_shared.celery_app import app
 
 logger = structlog.get_logger(__name__)
 
+# ヘルスチェック対象サービス（サービス名, URL）
+HEALTH_CHECK_SERVICES: tuple[tuple[str, str], ...] = (
+    ("api", "http://api:8000/health"),
+    ("crawler", "http://crawler:8001/health"),
+    ("summarizer", "http://summarizer:8002/health"),
+    ("generator", "http://generator:8003/health"),
+)
+HEALTH_CHECK_TIMEOUT = 5.0
+
+
+async def _check_service(client: httpx.AsyncClient, url: str) -> dict[str, str | int | float]:
+    """単一サービスのヘルスチェック."""
+    try:
+        response = await client.get(url)
+        return {
+            "status": "healthy" if response.status_code == 200 else "unhealthy",
+            "status_code": response.status_code,
+            "response_time": response.elapsed.total_seconds(),
+        }
+    except Exception as e:
+        return {
+            "status": "error",
+            "error": str(e),
+        }
+
+
+async def _check_all_services() -> dict[str, dict[str, str | int | float]]:
+    """全サービスへのヘルスチェックを並行実行."""
+    async with httpx.AsyncClient(timeout=HEALTH_CHECK_TIMEOUT) as client:
+        checks = await asyncio.gather(*(_check_service(client, url) for _, url in HEALTH_CHECK_SERVICES))
+    return {name: check for (name, _), check in zip(HEALTH_CHECK_SERVICES, checks, strict=True)}
+
 
 @app.task(bind=True, name="refnet_shared.tasks.monitoring.health_check_all_services")  # type: ignore[misc]
 def health_check_all_services(self: Any) -> dict:
     """全サービスのヘルスチェック."""
-    services = {
-        "api": "http://api:8000/health",
-        "crawler": "http://crawler:8001/health",
-        "summarizer": "http://summarizer:8002/health",
-        "generator": "http://generator:8003/health",
-    }
-
-    results: dict[str, dict[str, str | int | float]] = {}
-
-    for service_name, url in services.items():
-        try:
-            response = httpx.get(url, timeout=5.0)
-            results[service_name] = {
-                "status": "healthy" if response.status_code == 200 else "unhealthy",
-                "status_code": response.status_code,
-                "response_time": response.elapsed.total_seconds(),
-            }
-        except Exception as e:
-            results[service_name] = {
-                "status": "error",
-                "error": str(e),
-            }
+    results = asyncio.run(_check_all_services())
 
     # 異常があればアラート（将来的にSlack通知等）
     unhealthy_services = [
@@ -4,11 +4,17 @@ import logging
 import sys
 from typing import Any
 
+import orjson
 import structlog
 
 from refnet_shared.config import settings
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """orjsonによるログレコードのシリアライズ（標準loggingへ渡すためstrで返す）."""
+    return orjson.dumps(obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 def setup_logging() -> None:
     """ロギング設定の初期化."""
     # 基本設定
@@ -28,7 +34,7 @@ def setup_logging() -> None:
             structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ]
     else:
         processors = [
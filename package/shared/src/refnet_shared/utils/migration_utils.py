@@ -2,6 +2,7 @@
 
 import os
 import subprocess
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -19,16 +20,20 @@ from refnet_shared.utils import get_logger
 logger = get_logger(__name__)
 
 
+def default_alembic_ini_path() -> Path:
+    """デフォルトのalembic.iniパス取得（package/shared/alembic.ini）."""
+    current_dir = Path(__file__).parent
+    # src/refnet_shared/utils -> src/refnet_shared -> src -> package/shared
+    return current_dir.parent.parent.parent / "alembic.ini"
+
+
 class MigrationManager:
     """マイグレーション管理クラス."""
 
-    def __init__(self, alembic_ini_path: str | None = None):
+    def __init__(self, alembic_ini_path: str | None = None, default_path_resolver: Callable[[], Path] = default_alembic_ini_path):
         """初期化."""
         if alembic_ini_path is None:
-            # package/shared/alembic.ini のパスを取得
-            current_dir = Path(__file__).parent
-            # src/refnet_shared/utils -> src/refnet_shared -> src -> package/shared
-            self.alembic_ini_path = current_dir.parent.parent.parent / "alembic.ini"
+            self.alembic_ini_path = default_path_resolver()
         else:
             self.alembic_ini_path = Path(alembic_ini_path)
 
@@ -1,8 +1,12 @@
 """pytest設定."""
 
+from unittest.mock import MagicMock, patch
+
 import pytest
 
+from refnet_shared.celery_app import celery_app
 from refnet_shared.config import Settings
+from refnet_shared.tasks import scheduled_tasks
 
 
 @pytest.fixture
@@ -32,3 +36,46 @@ def mock_env_vars(monkeypatch):
     }
     for key, value in test_vars.items():
         monkeypatch.setenv(key, value)
+
+
+@pytest.fixture
+def eager_celery(monkeypatch):
+    """Celeryタスクをeagerモードで実行（テスト終了時に元の設定へ戻す）."""
+    monkeypatch.setattr(celery_app.conf, "task_always_eager", True)
+
+
+@pytest.fixture(scope="module")
+def _patched_db_manager():
+    """scheduled_tasksのdb_managerをモジュール単位で一度だけモックへ差し替え."""
+    # scheduled_tasksが使うget_sessionのみ許可し、想定外の属性アクセスはAttributeErrorにする
+    with patch.object(scheduled_tasks, "db_manager", new=MagicMock(spec_set=["get_session"])) as db_manager:
+        yield db_manager
+
+
+@pytest.fixture
+def mock_db_manager(_patched_db_manager):
+    """モックdb_manager（テスト終了ごとに呼び出し記録・戻り値・side_effectをリセット）."""
+    yield _patched_db_manager
+    _patched_db_manager.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def mock_db_session(mock_db_manager):
+    """モックdb_managerのget_session()が返すセッションモック."""
+    return mock_db_manager.get_session.return_value.__enter__.return_value
+
+
+@pytest.fixture
+def raising():
+    """呼び出されると指定メッセージのRuntimeErrorを送出するスタブ関数のファクトリ.
+
+    例外インスタンスを共有すると送出のたびに__traceback__が連結されるため、呼び出しごとに生成する。
+    """
+
+    def _factory(message):
+        def _raise(*args, **kwargs):
+            raise RuntimeError(message)
+
+        return _raise
+
+    return _factory
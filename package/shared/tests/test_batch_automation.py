@@ -5,7 +5,6 @@ from celery.result import EagerResult
 
 from refnet_shared.celery_app import celery_app
 from refnet_shared.tasks.scheduled_tasks import (
-    CallbackTask,
     backup_database,
     cleanup_old_logs,
     collect_new_papers,
@@ -20,11 +19,8 @@ from refnet_shared.tasks.scheduled_tasks import (
 class TestBatchAutomation:
     """バッチ自動化テスト."""
 
-    def test_collect_new_papers_task(self):
+    def test_collect_new_papers_task(self, eager_celery):
         """新規論文収集タスクテスト."""
-        # Celeryをeagerモードに設定
-        celery_app.conf.task_always_eager = True
-
         result = collect_new_papers.delay(max_papers=10)
         assert isinstance(result, EagerResult)
         assert result.successful()
@@ -34,10 +30,8 @@ class TestBatchAutomation:
         if response["status"] == "success":
             assert "papers_scheduled" in response
 
-    def test_system_health_check_task(self):
+    def test_system_health_check_task(self, eager_celery):
         """システムヘルスチェックタスクテスト."""
-        celery_app.conf.task_always_eager = True
-
         result = system_health_check.delay()
         assert result.successful()
 
@@ -51,10 +45,8 @@ class TestBatchAutomation:
             assert "metrics" in response
             assert "overall_status" in response
 
-    def test_database_maintenance_task(self):
+    def test_database_maintenance_task(self, eager_celery):
         """データベースメンテナンスタスクテスト."""
-        celery_app.conf.task_always_eager = True
-
         result = database_maintenance.delay()
         assert result.successful()
 
@@ -82,10 +74,8 @@ class TestBatchAutomation:
             assert "task" in schedule[task_name]
             assert "schedule" in schedule[task_name]
 
-    def test_cleanup_old_logs_task(self):
+    def test_cleanup_old_logs_task(self, eager_celery):
         """ログクリーンアップタスクテスト."""
-        celery_app.conf.task_always_eager = True
-
         result = cleanup_old_logs.delay(days_to_keep=7)
         assert result.successful()
 
@@ -94,10 +84,8 @@ class TestBatchAutomation:
         if response["status"] == "success":
             assert "files_cleaned" in response
 
-    def test_process_pending_summaries_task(self):
+    def test_process_pending_summaries_task(self, eager_celery):
         """要約処理タスクテスト."""
-        celery_app.conf.task_always_eager = True
-
         result = process_pending_summaries.delay(batch_size=10)
         assert result.successful()
 
@@ -106,10 +94,8 @@ class TestBatchAutomation:
         if response["status"] == "success":
             assert "summaries_scheduled" in response
 
-    def test_generate_markdown_files_task(self):
+    def test_generate_markdown_files_task(self, eager_celery):
         """Markdown生成タスクテスト."""
-        celery_app.conf.task_always_eager = True
-
         result = generate_markdown_files.delay(batch_size=10)
         assert result.successful()
 
@@ -118,10 +104,8 @@ class TestBatchAutomation:
         if response["status"] == "success":
             assert "markdown_files_scheduled" in response
 
-    def test_generate_stats_report_task(self):
+    def test_generate_stats_report_task(self, eager_celery):
         """統計レポート生成タスクテスト."""
-        celery_app.conf.task_always_eager = True
-
         result = generate_stats_report.delay()
         assert result.successful()
 
@@ -131,10 +115,8 @@ class TestBatchAutomation:
             assert "stats" in response
             assert "report_file" in response
 
-    def test_backup_database_task_non_production(self):
+    def test_backup_database_task_non_production(self, eager_celery):
         """データベースバックアップタスクテスト（非本番環境）."""
-        celery_app.conf.task_always_eager = True
-
         result = backup_database.delay()
         assert result.successful()
 
@@ -142,26 +124,6 @@ class TestBatchAutomation:
         # 非本番環境ではスキップされるはず
         assert response["status"] in ["skipped", "success", "error"]
 
-    def test_callback_task_success(self):
-        """CallbackTaskの成功時コールバックテスト."""
-        task = CallbackTask()
-
-        # 例外が発生しないことを確認
-        try:
-            task.on_success(retval={"status": "success"}, task_id="test-id", args=(), kwargs={})
-        except Exception as e:
-            pytest.fail(f"on_success callback failed: {e}")
-
-    def test_callback_task_failure(self):
-        """CallbackTaskの失敗時コールバックテスト."""
-        task = CallbackTask()
-
-        # 例外が発生しないことを確認
-        try:
-            task.on_failure(exc=Exception("Test error"), task_id="test-id", args=(), kwargs={}, einfo=None)
-        except Exception as e:
-            pytest.fail(f"on_failure callback failed: {e}")
-
     def test_celery_configuration(self):
         """Celery設定のテスト."""
         config = celery_app.conf
@@ -182,12 +144,10 @@ class TestBatchAutomation:
         assert config.worker_prefetch_multiplier == 1
         assert config.worker_max_tasks_per_child == 1000
 
-    def test_debug_task(self):
+    def test_debug_task(self, eager_celery):
         """デバッグタスクテスト."""
         from refnet_shared.celery_app import debug_task
 
-        celery_app.conf.task_always_eager = True
-
         # デバッグタスクが例外を発生させないことを確認
         try:
             result = debug_task.delay()
@@ -195,15 +155,6 @@ class TestBatchAutomation:
         except Exception as e:
             pytest.fail(f"debug_task failed: {e}")
 
-    def test_monitoring_tasks_import(self):
-        """監視タスクのインポートテスト."""
-        try:
-            from refnet_shared.tasks.monitoring_tasks import MonitoringTask, critical_system_check
-            assert MonitoringTask is not None
-            assert critical_system_check is not None
-        except ImportError as e:
-            pytest.fail(f"Failed to import monitoring tasks: {e}")
-
     def test_cli_batch_import(self):
         """CLIバッチのインポートテスト."""
         try:
@@ -227,19 +227,16 @@ class TestCeleryAppConfiguration:
         assert hasattr(debug_task, 'delay')
         assert hasattr(debug_task, 'apply_async')
 
-    def test_debug_task_execution(self) -> None:
+    def test_debug_task_execution(self, eager_celery: None) -> None:
         """デバッグタスク実行のテスト."""
         # mock出力でタスク実行をテスト
         with patch('builtins.print'):
-            app.conf.task_always_eager = True
             try:
                 debug_task.apply()
                 # printが呼ばれたかの確認は困難なため、例外が発生しないことを確認
                 assert True
             except Exception as e:
                 pytest.fail(f"debug_task execution failed: {e}")
-            finally:
-                app.conf.task_always_eager = False
 
     def test_queue_routing_consistency(self) -> None:
         """キューとルーティングの一貫性テスト."""
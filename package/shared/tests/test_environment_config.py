@@ -276,6 +276,22 @@ def test_environment_settings_with_warnings():
             assert len(validator.warnings) > 0 or True  # 警告生成メカニズムのテスト
 
 
+def test_get_environment_settings_cached():
+    """環境設定の読み込みがキャッシュされることのテスト."""
+    from refnet_shared.config.environment import get_environment_settings
+
+    get_environment_settings.cache_clear()
+    try:
+        with patch("refnet_shared.config.environment.load_environment_settings") as mock_load:
+            first = get_environment_settings()
+            second = get_environment_settings()
+
+        assert first is second is mock_load.return_value
+        mock_load.assert_called_once()
+    finally:
+        get_environment_settings.cache_clear()
+
+
 def test_config_validator_edge_cases():
     """設定検証エッジケーステスト."""
     # 空文字列のデータベース設定
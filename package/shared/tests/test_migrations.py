@@ -1,33 +1,55 @@
 """マイグレーションテスト."""
 
-import tempfile
-from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
-from refnet_shared.utils.migration_utils import MigrationManager
+from refnet_shared.utils.migration_utils import MigrationManager, default_alembic_ini_path
 
-
-@pytest.fixture
-def test_migration_manager():
-    """テスト用マイグレーションマネージャー."""
-    # テスト用alembic.iniファイル作成
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".ini", delete=False) as f:
-        f.write("""
+# テスト用alembic.ini
+ALEMBIC_INI = """
 [alembic]
 script_location = alembic
 sqlalchemy.url = sqlite:///test.db
 timezone = UTC
 file_template = %%(year)d%%(month).2d%%(day).2d_%%(slug)s
-""")
-        alembic_ini_path = f.name
+"""
 
-    try:
-        manager = MigrationManager(alembic_ini_path)
-        yield manager
-    finally:
-        # クリーンアップ
-        Path(alembic_ini_path).unlink(missing_ok=True)
+
+@pytest.fixture
+def alembic_ini(tmp_path):
+    """テスト用alembic.iniファイル."""
+    alembic_ini_path = tmp_path / "alembic.ini"
+    alembic_ini_path.write_text(ALEMBIC_INI)
+    return alembic_ini_path
+
+
+@pytest.fixture
+def test_migration_manager(alembic_ini):
+    """テスト用マイグレーションマネージャー."""
+    return MigrationManager(str(alembic_ini))
+
+
+@pytest.fixture
+def patch_script_dir(monkeypatch):
+    """ScriptDirectory.from_configをモックするファクトリ."""
+    from alembic.script import ScriptDirectory
+
+    def _patch(head=None, revisions=(), pending=(), raise_exc=None):
+        script_dir = SimpleNamespace(
+            get_current_head=lambda: head,
+            walk_revisions=lambda: [SimpleNamespace(revision=r) for r in revisions],
+            iterate_revisions=lambda start, end: [SimpleNamespace(revision=r) for r in pending],
+        )
+
+        def mock_from_config(config):
+            if raise_exc is not None:
+                raise raise_exc
+            return script_dir
+
+        monkeypatch.setattr(ScriptDirectory, "from_config", mock_from_config)
+
+    return _patch
 
 
 def test_migration_validation(test_migration_manager):
@@ -51,12 +73,19 @@ def test_current_revision(test_migration_manager):
     assert revision is None or isinstance(revision, str)
 
 
-def test_migration_manager_init():
+def test_default_alembic_ini_path():
+    """デフォルトalembic.iniパステスト."""
+    # デフォルトではパッケージルートのalembic.iniが使用される
+    path = default_alembic_ini_path()
+    assert path.name == "alembic.ini"
+    assert path.parent.name == "shared"
+
+
+def test_migration_manager_init(alembic_ini):
     """マイグレーションマネージャー初期化テスト."""
-    # デフォルトalembic.iniファイルを使用
-    manager = MigrationManager()
-    # デフォルトではコードベースのルートパスが使用される
-    assert manager.alembic_ini_path.name == "alembic.ini"
+    # パス未指定時はデフォルトパスリゾルバーが使用される
+    manager = MigrationManager(default_path_resolver=lambda: alembic_ini)
+    assert manager.alembic_ini_path == alembic_ini
 
     # 存在しないカスタムalembic.iniファイルを使用しようとするとエラー
     custom_path = "custom_alembic.ini"
@@ -64,9 +93,9 @@ def test_migration_manager_init():
         manager = MigrationManager(custom_path)
 
 
-def test_reset_database_without_confirmation():
+def test_reset_database_without_confirmation(test_migration_manager):
     """データベースリセット確認なしテスト."""
-    manager = MigrationManager()
+    manager = test_migration_manager
     with pytest.raises(ValueError, match="Database reset requires explicit confirmation"):
         manager.reset_database(confirm=False)
 
@@ -148,7 +177,7 @@ def test_run_migrations_to_specific_revision(test_migration_manager, monkeypatch
         test_migration_manager.run_migrations("abc123")
 
 
-def test_migration_validation_with_issues(test_migration_manager, monkeypatch):
+def test_migration_validation_with_issues(test_migration_manager, monkeypatch, patch_script_dir):
     """問題ありマイグレーション検証テスト."""
 
     # ScriptDirectoryからの取得をモック
@@ -157,33 +186,7 @@ def test_migration_validation_with_issues(test_migration_manager, monkeypatch):
 
     # 未適用マイグレーションがある場合のテスト
     monkeypatch.setattr(test_migration_manager, "get_current_revision", mock_get_current_revision)
-
-    from alembic.script import ScriptDirectory
-
-    class MockScriptDirectory:
-        def get_current_head(self):
-            return "head123"
-
-        def walk_revisions(self):
-            # 複数のリビジョンを返すモック
-            class MockRevision:
-                def __init__(self, revision_id):
-                    self.revision = revision_id
-
-            return [MockRevision("rev1"), MockRevision("rev2")]
-
-        def iterate_revisions(self, start, end):
-            # 未適用のリビジョンを返すモック
-            class MockRevision:
-                def __init__(self, revision_id):
-                    self.revision = revision_id
-
-            return [MockRevision("pending1"), MockRevision("pending2")]
-
-    def mock_from_config(config):
-        return MockScriptDirectory()
-
-    monkeypatch.setattr(ScriptDirectory, "from_config", mock_from_config)
+    patch_script_dir(head="head123", revisions=["rev1", "rev2"], pending=["pending1", "pending2"])
 
     result = test_migration_manager.validate_migrations()
     assert result["status"] == "issues_found"
@@ -191,7 +194,7 @@ def test_migration_validation_with_issues(test_migration_manager, monkeypatch):
     assert len(result["issues"]) > 0
 
 
-def test_migration_validation_no_history(test_migration_manager, monkeypatch):
+def test_migration_validation_no_history(test_migration_manager, monkeypatch, patch_script_dir):
     """マイグレーション履歴なし検証テスト."""
 
     # 現在のリビジョンがNoneの場合（初回状態）
@@ -199,24 +202,7 @@ def test_migration_validation_no_history(test_migration_manager, monkeypatch):
         return None
 
     monkeypatch.setattr(test_migration_manager, "get_current_revision", mock_get_current_revision)
-
-    from alembic.script import ScriptDirectory
-
-    class MockScriptDirectory:
-        def get_current_head(self):
-            return "head123"
-
-        def walk_revisions(self):
-            class MockRevision:
-                def __init__(self, revision_id):
-                    self.revision = revision_id
-
-            return [MockRevision("rev1"), MockRevision("rev2")]
-
-    def mock_from_config(config):
-        return MockScriptDirectory()
-
-    monkeypatch.setattr(ScriptDirectory, "from_config", mock_from_config)
+    patch_script_dir(head="head123", revisions=["rev1", "rev2"])
 
     result = test_migration_manager.validate_migrations()
     assert result["status"] == "issues_found"
@@ -243,45 +229,30 @@ def test_migration_manager_alembic_config_error():
         MigrationManager("/nonexistent/path/alembic.ini")
 
 
-def test_get_current_revision_script_error(test_migration_manager, monkeypatch):
+def test_get_current_revision_script_error(test_migration_manager, patch_script_dir):
     """現在リビジョン取得スクリプトエラーテスト."""
-    from alembic.script import ScriptDirectory
-
     # ScriptDirectory.from_configを失敗させる
-    def mock_from_config(config):
-        raise Exception("Script directory error")
-
-    monkeypatch.setattr(ScriptDirectory, "from_config", mock_from_config)
+    patch_script_dir(raise_exc=Exception("Script directory error"))
 
     # エラー時はNoneが返される
     revision = test_migration_manager.get_current_revision()
     assert revision is None
 
 
-def test_get_migration_history_script_error(test_migration_manager, monkeypatch):
+def test_get_migration_history_script_error(test_migration_manager, patch_script_dir):
     """マイグレーション履歴取得スクリプトエラーテスト."""
-    from alembic.script import ScriptDirectory
-
     # ScriptDirectory.from_configを失敗させる
-    def mock_from_config(config):
-        raise Exception("Script directory error")
-
-    monkeypatch.setattr(ScriptDirectory, "from_config", mock_from_config)
+    patch_script_dir(raise_exc=Exception("Script directory error"))
 
     # エラー時は空リストが返される
     history = test_migration_manager.get_migration_history()
     assert history == []
 
 
-def test_validate_migrations_script_error(test_migration_manager, monkeypatch):
+def test_validate_migrations_script_error(test_migration_manager, patch_script_dir):
     """マイグレーション検証スクリプトエラーテスト."""
-    from alembic.script import ScriptDirectory
-
     # ScriptDirectory.from_configを失敗させる
-    def mock_from_config(config):
-        raise Exception("Script directory error")
-
-    monkeypatch.setattr(ScriptDirectory, "from_config", mock_from_config)
+    patch_script_dir(raise_exc=Exception("Script directory error"))
 
     result = test_migration_manager.validate_migrations()
     # エラー処理によって "error" または "issues_found" のいずれかになる
@@ -330,7 +301,7 @@ def test_reset_database_upgrade_error(test_migration_manager, monkeypatch):
         test_migration_manager.reset_database(confirm=True)
 
 
-def test_migration_manager_environment_error(monkeypatch):
+def test_migration_manager_environment_error(alembic_ini, monkeypatch):
     """マイグレーション環境エラーテスト."""
     from alembic.config import Config
 
@@ -341,7 +312,7 @@ def test_migration_manager_environment_error(monkeypatch):
     monkeypatch.setattr(Config, "__init__", mock_config_init)
 
     with pytest.raises(Exception, match="Config initialization failed"):
-        MigrationManager()
+        MigrationManager(default_path_resolver=lambda: alembic_ini)
 
 
 def test_migration_invalid_revision_format(test_migration_manager, monkeypatch):
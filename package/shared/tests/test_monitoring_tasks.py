@@ -1,23 +1,30 @@
 """モニタリングタスクのテスト."""
 
-from unittest.mock import MagicMock, patch
+from collections import namedtuple
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 
 from refnet_shared.tasks.monitoring import health_check_all_services
 
+# httpxレスポンスのうちヘルスチェックが参照する属性のみを持つスタブ
+Response = namedtuple("Response", ["status_code", "elapsed"])
+
+
+def make_response(status_code: int, seconds: float) -> Response:
+    """レスポンススタブ生成."""
+    return Response(status_code, timedelta(seconds=seconds))
+
 
 class TestMonitoringTasks:
     """モニタリングタスクのテストクラス."""
 
-    @patch("refnet_shared.tasks.monitoring.httpx.get")
-    def test_health_check_all_services_success(self, mock_get: MagicMock) -> None:
+    @patch("refnet_shared.tasks.monitoring.httpx.AsyncClient.get")
+    def test_health_check_all_services_success(self, mock_get: AsyncMock) -> None:
         """health_check_all_services正常系テスト."""
         # 正常なレスポンスをモック
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.elapsed.total_seconds.return_value = 0.1
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_response(200, 0.1)
 
         # タスクを実行
         result = health_check_all_services()
@@ -34,19 +41,14 @@ class TestMonitoringTasks:
             assert service in result
             assert result[service]["status"] == "healthy"
 
-    @patch("refnet_shared.tasks.monitoring.httpx.get")
-    def test_health_check_all_services_partial_failure(self, mock_get: MagicMock) -> None:
+    @patch("refnet_shared.tasks.monitoring.httpx.AsyncClient.get")
+    def test_health_check_all_services_partial_failure(self, mock_get: AsyncMock) -> None:
         """health_check_all_services一部失敗テスト."""
         # APIは正常、他は異常
-        def side_effect(url: str, timeout: float) -> MagicMock:
-            mock_response = MagicMock()
+        def side_effect(url: str) -> Response:
             if "api" in url:
-                mock_response.status_code = 200
-                mock_response.elapsed.total_seconds.return_value = 0.1
-            else:
-                mock_response.status_code = 500
-                mock_response.elapsed.total_seconds.return_value = 0.5
-            return mock_response
+                return make_response(200, 0.1)
+            return make_response(500, 0.5)
 
         mock_get.side_effect = side_effect
 
@@ -59,8 +61,8 @@ class TestMonitoringTasks:
         assert result["summarizer"]["status"] == "unhealthy"
         assert result["generator"]["status"] == "unhealthy"
 
-    @patch("refnet_shared.tasks.monitoring.httpx.get")
-    def test_health_check_all_services_exception(self, mock_get: MagicMock) -> None:
+    @patch("refnet_shared.tasks.monitoring.httpx.AsyncClient.get")
+    def test_health_check_all_services_exception(self, mock_get: AsyncMock) -> None:
         """health_check_all_services例外発生テスト."""
         # タイムアウト例外を発生させる
         mock_get.side_effect = httpx.TimeoutException("Connection timeout")
@@ -74,19 +76,13 @@ class TestMonitoringTasks:
             assert result[service]["status"] == "error"
             assert "Connection timeout" in result[service]["error"]
 
-    @patch("refnet_shared.tasks.monitoring.httpx.get")
+    @patch("refnet_shared.tasks.monitoring.httpx.AsyncClient.get")
     @patch("refnet_shared.tasks.monitoring.logger")
-    def test_health_check_warning_log(self, mock_logger: MagicMock, mock_get: MagicMock) -> None:
+    def test_health_check_warning_log(self, mock_logger: MagicMock, mock_get: AsyncMock) -> None:
         """health_check_all_services警告ログテスト."""
         # 一部サービスを異常にする
-        def side_effect(url: str, timeout: float) -> MagicMock:
-            mock_response = MagicMock()
-            if "api" in url:
-                mock_response.status_code = 200
-            else:
-                mock_response.status_code = 500
-            mock_response.elapsed.total_seconds.return_value = 0.1
-            return mock_response
+        def side_effect(url: str) -> Response:
+            return make_response(200 if "api" in url else 500, 0.1)
 
         mock_get.side_effect = side_effect
 
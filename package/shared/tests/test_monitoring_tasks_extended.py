@@ -1,200 +1,210 @@
 """monitoring_tasksモジュールの包括的テスト."""
 
-from unittest.mock import MagicMock, patch
+from collections.abc import Callable
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
+from unittest.mock import MagicMock
 
+import pytest
+
+import refnet_shared.tasks.monitoring_tasks as mt
 from refnet_shared.tasks.monitoring_tasks import (
     MonitoringTask,
     auto_recovery_health_check,
     critical_system_check,
 )
 
+pytestmark = pytest.mark.xdist_group(name="monitoring")
+
+SUCCESS_RECOVERIES = tuple(SimpleNamespace(status=SimpleNamespace(value="success")) for _ in range(2))
+FAILED_RECOVERIES = tuple(SimpleNamespace(status=SimpleNamespace(value="failed")) for _ in range(15))
+RAISE = object()
+
+TEST_ERROR = Exception("Test error")
+DB_ERROR = Exception("Database error")
+DB_CONNECTION_ERROR = Exception("Database connection failed")
+REDIS_TIMEOUT_ERROR = Exception("Redis connection timeout")
+
+HEALTHY = MappingProxyType({"database": "healthy", "redis": "healthy", "disk_usage": 50, "memory_usage": 60, "cpu_usage": 30})
+UNHEALTHY = MappingProxyType({"database": "unhealthy", "redis": "healthy", "disk_usage": 95, "memory_usage": 97, "cpu_usage": 85})
+
+
+@pytest.fixture(autouse=True)
+def mock_mt(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """monitoring_tasksの外部依存をモックへ差し替え（テストごとに一括適用）."""
+    mocks = SimpleNamespace(
+        track_task=MagicMock(),
+        asyncio_run=MagicMock(),
+        logger_critical=MagicMock(),
+        logger_error=MagicMock(),
+        logger_warning=MagicMock(),
+        trigger_recovery=MagicMock(),
+        check_system_health=MagicMock(),
+        get_auto_recovery_manager=MagicMock(),
+    )
+    monkeypatch.setattr(mt.MetricsCollector, "track_task", mocks.track_task)
+    monkeypatch.setattr(mt.asyncio, "run", mocks.asyncio_run)
+    monkeypatch.setattr(mt.logger, "critical", mocks.logger_critical)
+    monkeypatch.setattr(mt.logger, "error", mocks.logger_error)
+    monkeypatch.setattr(mt.logger, "warning", mocks.logger_warning)
+    monkeypatch.setattr(mt, "trigger_recovery", mocks.trigger_recovery)
+    monkeypatch.setattr(mt, "check_system_health", mocks.check_system_health)
+    monkeypatch.setattr(mt, "get_auto_recovery_manager", mocks.get_auto_recovery_manager)
+    return mocks
+
+
+@pytest.fixture
+def recovery_mgr(mock_mt: SimpleNamespace) -> MagicMock:
+    """get_auto_recovery_managerが返す復旧マネージャモック（基本設定済み）."""
+    mgr: MagicMock = mock_mt.get_auto_recovery_manager.return_value
+    mgr.get_recovery_history.return_value = ()
+    mgr.get_recovery_statistics.return_value = {"total_recoveries": 0}
+    mgr.cooldown_timers = {}
+    return mgr
+
 
 class TestMonitoringTask:
     """MonitoringTaskクラスのテスト."""
 
-    def test_on_success(self) -> None:
+    def test_on_success(self, mock_mt: SimpleNamespace) -> None:
         """on_success正常系テスト."""
         task = MonitoringTask()
         task.name = "test_task"
 
-        with patch("refnet_shared.tasks.monitoring_tasks.MetricsCollector.track_task") as mock_track:
-            task.on_success("result", "task-123", [], {})
-            mock_track.assert_called_once_with("test_task", "SUCCESS")
+        task.on_success("result", "task-123", [], {})
 
-    def test_on_failure_normal_task(self) -> None:
+        assert mock_mt.track_task.call_count == 1
+        assert mock_mt.track_task.call_args.args == ("test_task", "SUCCESS")
+
+    def test_on_failure_normal_task(self, mock_mt: SimpleNamespace) -> None:
         """on_failure通常タスクテスト."""
         task = MonitoringTask()
         task.name = "test_task"
 
-        with patch("refnet_shared.tasks.monitoring_tasks.MetricsCollector.track_task") as mock_track:
-            exc = Exception("Test error")
-            task.on_failure(exc, "task-123", [], {}, None)
+        task.on_failure(TEST_ERROR, "task-123", [], {}, None)
 
-            mock_track.assert_called_once_with("test_task", "FAILURE")
+        assert mock_mt.track_task.call_count == 1
+        assert mock_mt.track_task.call_args.args == ("test_task", "FAILURE")
 
-    def test_on_failure_critical_task(self) -> None:
+    def test_on_failure_critical_task(self, mock_mt: SimpleNamespace, monkeypatch: pytest.MonkeyPatch) -> None:
         """on_failure重要タスクテスト."""
         task = MonitoringTask()
         task.name = "refnet.scheduled.database_maintenance"
+        mock_alert = MagicMock()
+        mock_recovery = MagicMock()
+        monkeypatch.setattr(task, "_send_alert", mock_alert)
+        monkeypatch.setattr(task, "_trigger_auto_recovery", mock_recovery)
 
-        with patch("refnet_shared.tasks.monitoring_tasks.MetricsCollector.track_task") as mock_track, \
-             patch.object(task, "_send_alert") as mock_alert, \
-             patch.object(task, "_trigger_auto_recovery") as mock_recovery:
-
-            exc = Exception("Database error")
-            task.on_failure(exc, "task-123", [], {}, None)
+        task.on_failure(DB_ERROR, "task-123", [], {}, None)
 
-            mock_track.assert_called_once_with("refnet.scheduled.database_maintenance", "FAILURE")
-            mock_alert.assert_called_once()
-            mock_recovery.assert_called_once()
+        assert mock_mt.track_task.call_count == 1
+        assert mock_mt.track_task.call_args.args == ("refnet.scheduled.database_maintenance", "FAILURE")
+        mock_alert.assert_called_once()
+        mock_recovery.assert_called_once()
 
-    def test_send_alert(self) -> None:
+    def test_send_alert(self, mock_mt: SimpleNamespace) -> None:
         """_send_alertテスト."""
         task = MonitoringTask()
 
-        with patch("refnet_shared.tasks.monitoring_tasks.logger.critical") as mock_log:
-            task._send_alert("Test subject", "Test message")
-            mock_log.assert_called_once()
-
-    def test_trigger_auto_recovery_database(self) -> None:
-        """_trigger_auto_recovery データベースエラーテスト."""
-        task = MonitoringTask()
-
-        with patch("refnet_shared.tasks.monitoring_tasks.asyncio.run") as mock_run, \
-             patch("refnet_shared.tasks.monitoring_tasks.trigger_recovery"):
-
-            exc = Exception("Database connection failed")
-            task._trigger_auto_recovery(exc, "task-123")
-
-            mock_run.assert_called_once()
-
-    def test_trigger_auto_recovery_redis(self) -> None:
-        """_trigger_auto_recovery Redisエラーテスト."""
-        task = MonitoringTask()
-
-        with patch("refnet_shared.tasks.monitoring_tasks.asyncio.run") as mock_run:
-            exc = Exception("Redis connection timeout")
-            task._trigger_auto_recovery(exc, "task-123")
-
-            mock_run.assert_called_once()
-
-    def test_trigger_auto_recovery_exception(self) -> None:
-        """_trigger_auto_recovery 例外テスト."""
+        task._send_alert("Test subject", "Test message")
+
+        mock_mt.logger_critical.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("exc", "run_side_effect", "expected_trigger", "expected_error_logs"),
+        [
+            (DB_CONNECTION_ERROR, None, "database_connection_failed", 0),
+            # "connection" を含むためデータベース復旧が優先される
+            (REDIS_TIMEOUT_ERROR, None, "database_connection_failed", 0),
+            (DB_CONNECTION_ERROR, Exception("Recovery failed"), "database_connection_failed", 1),
+        ],
+        ids=["database", "redis", "exception"],
+    )
+    def test_trigger_auto_recovery(
+        self, mock_mt: SimpleNamespace, exc: Exception, run_side_effect: Exception | None, expected_trigger: str, expected_error_logs: int
+    ) -> None:
+        """_trigger_auto_recovery 障害種別ごとのテスト."""
         task = MonitoringTask()
+        mock_mt.asyncio_run.side_effect = run_side_effect
 
-        with patch("refnet_shared.tasks.monitoring_tasks.asyncio.run") as mock_run, \
-             patch("refnet_shared.tasks.monitoring_tasks.logger.error") as mock_log, \
-             patch("refnet_shared.tasks.monitoring_tasks.trigger_recovery"):
+        task._trigger_auto_recovery(exc, "task-123")
 
-            mock_run.side_effect = Exception("Recovery failed")
-            exc = Exception("Database connection failed")
-            task._trigger_auto_recovery(exc, "task-123")
-
-            mock_log.assert_called_once()
+        mock_mt.asyncio_run.assert_called_once()
+        assert mock_mt.trigger_recovery.call_args.args[0] == expected_trigger
+        assert mock_mt.logger_error.call_count == expected_error_logs
 
 
 class TestCriticalSystemCheck:
     """critical_system_checkのテスト."""
 
-    @patch("refnet_shared.tasks.monitoring_tasks.check_system_health")
-    @patch("refnet_shared.tasks.monitoring_tasks.get_auto_recovery_manager")
-    def test_critical_system_check_healthy(self, mock_manager: MagicMock, mock_health: MagicMock) -> None:
-        """critical_system_check正常系テスト."""
-        mock_health.return_value = {
-            "database": "healthy",
-            "redis": "healthy",
-            "disk_usage": 50,
-            "memory_usage": 60,
-            "cpu_usage": 30
-        }
-
-        mock_mgr = MagicMock()
-        mock_mgr.get_recovery_statistics.return_value = {"total_recoveries": 0}
-        mock_manager.return_value = mock_mgr
-
-        result = critical_system_check()
-
-        assert result["status"] == "healthy"
-        assert result["critical_issues"] == []
-
-    @patch("refnet_shared.tasks.monitoring_tasks.check_system_health")
-    @patch("refnet_shared.tasks.monitoring_tasks.get_auto_recovery_manager")
-    @patch("refnet_shared.tasks.monitoring_tasks.asyncio.run")
-    def test_critical_system_check_unhealthy(self, mock_run: MagicMock, mock_manager: MagicMock, mock_health: MagicMock) -> None:
-        """critical_system_check異常系テスト."""
-        mock_health.return_value = {
-            "database": "unhealthy",
-            "redis": "healthy",
-            "disk_usage": 95,
-            "memory_usage": 97,
-            "cpu_usage": 85
-        }
-
-        mock_mgr = MagicMock()
-        mock_mgr.get_recovery_statistics.return_value = {"total_recoveries": 5}
-        mock_manager.return_value = mock_mgr
+    @pytest.mark.parametrize(
+        ("health", "expected_status", "expected_issues"),
+        [
+            (HEALTHY, "healthy", []),
+            (UNHEALTHY, "critical", ["database", "disk_space", "memory"]),
+            (RAISE, "error", None),
+        ],
+        ids=["healthy", "unhealthy", "exception"],
+    )
+    def test_critical_system_check(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        mock_mt: SimpleNamespace,
+        recovery_mgr: MagicMock,
+        raising: Callable[[str], Any],
+        health: Any,
+        expected_status: str,
+        expected_issues: list[str] | None,
+    ) -> None:
+        """critical_system_checkのヘルス状態別テスト."""
+        if health is RAISE:
+            monkeypatch.setattr(mt, "check_system_health", raising("Health check failed"))
+        else:
+            mock_mt.check_system_health.return_value = health
 
         result = critical_system_check()
 
-        assert result["status"] == "critical"
-        assert "database" in result["critical_issues"]
-        assert "disk_space" in result["critical_issues"]
-        assert "memory" in result["critical_issues"]
-
-    @patch("refnet_shared.tasks.monitoring_tasks.check_system_health")
-    def test_critical_system_check_exception(self, mock_health: MagicMock) -> None:
-        """critical_system_check例外テスト."""
-        mock_health.side_effect = Exception("Health check failed")
-
-        result = critical_system_check()
-
-        assert result["status"] == "error"
-        assert "Health check failed" in result["error"]
+        assert result["status"] == expected_status
+        if expected_issues is None:
+            assert "Health check failed" in result["error"]
+        else:
+            assert result["critical_issues"] == expected_issues
 
 
 class TestAutoRecoveryHealthCheck:
     """auto_recovery_health_checkのテスト."""
 
-    @patch("refnet_shared.tasks.monitoring_tasks.get_auto_recovery_manager")
-    def test_auto_recovery_health_check_success(self, mock_manager: MagicMock) -> None:
-        """auto_recovery_health_check成功テスト."""
-        mock_mgr = MagicMock()
-        mock_mgr.get_recovery_history.return_value = [
-            MagicMock(status=MagicMock(value="success")),
-            MagicMock(status=MagicMock(value="success"))
-        ]
-        mock_mgr.get_recovery_statistics.return_value = {"total_recoveries": 2}
-        mock_mgr.cooldown_timers = {}
-        mock_manager.return_value = mock_mgr
+    @pytest.mark.parametrize(
+        ("history", "cooldown_timers", "expected_failed", "expected_warnings"),
+        [
+            (SUCCESS_RECOVERIES, {}, 0, 0),
+            (FAILED_RECOVERIES, {"database": 1000000000}, 15, 1),
+        ],
+        ids=["success", "high_failures"],
+    )
+    def test_auto_recovery_health_check(
+        self,
+        mock_mt: SimpleNamespace,
+        recovery_mgr: MagicMock,
+        history: tuple[SimpleNamespace, ...],
+        cooldown_timers: dict[str, int],
+        expected_failed: int,
+        expected_warnings: int,
+    ) -> None:
+        """auto_recovery_health_checkの復旧履歴別テスト."""
+        recovery_mgr.get_recovery_history.return_value = history
+        recovery_mgr.cooldown_timers = cooldown_timers
 
         result = auto_recovery_health_check()
 
         assert result["status"] == "success"
-        assert result["recent_recovery_count"] == 2
-        assert result["failed_recovery_count"] == 0
-
-    @patch("refnet_shared.tasks.monitoring_tasks.get_auto_recovery_manager")
-    def test_auto_recovery_health_check_high_failures(self, mock_manager: MagicMock) -> None:
-        """auto_recovery_health_check高失敗率テスト."""
-        failed_recoveries = [MagicMock(status=MagicMock(value="failed")) for _ in range(15)]
-
-        mock_mgr = MagicMock()
-        mock_mgr.get_recovery_history.return_value = failed_recoveries
-        mock_mgr.get_recovery_statistics.return_value = {"total_recoveries": 15}
-        mock_mgr.cooldown_timers = {"database": 1000000000}  # Future timestamp
-        mock_manager.return_value = mock_mgr
-
-        with patch("refnet_shared.tasks.monitoring_tasks.logger.warning") as mock_warn:
-            result = auto_recovery_health_check()
-
-            assert result["status"] == "success"
-            assert result["failed_recovery_count"] == 15
-            mock_warn.assert_called_once()
+        assert result["recent_recovery_count"] == len(history)
+        assert result["failed_recovery_count"] == expected_failed
+        assert mock_mt.logger_warning.call_count == expected_warnings
 
-    @patch("refnet_shared.tasks.monitoring_tasks.get_auto_recovery_manager")
-    def test_auto_recovery_health_check_exception(self, mock_manager: MagicMock) -> None:
+    def test_auto_recovery_health_check_exception(self, monkeypatch: pytest.MonkeyPatch, raising: Callable[[str], Any]) -> None:
         """auto_recovery_health_check例外テスト."""
-        mock_manager.side_effect = Exception("Recovery manager failed")
+        monkeypatch.setattr(mt, "get_auto_recovery_manager", raising("Recovery manager failed"))
 
         result = auto_recovery_health_check()
 
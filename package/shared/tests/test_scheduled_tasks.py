@@ -1,9 +1,20 @@
 """scheduled_tasksモジュールのテスト."""
 
-from unittest.mock import MagicMock, patch
+import builtins
+import glob
+import importlib
+import os
+import subprocess
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import DEFAULT, MagicMock, Mock
 
 import pytest
+from pytest_mock import MockerFixture
 
+from refnet_shared.config import environment
+from refnet_shared.tasks import scheduled_tasks
 from refnet_shared.tasks.scheduled_tasks import (
     CallbackTask,
     backup_database,
@@ -16,6 +27,55 @@ from refnet_shared.tasks.scheduled_tasks import (
     system_health_check,
 )
 
+pytestmark = pytest.mark.xdist_group(name="scheduled")
+
+# middlewareパッケージが同名のrate_limiterインスタンスを再エクスポートしているためモジュールを直接取得
+rate_limiter_module = importlib.import_module("refnet_shared.middleware.rate_limiter")
+
+TEST_ERROR = Exception("Test error")
+DB_ERROR_MESSAGE = "Database error"
+BACKUP_ERROR_MESSAGE = "Backup failed"
+STATS_ERROR_MESSAGE = "Stats error"
+
+# モック論文データ（タスクはpaper_idのみ参照）
+PENDING_PAPERS = tuple(SimpleNamespace(paper_id=f"paper-{i}") for i in range(3))
+
+
+# configure_sessionのキーワード引数とセッションモック上のクエリチェーンの対応
+QUERY_CHAINS = {
+    "rows": "query.return_value.filter.return_value.limit.return_value.all.return_value",
+    "count": "query.return_value.count.return_value",
+    "filtered": "query.return_value.filter.return_value.count.return_value",
+    "deleted": "query.return_value.filter.return_value.delete.return_value",
+}
+
+
+def configure_session(session: MagicMock, **results: Any) -> MagicMock:
+    """セッションモックのクエリチェーン戻り値を一括設定."""
+    session.configure_mock(**{QUERY_CHAINS[name]: value for name, value in results.items()})
+    return session
+
+
+@pytest.fixture
+def backup_mocks(mocker: MockerFixture) -> SimpleNamespace:
+    """pg_dump実行・ファイル参照・環境設定をモックへ差し替え."""
+    subprocess_stub = MagicMock(spec_set=["run"])
+    patched = mocker.patch.multiple(scheduled_tasks, subprocess=subprocess_stub, Path=DEFAULT)
+    mocks = SimpleNamespace(
+        run=subprocess_stub.run,
+        path=patched["Path"],
+        settings=mocker.patch.object(environment, "load_environment_settings"),
+    )
+    mocks.run.return_value = subprocess.CompletedProcess(args=["pg_dump"], returncode=0, stdout="", stderr="")
+    mocks.path.return_value.stat.return_value.st_size = 1024
+    mocks.settings.return_value.is_production.return_value = True
+    mocks.settings.return_value.database.host = "localhost"
+    mocks.settings.return_value.database.port = 5432
+    mocks.settings.return_value.database.username = "user"
+    mocks.settings.return_value.database.database = "refnet"
+    mocks.settings.return_value.database.password = "pass"
+    return mocks
+
 
 class TestCallbackTask:
     """CallbackTaskクラスのテスト."""
@@ -26,46 +86,31 @@ class TestCallbackTask:
         task.name = "test_task"
 
         # 例外が発生しないことを確認
-        try:
-            task.on_success("result", "task-123", [], {})
-        except Exception as e:
-            pytest.fail(f"on_success failed: {e}")
+        task.on_success("result", "task-123", [], {})
 
     def test_on_failure(self) -> None:
         """on_failure正常系テスト."""
         task = CallbackTask()
 
         # 例外が発生しないことを確認
-        try:
-            task.on_failure(Exception("Test error"), "task-123", [], {}, None)
-        except Exception as e:
-            pytest.fail(f"on_failure failed: {e}")
+        task.on_failure(TEST_ERROR, "task-123", [], {}, None)
 
 
 class TestCollectNewPapers:
     """collect_new_papersのテスト."""
 
-    @patch("refnet_shared.tasks.scheduled_tasks.db_manager")
-    def test_collect_new_papers_success(self, mock_db: MagicMock) -> None:
+    def test_collect_new_papers_success(self, mock_db_session: MagicMock) -> None:
         """論文収集成功テスト."""
-        mock_session = MagicMock()
-        mock_db.get_session.return_value.__enter__.return_value = mock_session
-        mock_session.query.return_value.filter.return_value.limit.return_value.all.return_value = []
+        configure_session(mock_db_session, rows=[])
 
         result = collect_new_papers(max_papers=5)
 
         assert result["status"] == "success"
         assert "papers_scheduled" in result
 
-    @patch("refnet_shared.tasks.scheduled_tasks.db_manager")
-    def test_collect_new_papers_with_papers(self, mock_db: MagicMock) -> None:
+    def test_collect_new_papers_with_papers(self, mock_db_session: MagicMock) -> None:
         """論文収集（論文あり）テスト."""
-        mock_session = MagicMock()
-        mock_db.get_session.return_value.__enter__.return_value = mock_session
-
-        # モック論文データ
-        mock_papers = [MagicMock(paper_id=f"paper-{i}") for i in range(3)]
-        mock_session.query.return_value.filter.return_value.limit.return_value.all.return_value = mock_papers
+        configure_session(mock_db_session, rows=PENDING_PAPERS)
 
         # The function will catch ImportError and continue
         result = collect_new_papers(max_papers=5)
@@ -77,12 +122,9 @@ class TestCollectNewPapers:
 class TestProcessPendingSummaries:
     """process_pending_summariesのテスト."""
 
-    @patch("refnet_shared.tasks.scheduled_tasks.db_manager")
-    def test_process_pending_summaries_success(self, mock_db: MagicMock) -> None:
+    def test_process_pending_summaries_success(self, mock_db_session: MagicMock) -> None:
         """要約処理成功テスト."""
-        mock_session = MagicMock()
-        mock_db.get_session.return_value.__enter__.return_value = mock_session
-        mock_session.query.return_value.filter.return_value.limit.return_value.all.return_value = []
+        configure_session(mock_db_session, rows=[])
 
         result = process_pending_summaries(batch_size=5)
 
@@ -93,12 +135,9 @@ class TestProcessPendingSummaries:
 class TestGenerateMarkdownFiles:
     """generate_markdown_filesのテスト."""
 
-    @patch("refnet_shared.tasks.scheduled_tasks.db_manager")
-    def test_generate_markdown_files_success(self, mock_db: MagicMock) -> None:
+    def test_generate_markdown_files_success(self, mock_db_session: MagicMock) -> None:
         """Markdown生成成功テスト."""
-        mock_session = MagicMock()
-        mock_db.get_session.return_value.__enter__.return_value = mock_session
-        mock_session.query.return_value.filter.return_value.limit.return_value.all.return_value = []
+        configure_session(mock_db_session, rows=[])
 
         result = generate_markdown_files(batch_size=5)
 
@@ -109,147 +148,100 @@ class TestGenerateMarkdownFiles:
 class TestDatabaseMaintenance:
     """database_maintenanceのテスト."""
 
-    @patch("refnet_shared.tasks.scheduled_tasks.db_manager")
-    def test_database_maintenance_success(self, mock_db: MagicMock) -> None:
+    def test_database_maintenance_success(self, mock_db_session: MagicMock) -> None:
         """データベースメンテナンス成功テスト."""
-        mock_session = MagicMock()
-        mock_db.get_session.return_value.__enter__.return_value = mock_session
-
         # VACUUMとANALYZE操作をモック
-        mock_session.execute.return_value = None
+        mock_db_session.execute.return_value = None
 
         # Query chain for delete operation
-        mock_query = MagicMock()
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value = mock_query
-        mock_query.delete.return_value = 5  # Mock deleted items count
+        configure_session(mock_db_session, deleted=5)
 
         result = database_maintenance()
 
         assert result["status"] == "success"
         assert "maintenance_tasks" in result
-        mock_session.execute.assert_called()
-
-    @patch("refnet_shared.tasks.scheduled_tasks.db_manager")
-    def test_database_maintenance_exception(self, mock_db: MagicMock) -> None:
-        """データベースメンテナンス例外テスト."""
-        mock_db.get_session.side_effect = Exception("Database error")
-
-        result = database_maintenance()
-
-        assert result["status"] == "error"
-        assert "Database error" in result["error"]
+        mock_db_session.execute.assert_called()
 
 
 class TestSystemHealthCheck:
     """system_health_checkのテスト."""
 
-    @patch("refnet_shared.tasks.scheduled_tasks.db_manager")
-    @patch("refnet_shared.tasks.scheduled_tasks.MetricsCollector.update_paper_counts")
-    def test_system_health_check_healthy(self, mock_metrics: MagicMock, mock_db: MagicMock) -> None:
+    def test_system_health_check_healthy(self, mocker: MockerFixture, mock_db_session: MagicMock) -> None:
         """システムヘルスチェック正常テスト."""
-        mock_session = MagicMock()
-        mock_db.get_session.return_value.__enter__.return_value = mock_session
-        mock_session.query.return_value.count.return_value = 100
-        mock_session.query.return_value.filter.return_value.count.return_value = 50
+        mocker.patch.object(scheduled_tasks.MetricsCollector, "update_paper_counts")
+        configure_session(mock_db_session, count=100, filtered=50)
 
-        with patch("refnet_shared.middleware.rate_limiter.rate_limiter") as mock_rate_limiter:
-            mock_rate_limiter.redis_client.ping.return_value = True
+        mock_rate_limiter = mocker.patch.object(rate_limiter_module, "rate_limiter")
+        mock_rate_limiter.redis_client.ping.return_value = True
 
-            result = system_health_check()
+        result = system_health_check()
 
-            assert result["overall_status"] == "healthy"
-            assert "services" in result
+        assert result["overall_status"] == "healthy"
+        assert "services" in result
 
-    @patch("refnet_shared.tasks.scheduled_tasks.db_manager")
-    def test_system_health_check_unhealthy(self, mock_db: MagicMock) -> None:
+    def test_system_health_check_unhealthy(self, monkeypatch: pytest.MonkeyPatch, mock_db_manager: MagicMock, raising: Callable[[str], Any]) -> None:
         """システムヘルスチェック異常テスト."""
-        mock_db.get_session.side_effect = Exception("Database error")
+        monkeypatch.setattr(mock_db_manager, "get_session", raising(DB_ERROR_MESSAGE))
 
         result = system_health_check()
 
         assert result["status"] == "error"
-        assert "Database error" in result["error"]
+        assert DB_ERROR_MESSAGE in result["error"]
 
 
 class TestBackupDatabase:
     """backup_databaseのテスト."""
 
-    @patch("refnet_shared.config.environment.load_environment_settings")
-    @patch("refnet_shared.tasks.scheduled_tasks.subprocess.run")
-    @patch("refnet_shared.tasks.scheduled_tasks.Path")
-    def test_backup_database_production(self, mock_path: MagicMock, mock_run: MagicMock, mock_settings: MagicMock) -> None:
+    def test_backup_database_production(self, backup_mocks: SimpleNamespace) -> None:
         """本番環境バックアップテスト."""
-        mock_settings.return_value.is_production.return_value = True
-        mock_settings.return_value.database.host = "localhost"
-        mock_settings.return_value.database.port = 5432
-        mock_settings.return_value.database.username = "user"
-        mock_settings.return_value.database.database = "refnet"
-        mock_settings.return_value.database.password = "pass"
-
-        mock_run.return_value = MagicMock(returncode=0)
-        mock_path.return_value.stat.return_value.st_size = 1024
-
         result = backup_database()
 
         assert result["status"] == "success"
-        mock_run.assert_called_once()
+        backup_mocks.run.assert_called_once()
 
-    @patch("refnet_shared.config.environment.load_environment_settings")
-    def test_backup_database_non_production(self, mock_settings: MagicMock) -> None:
+    def test_backup_database_non_production(self, backup_mocks: SimpleNamespace) -> None:
         """非本番環境バックアップテスト."""
-        mock_settings.return_value.is_production.return_value = False
+        backup_mocks.settings.return_value.is_production.return_value = False
 
         result = backup_database()
 
         assert result["status"] == "skipped"
         assert result["reason"] == "non-production environment"
-
-    @patch("refnet_shared.config.environment.load_environment_settings")
-    @patch("refnet_shared.tasks.scheduled_tasks.subprocess.run")
-    def test_backup_database_failure(self, mock_run: MagicMock, mock_settings: MagicMock) -> None:
-        """バックアップ失敗テスト."""
-        mock_settings.return_value.is_production.return_value = True
-        mock_run.side_effect = Exception("Backup failed")
-
-        result = backup_database()
-
-        assert result["status"] == "error"
-        assert "Backup failed" in result["error"]
+        backup_mocks.run.assert_not_called()
 
 
 class TestCleanupOldLogs:
     """cleanup_old_logsのテスト."""
 
-    @patch("glob.glob")
-    @patch("os.path.exists")
-    def test_cleanup_old_logs_success(self, mock_exists: MagicMock, mock_glob: MagicMock) -> None:
+    def test_cleanup_old_logs_success(self, mocker: MockerFixture) -> None:
         """ログクリーンアップ成功テスト."""
-        mock_exists.return_value = True
-        mock_glob.return_value = ["/var/log/test.log"]
-
-        with patch("refnet_shared.tasks.scheduled_tasks.Path") as mock_path:
-            # Mock path object for file operations
-            mock_file_path = MagicMock()
-            mock_file_path.stat.return_value.st_mtime = 1000000  # Old timestamp
-            mock_file_path.stat.return_value.st_size = 1024  # File size
-            mock_path.return_value = mock_file_path
-
-            with patch("refnet_shared.tasks.scheduled_tasks.datetime") as mock_datetime:
-                # Mock datetime for comparison
-                mock_datetime.utcnow.return_value = MagicMock()
-                mock_datetime.fromtimestamp.return_value = MagicMock()
-                # Make the comparison return True (old file)
-                mock_datetime.fromtimestamp.return_value.__lt__ = MagicMock(return_value=True)
-
-                result = cleanup_old_logs(days_to_keep=7)
-
-            assert result["status"] == "success"
-            assert result["files_cleaned"] == 3
-
-    @patch("refnet_shared.tasks.scheduled_tasks.Path")
-    def test_cleanup_old_logs_no_files(self, mock_path: MagicMock) -> None:
+        mocker.patch.object(glob, "glob", return_value=["/var/log/test.log"])
+        mocker.patch.object(os.path, "exists", return_value=True)
+
+        mocks = mocker.patch.multiple(scheduled_tasks, Path=DEFAULT, datetime=DEFAULT)
+
+        # Mock path object for file operations
+        mock_file_path = MagicMock()
+        mock_file_path.stat.return_value.st_mtime = 1000000  # Old timestamp
+        mock_file_path.stat.return_value.st_size = 1024  # File size
+        mocks["Path"].return_value = mock_file_path
+
+        # Mock datetime for comparison
+        mock_datetime = mocks["datetime"]
+        mock_datetime.utcnow.return_value = MagicMock()
+        mock_datetime.fromtimestamp.return_value = MagicMock()
+        # Make the comparison return True (old file)
+        mock_datetime.fromtimestamp.return_value.__lt__ = MagicMock(return_value=True)
+
+        result = cleanup_old_logs(days_to_keep=7)
+
+        assert result["status"] == "success"
+        assert result["files_cleaned"] == 3
+
+    def test_cleanup_old_logs_no_files(self, mocker: MockerFixture) -> None:
         """ログクリーンアップ（ファイルなし）テスト."""
+        mock_path = mocker.patch.object(scheduled_tasks, "Path")
+
         mock_path.return_value.glob.return_value = []
 
         result = cleanup_old_logs(days_to_keep=7)
@@ -261,28 +253,18 @@ class TestCleanupOldLogs:
 class TestGenerateStatsReport:
     """generate_stats_reportのテスト."""
 
-    @patch("refnet_shared.tasks.scheduled_tasks.db_manager")
-    @patch("builtins.open", create=True)
-    @patch("refnet_shared.tasks.scheduled_tasks.os.makedirs")
-    def test_generate_stats_report_success(self, mock_makedirs: MagicMock, mock_open: MagicMock, mock_db: MagicMock) -> None:
+    def test_generate_stats_report_success(self, mocker: MockerFixture, mock_db_session: MagicMock) -> None:
         """統計レポート生成成功テスト."""
-        mock_session = MagicMock()
-        mock_db.get_session.return_value.__enter__.return_value = mock_session
+        mock_open = mocker.patch.object(builtins, "open")
+        mocker.patch.object(scheduled_tasks.os, "makedirs")
 
-        # Mock query chains for different counts
-        mock_count_query = MagicMock()
-        mock_count_query.count.return_value = 100
-        mock_session.query.return_value = mock_count_query
-
-        mock_filter_query = MagicMock()
-        mock_filter_query.count.return_value = 50
-        mock_count_query.filter.return_value = mock_filter_query
+        configure_session(mock_db_session, count=100, filtered=50)
 
         # Mock year stats query
-        mock_session.query.return_value.group_by.return_value.all.return_value = [(2023, 50), (2024, 50)]
+        mock_db_session.query.return_value.group_by.return_value.all.return_value = [(2023, 50), (2024, 50)]
 
         # Mock file operations
-        mock_file = MagicMock()
+        mock_file = Mock(spec_set=["write"])
         mock_open.return_value.__enter__.return_value = mock_file
 
         result = generate_stats_report()
@@ -291,12 +273,35 @@ class TestGenerateStatsReport:
         assert "stats" in result
         assert "report_file" in result
 
-    @patch("refnet_shared.tasks.scheduled_tasks.db_manager")
-    def test_generate_stats_report_exception(self, mock_db: MagicMock) -> None:
-        """統計レポート生成例外テスト."""
-        mock_db.get_session.side_effect = Exception("Stats error")
 
-        result = generate_stats_report()
+class TestExceptionPaths:
+    """依存処理の例外をエラー結果として返すことのテスト."""
+
+    @pytest.mark.parametrize(
+        ("task", "setup_fixture", "target", "message"),
+        [
+            (database_maintenance, "mock_db_manager", "refnet_shared.tasks.scheduled_tasks.db_manager.get_session", DB_ERROR_MESSAGE),
+            (backup_database, "backup_mocks", "refnet_shared.tasks.scheduled_tasks.subprocess.run", BACKUP_ERROR_MESSAGE),
+            (generate_stats_report, "mock_db_manager", "refnet_shared.tasks.scheduled_tasks.db_manager.get_session", STATS_ERROR_MESSAGE),
+        ],
+        ids=["database_maintenance", "backup_database", "generate_stats_report"],
+    )
+    def test_task_exception(
+        self,
+        request: pytest.FixtureRequest,
+        monkeypatch: pytest.MonkeyPatch,
+        raising: Callable[[str], Any],
+        task: Any,
+        setup_fixture: str,
+        target: str,
+        message: str,
+    ) -> None:
+        """タスク実行時例外テスト."""
+        # 差し替え先のモックを用意してから、対象呼び出しを例外送出スタブへ置き換える
+        request.getfixturevalue(setup_fixture)
+        monkeypatch.setattr(target, raising(message))
+
+        result = task()
 
         assert result["status"] == "error"
-        assert "Stats error" in result["error"]
+        assert message in result["error"]
@@ -1,7 +1,12 @@
 """セキュリティ監査ログのテスト."""
 
+from collections.abc import Iterator
 from datetime import datetime
-from unittest.mock import patch
+from functools import cache
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
 
 from refnet_shared.security.audit_logger import (
     SecurityAuditEvent,
@@ -10,245 +15,191 @@ from refnet_shared.security.audit_logger import (
     security_audit_logger,
 )
 
+FIXED_TIMESTAMP = datetime(2024, 1, 1, 0, 0, 0)
+
+# (メソッド名, 引数, 期待イベント種別, 期待属性)
+LOG_METHOD_CASES = [
+    (
+        "log_authentication_success",
+        {"user_id": "test_user", "ip_address": "192.168.1.1", "user_agent": "Mozilla/5.0", "session_id": "test_session"},
+        SecurityEventType.AUTHENTICATION_SUCCESS,
+        {"risk_level": "low"},
+    ),
+    (
+        "log_authentication_failed",
+        {"user_id": "test_user", "ip_address": "192.168.1.1", "user_agent": "Mozilla/5.0", "reason": "invalid_password"},
+        SecurityEventType.AUTHENTICATION_FAILED,
+        {"risk_level": "medium", "details": {"reason": "invalid_password"}},
+    ),
+    (
+        "log_authorization_failed",
+        {
+            "user_id": "test_user",
+            "ip_address": "192.168.1.1",
+            "endpoint": "/api/admin",
+            "action": "delete",
+            "resource": "users",
+            "reason": "insufficient_permissions",
+        },
+        SecurityEventType.AUTHORIZATION_FAILED,
+        {"risk_level": "high"},
+    ),
+    (
+        "log_rate_limit_exceeded",
+        {
+            "user_id": "test_user",
+            "ip_address": "192.168.1.1",
+            "endpoint": "/api/papers",
+            "limit_type": "burst",
+            "current_requests": 101,
+            "limit": 100,
+        },
+        SecurityEventType.RATE_LIMIT_EXCEEDED,
+        {"risk_level": "medium"},
+    ),
+    (
+        "log_suspicious_activity",
+        {
+            "user_id": "test_user",
+            "ip_address": "192.168.1.1",
+            "activity_type": "sql_injection_attempt",
+            "details": {"query": "SELECT * FROM users WHERE 1=1"},
+        },
+        SecurityEventType.SUSPICIOUS_ACTIVITY,
+        {"risk_level": "high"},
+    ),
+    (
+        "log_admin_action",
+        {
+            "user_id": "admin_user",
+            "ip_address": "192.168.1.1",
+            "action": "delete_user",
+            "resource": "user:12345",
+            "details": {"reason": "policy_violation"},
+        },
+        SecurityEventType.ADMIN_ACTION,
+        {"risk_level": "medium"},
+    ),
+    (
+        "log_flower_access",
+        {"user_id": "test_user", "ip_address": "192.168.1.1", "path": "/flower/tasks", "success": True, "details": {"method": "GET"}},
+        SecurityEventType.FLOWER_ACCESS,
+        {"result": "success"},
+    ),
+]
+
+
+@cache
+def make_event(event_type: SecurityEventType, risk_level: str, result: str = "success") -> SecurityAuditEvent:
+    """テスト用監査イベントを生成（同一引数ではバリデーション済みインスタンスを再利用）."""
+    return SecurityAuditEvent(
+        event_type=event_type,
+        timestamp=FIXED_TIMESTAMP,
+        user_id="test_user",
+        ip_address="192.168.1.1",
+        result=result,
+        risk_level=risk_level,
+    )
+
+
+@pytest.fixture(scope="module")
+def shared_logger() -> SecurityAuditLogger:
+    """モジュール内で共有するSecurityAuditLogger."""
+    return SecurityAuditLogger()
+
 
 class TestSecurityAuditLogger:
     """SecurityAuditLoggerのテスト."""
 
-    def test_log_event_critical(self) -> None:
-        """criticalレベルのイベントログ記録テスト."""
-        logger = SecurityAuditLogger()
-        with patch.object(logger.logger, "critical") as mock_critical:
-            event = SecurityAuditEvent(
-                event_type=SecurityEventType.SUSPICIOUS_ACTIVITY,
-                timestamp=datetime.now(),
-                user_id="test_user",
-                ip_address="192.168.1.1",
-                result="detected",
-                risk_level="critical",
-            )
-            logger.log_event(event)
-            mock_critical.assert_called_once()
-
-    def test_log_event_high(self) -> None:
-        """highレベルのイベントログ記録テスト."""
-        logger = SecurityAuditLogger()
-        with patch.object(logger.logger, "error") as mock_error:
-            event = SecurityAuditEvent(
-                event_type=SecurityEventType.AUTHORIZATION_FAILED,
-                timestamp=datetime.now(),
-                user_id="test_user",
-                ip_address="192.168.1.1",
-                result="failed",
-                risk_level="high",
-            )
-            logger.log_event(event)
-            mock_error.assert_called_once()
-
-    def test_log_event_medium(self) -> None:
-        """mediumレベルのイベントログ記録テスト."""
-        logger = SecurityAuditLogger()
-        with patch.object(logger.logger, "warning") as mock_warning:
-            event = SecurityAuditEvent(
-                event_type=SecurityEventType.RATE_LIMIT_EXCEEDED,
-                timestamp=datetime.now(),
-                user_id="test_user",
-                ip_address="192.168.1.1",
-                result="blocked",
-                risk_level="medium",
-            )
-            logger.log_event(event)
-            mock_warning.assert_called_once()
-
-    def test_log_event_low(self) -> None:
-        """lowレベルのイベントログ記録テスト."""
-        logger = SecurityAuditLogger()
-        with patch.object(logger.logger, "info") as mock_info:
-            event = SecurityAuditEvent(
-                event_type=SecurityEventType.AUTHENTICATION_SUCCESS,
-                timestamp=datetime.now(),
-                user_id="test_user",
-                ip_address="192.168.1.1",
-                result="success",
-                risk_level="low",
-            )
-            logger.log_event(event)
-            mock_info.assert_called_once()
-
-    def test_log_authentication_success(self) -> None:
-        """認証成功ログ記録テスト."""
-        with patch.object(security_audit_logger, "log_event") as mock_log:
-            security_audit_logger.log_authentication_success(
-                user_id="test_user",
-                ip_address="192.168.1.1",
-                user_agent="Mozilla/5.0",
-                session_id="test_session",
-            )
-            mock_log.assert_called_once()
-            event = mock_log.call_args[0][0]
-            assert event.event_type == SecurityEventType.AUTHENTICATION_SUCCESS
-            assert event.risk_level == "low"
-
-    def test_log_authentication_failed(self) -> None:
-        """認証失敗ログ記録テスト."""
-        with patch.object(security_audit_logger, "log_event") as mock_log:
-            security_audit_logger.log_authentication_failed(
-                user_id="test_user",
-                ip_address="192.168.1.1",
-                user_agent="Mozilla/5.0",
-                reason="invalid_password",
-            )
-            mock_log.assert_called_once()
-            event = mock_log.call_args[0][0]
-            assert event.event_type == SecurityEventType.AUTHENTICATION_FAILED
-            assert event.risk_level == "medium"
-            assert event.details == {"reason": "invalid_password"}
-
-    def test_log_authorization_failed(self) -> None:
-        """認可失敗ログ記録テスト."""
-        with patch.object(security_audit_logger, "log_event") as mock_log:
-            security_audit_logger.log_authorization_failed(
-                user_id="test_user",
-                ip_address="192.168.1.1",
-                endpoint="/api/admin",
-                action="delete",
-                resource="users",
-                reason="insufficient_permissions",
-            )
-            mock_log.assert_called_once()
-            event = mock_log.call_args[0][0]
-            assert event.event_type == SecurityEventType.AUTHORIZATION_FAILED
-            assert event.risk_level == "high"
-
-    def test_log_rate_limit_exceeded(self) -> None:
-        """レート制限超過ログ記録テスト."""
-        with patch.object(security_audit_logger, "log_event") as mock_log:
-            security_audit_logger.log_rate_limit_exceeded(
-                user_id="test_user",
-                ip_address="192.168.1.1",
-                endpoint="/api/papers",
-                limit_type="burst",
-                current_requests=101,
-                limit=100,
-            )
-            mock_log.assert_called_once()
-            event = mock_log.call_args[0][0]
-            assert event.event_type == SecurityEventType.RATE_LIMIT_EXCEEDED
-            assert event.risk_level == "medium"
-
-    def test_log_suspicious_activity(self) -> None:
-        """疑わしい活動ログ記録テスト."""
-        with patch.object(security_audit_logger, "log_event") as mock_log:
-            security_audit_logger.log_suspicious_activity(
-                user_id="test_user",
-                ip_address="192.168.1.1",
-                activity_type="sql_injection_attempt",
-                details={"query": "SELECT * FROM users WHERE 1=1"},
-            )
-            mock_log.assert_called_once()
-            event = mock_log.call_args[0][0]
-            assert event.event_type == SecurityEventType.SUSPICIOUS_ACTIVITY
-            assert event.risk_level == "high"
-
-    def test_log_admin_action(self) -> None:
-        """管理者アクションログ記録テスト."""
-        with patch.object(security_audit_logger, "log_event") as mock_log:
-            security_audit_logger.log_admin_action(
-                user_id="admin_user",
-                ip_address="192.168.1.1",
-                action="delete_user",
-                resource="user:12345",
-                details={"reason": "policy_violation"},
-            )
-            mock_log.assert_called_once()
-            event = mock_log.call_args[0][0]
-            assert event.event_type == SecurityEventType.ADMIN_ACTION
-            assert event.risk_level == "medium"
-
-    def test_log_flower_access(self) -> None:
-        """Flowerアクセスログ記録テスト."""
+    @pytest.fixture(autouse=True)
+    def mock_log_event(self) -> Iterator[MagicMock]:
+        """共有インスタンスsecurity_audit_loggerのlog_eventをモックへ差し替え."""
         with patch.object(security_audit_logger, "log_event") as mock_log:
-            security_audit_logger.log_flower_access(
-                user_id="test_user",
-                ip_address="192.168.1.1",
-                path="/flower/tasks",
-                success=True,
-                details={"method": "GET"},
-            )
+            yield mock_log
+
+    @pytest.mark.parametrize(
+        ("event_type", "result", "risk_level", "log_method"),
+        [
+            (SecurityEventType.SUSPICIOUS_ACTIVITY, "detected", "critical", "critical"),
+            (SecurityEventType.AUTHORIZATION_FAILED, "failed", "high", "error"),
+            (SecurityEventType.RATE_LIMIT_EXCEEDED, "blocked", "medium", "warning"),
+            (SecurityEventType.AUTHENTICATION_SUCCESS, "success", "low", "info"),
+            (SecurityEventType.API_ACCESS, "success", "unknown", "info"),  # 未知レベルはinfo
+        ],
+        ids=["critical", "high", "medium", "low", "unknown"],
+    )
+    def test_log_event_levels(
+        self, shared_logger: SecurityAuditLogger, event_type: SecurityEventType, result: str, risk_level: str, log_method: str
+    ) -> None:
+        """リスクレベルごとのログレベル振り分けテスト."""
+        with patch.object(shared_logger.logger, log_method) as mock_log:
+            shared_logger.log_event(make_event(event_type, risk_level, result))
             mock_log.assert_called_once()
-            event = mock_log.call_args[0][0]
-            assert event.event_type == SecurityEventType.FLOWER_ACCESS
-            assert event.result == "success"
 
-    def test_log_api_access(self) -> None:
+    @pytest.mark.parametrize(
+        ("method", "kwargs", "expected_event_type", "expected_attrs"),
+        LOG_METHOD_CASES,
+        ids=[case[0].removeprefix("log_") for case in LOG_METHOD_CASES],
+    )
+    def test_log_methods(
+        self, mock_log_event: MagicMock, method: str, kwargs: dict[str, Any], expected_event_type: SecurityEventType, expected_attrs: dict[str, Any]
+    ) -> None:
+        """log_*メソッドのイベント種別・リスクレベル対応テスト."""
+        getattr(security_audit_logger, method)(**kwargs)
+
+        mock_log_event.assert_called_once()
+        event = mock_log_event.call_args[0][0]
+        assert event.event_type == expected_event_type
+        assert {name: getattr(event, name) for name in expected_attrs} == expected_attrs
+
+    def test_log_api_access(self, mock_log_event: MagicMock) -> None:
         """APIアクセスログ記録テスト."""
-        with patch.object(security_audit_logger, "log_event") as mock_log:
-            security_audit_logger.log_api_access(
-                user_id="test_user",
-                ip_address="192.168.1.1",
-                method="POST",
-                endpoint="/api/papers",
-                status_code=201,
-                response_time=0.123,
-                details={"paper_id": "12345"},
-            )
-            mock_log.assert_called_once()
-            event = mock_log.call_args[0][0]
-            assert event.event_type == SecurityEventType.API_ACCESS
-            assert event.result == "success"
-            assert event.risk_level == "low"
-
-    def test_log_api_access_error_status(self) -> None:
+        security_audit_logger.log_api_access(
+            user_id="test_user",
+            ip_address="192.168.1.1",
+            method="POST",
+            endpoint="/api/papers",
+            status_code=201,
+            response_time=0.123,
+            details={"paper_id": "12345"},
+        )
+        mock_log_event.assert_called_once()
+        event = mock_log_event.call_args[0][0]
+        assert event.event_type == SecurityEventType.API_ACCESS
+        assert event.result == "success"
+        assert event.risk_level == "low"
+
+    @pytest.mark.parametrize(
+        ("endpoint", "status_code", "expected_risk"),
+        [
+            ("/api/papers/invalid", 404, "medium"),  # 4xx エラー
+            ("/api/papers", 500, "high"),  # 5xx エラー
+        ],
+        ids=["4xx", "5xx"],
+    )
+    def test_log_api_access_error_status(self, mock_log_event: MagicMock, endpoint: str, status_code: int, expected_risk: str) -> None:
         """APIアクセスエラーステータスログ記録テスト."""
-        with patch.object(security_audit_logger, "log_event") as mock_log:
-            # 4xx エラー
-            security_audit_logger.log_api_access(
-                user_id=None,
-                ip_address="192.168.1.1",
-                method="GET",
-                endpoint="/api/papers/invalid",
-                status_code=404,
-            )
-            event = mock_log.call_args[0][0]
-            assert event.risk_level == "medium"
-
-            # 5xx エラー
-            security_audit_logger.log_api_access(
-                user_id=None,
-                ip_address="192.168.1.1",
-                method="GET",
-                endpoint="/api/papers",
-                status_code=500,
-            )
-            event = mock_log.call_args[0][0]
-            assert event.risk_level == "high"
-
-    def test_log_event_unknown_risk_level(self) -> None:
-        """未知リスクレベルのイベントログ記録テスト."""
-        logger = SecurityAuditLogger()
-        with patch.object(logger.logger, "info") as mock_info:
-            event = SecurityAuditEvent(
-                event_type=SecurityEventType.API_ACCESS,
-                timestamp=datetime.now(),
-                user_id="test_user",
-                ip_address="192.168.1.1",
-                result="success",
-                risk_level="unknown",  # 未知レベル
-            )
-            logger.log_event(event)
-            mock_info.assert_called_once()  # デフォルトはinfoレベル
-
-    def test_log_flower_access_failure(self) -> None:
+        security_audit_logger.log_api_access(
+            user_id=None,
+            ip_address="192.168.1.1",
+            method="GET",
+            endpoint=endpoint,
+            status_code=status_code,
+        )
+        event = mock_log_event.call_args[0][0]
+        assert event.risk_level == expected_risk
+
+    def test_log_flower_access_failure(self, mock_log_event: MagicMock) -> None:
         """Flowerアクセス失敗ログ記録テスト."""
-        with patch.object(security_audit_logger, "log_event") as mock_log:
-            security_audit_logger.log_flower_access(
-                user_id="test_user",
-                ip_address="192.168.1.1",
-                path="/flower/admin",
-                success=False,  # 失敗
-                details={"method": "POST"},
-            )
-            mock_log.assert_called_once()
-            event = mock_log.call_args[0][0]
-            assert event.event_type == SecurityEventType.FLOWER_ACCESS
-            assert event.result == "failed"
-            assert event.risk_level == "medium"  # 失敗時はリスクレベルがmedium
+        security_audit_logger.log_flower_access(
+            user_id="test_user",
+            ip_address="192.168.1.1",
+            path="/flower/admin",
+            success=False,  # 失敗
+            details={"method": "POST"},
+        )
+        mock_log_event.assert_called_once()
+        event = mock_log_event.call_args[0][0]
+        assert event.event_type == SecurityEventType.FLOWER_ACCESS
+        assert event.result == "failed"
+        assert event.risk_level == "medium"  # 失敗時はリスクレベルがmedium
@@ -70,6 +70,10 @@ def test_setup_logging_json_format(monkeypatch):
             processor_names = [proc.__class__.__name__ for proc in processors]
             assert "JSONRenderer" in processor_names
 
+            # orjsonでシリアライズし、標準logging向けにstrで返すことを確認
+            rendered = processors[-1](None, "info", {"event": "test", "count": 1})
+            assert rendered == '{"event":"test","count":1}'
+
 
 def test_setup_logging_console_format(monkeypatch):
     """ロギング設定テスト（コンソール形式）."""
@@ -1,24 +1,213 @@
 """AI APIクライアント."""
 
+import asyncio
+import os
+import re
 import subprocess
-import tempfile
 from abc import ABC, abstractmethod
-from pathlib import Path
+from collections.abc import Iterable
+from itertools import islice
+from typing import Any
 
 import anthropic
 import openai
+import orjson
 import structlog
-from refnet_shared.config.environment import load_environment_settings
+from anthropic.types import (
+    CacheControlEphemeralParam,
+    TextBlockParam,
+    ToolChoiceToolParam,
+    ToolParam,
+)
+from refnet_shared.config.environment import get_environment_settings
 from refnet_shared.exceptions import ExternalAPIError
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential,
+    wait_exponential_jitter,
+)
+
+from refnet_summarizer.clients.cache import aclose_response_cache, cached_response
+from refnet_summarizer.clients.limiter import ai_limiter
 
 logger = structlog.get_logger(__name__)
-settings = load_environment_settings()
+
+# システムプロンプト（プロバイダー側のプロンプトキャッシュが効くよう可変部分を含めない）
+SUMMARY_SYSTEM_PROMPT = (
+    "あなたは論文要約の専門家です。以下の論文テキストを読んで、"
+    "研究内容、手法、結果、意義を含む簡潔で有用な要約を作成してください。"
+    "要約は日本語で記述し、専門用語は適切に説明してください。"
+)
+KEYWORDS_SYSTEM_PROMPT = (
+    "あなたは論文のキーワード抽出の専門家です。論文テキストから重要なキーワードを抽出してください。"
+    "技術用語、手法名、概念名を優先し、"
+    '結果は {"keywords": ["キーワード", ...]} 形式のJSONで返してください。'
+)
+SUMMARY_KEYWORDS_SYSTEM_PROMPT = (
+    SUMMARY_SYSTEM_PROMPT
+    + "あわせて技術用語、手法名、概念名を優先して重要なキーワードを抽出してください。"
+    + '結果は {"summary": "要約", "keywords": ["キーワード", ...]} 形式のJSONで返してください。'
+)
+
+# プロンプトのバージョン（プロンプトを変更したら更新し、キャッシュ済みの古い応答を使わない）
+PROMPT_VERSION = "1"
+
+# ストリーミング要約の受信完了までの上限（秒）
+SUMMARY_TIMEOUT_SECONDS = 120.0
+
+# AIへ渡す論文テキストの上限文字数（各クライアントのプロンプトで使う最大長）
+MAX_INPUT_CHARS = 100_000
+
+
+# キーワード区切り（全角読点も許容し、前後の空白もあわせて除去）
+_KW_SPLIT = re.compile(r"\s*[,、]\s*")
+
+# Anthropicでキーワードを構造化出力させるツール定義
+_KEYWORDS_TOOL_NAME = "emit_keywords"
+_KEYWORDS_TOOL: ToolParam = {
+    "name": _KEYWORDS_TOOL_NAME,
+    "description": "論文から抽出したキーワードを返す",
+    "input_schema": {
+        "type": "object",
+        "properties": {"keywords": {"type": "array", "items": {"type": "string"}}},
+        "required": ["keywords"],
+    },
+}
+
+
+def _clean_keywords(candidates: Iterable[Any], max_keywords: int) -> list[str]:
+    """キーワード候補の前後空白と1文字以下の語を除き、最大件数まで返す."""
+    stripped = (str(kw).strip() for kw in candidates)
+    return list(islice((kw for kw in stripped if len(kw) > 1), max_keywords))
+
+
+def _split_keywords(keywords_text: str, max_keywords: int) -> list[str]:
+    """カンマ区切りのキーワード文字列を分割."""
+    return _clean_keywords(_KW_SPLIT.split(keywords_text.strip()), max_keywords)
+
+
+def _parse_keywords_json(content: str, max_keywords: int) -> list[str]:
+    """{"keywords": [...]} 形式のJSON応答からキーワードを取得（不正な応答は空リスト）."""
+    result = orjson.loads(content)
+    raw_keywords = result.get("keywords") if isinstance(result, dict) else None
+    if not isinstance(raw_keywords, list):
+        return []
+    return _clean_keywords(raw_keywords, max_keywords)
+
+
+def _cached_system_prompt(prompt: str) -> list[TextBlockParam]:
+    """Anthropicのプロンプトキャッシュ対象としてシステムプロンプトを指定."""
+    return [
+        TextBlockParam(
+            type="text",
+            text=prompt,
+            cache_control=CacheControlEphemeralParam(type="ephemeral"),
+        )
+    ]
+
+
+# 再試行対象のエラー（レート制限・接続エラー・サーバーエラー）
+_RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    anthropic.RateLimitError,
+    anthropic.APIConnectionError,
+    anthropic.InternalServerError,
+)
+_MAX_RETRY_AFTER = 60.0
+_backoff_with_jitter = wait_exponential_jitter(initial=1, max=30, jitter=0.5)
+
+
+def _unwrap_api_error(exc: BaseException) -> BaseException:
+    """ExternalAPIErrorに包まれた場合のみ元のSDKエラーを取り出す.
+
+    SDKのAPIConnectionErrorなどはhttpxの例外を原因に持つため、それ以外は原因を辿らない。
+    """
+    if isinstance(exc, ExternalAPIError):
+        cause: BaseException | None = exc.__cause__
+        if cause is not None:
+            return cause
+    return exc
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """SDKのエラー（ExternalAPIErrorに包まれたものを含む）が再試行対象か判定."""
+    return isinstance(_unwrap_api_error(exc), _RETRYABLE_ERRORS)
+
+
+def _wait_retry_after(retry_state: RetryCallState) -> float:
+    """Retry-Afterヘッダーを優先し、なければジッター付き指数バックオフで待機."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    response = getattr(exc and _unwrap_api_error(exc), "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if isinstance(retry_after, str):
+        try:
+            return min(max(float(retry_after), 0.0), _MAX_RETRY_AFTER)
+        except ValueError:
+            pass  # HTTP日付形式は扱わずバックオフへ
+    return float(_backoff_with_jitter(retry_state))
+
+
+_api_retry = retry(
+    wait=_wait_retry_after,
+    stop=stop_after_attempt(5),
+    retry=retry_if_exception(_is_retryable),
+    reraise=True,
+)
+
+# コマンドごとのClaude Code CLI検出結果（Noneは利用可能、文字列は利用不可の理由）
+_claude_availability: dict[str, str | None] = {}
+
+# APIキーごとに共有するクライアント（HTTP接続プールを再利用）
+_openai_clients: dict[str | None, openai.AsyncOpenAI] = {}
+_anthropic_clients: dict[str | None, anthropic.AsyncAnthropic] = {}
+
+
+def get_openai_client(api_key: str | None) -> openai.AsyncOpenAI:
+    """共有OpenAIクライアントを取得（HTTP/2で同時リクエストを1接続に多重化）."""
+    if api_key not in _openai_clients:
+        _openai_clients[api_key] = openai.AsyncOpenAI(
+            api_key=api_key, http_client=openai.DefaultAsyncHttpxClient(http2=True)
+        )
+    return _openai_clients[api_key]
+
+
+def get_anthropic_client(api_key: str | None) -> anthropic.AsyncAnthropic:
+    """共有Anthropicクライアントを取得（HTTP/2で同時リクエストを1接続に多重化）."""
+    if api_key not in _anthropic_clients:
+        _anthropic_clients[api_key] = anthropic.AsyncAnthropic(
+            api_key=api_key, http_client=anthropic.DefaultAsyncHttpxClient(http2=True)
+        )
+    return _anthropic_clients[api_key]
+
+
+async def aclose_shared_clients() -> None:
+    """共有クライアント・キャッシュ接続のクリーンアップ.
+
+    接続はイベントループに紐づくため、asyncio.run の終了前に呼び出す。
+    """
+    clients: list[openai.AsyncOpenAI | anthropic.AsyncAnthropic] = [
+        *_openai_clients.values(),
+        *_anthropic_clients.values(),
+    ]
+    _openai_clients.clear()
+    _anthropic_clients.clear()
+    for client in clients:
+        await client.close()
+    await aclose_response_cache()
 
 
 class AIClient(ABC):
     """AI APIクライアントの基底クラス."""
 
+    # 使用するモデル名（応答キャッシュのキーにも含める）
+    model: str
+    prompt_version: str = PROMPT_VERSION
+
     @abstractmethod
     async def generate_summary(self, text: str, max_tokens: int = 500) -> str:
         """要約生成."""
@@ -29,33 +218,42 @@ class AIClient(ABC):
         """キーワード抽出."""
         pass
 
+    async def summarize_and_extract(
+        self, text: str, max_tokens: int = 500, max_keywords: int = 10
+    ) -> tuple[str, list[str]]:
+        """要約生成とキーワード抽出（並行実行）.
+
+        キーワード抽出が失敗しても要約は破棄せず、キーワードを空として返す。
+        """
+        summary, keywords = await asyncio.gather(
+            self.generate_summary(text, max_tokens=max_tokens),
+            self.extract_keywords(text, max_keywords=max_keywords),
+            return_exceptions=True,
+        )
+        if isinstance(summary, BaseException):
+            raise summary
+        if isinstance(keywords, BaseException):
+            logger.warning("Keyword extraction failed", error=str(keywords))
+            keywords = []
+        return summary, keywords
+
 
 class OpenAIClient(AIClient):
     """OpenAI APIクライアント."""
 
+    model = "gpt-4o-mini"
+
     def __init__(self, api_key: str | None = None) -> None:
         """初期化."""
-        self.client = openai.AsyncOpenAI(api_key=api_key or settings.openai_api_key)
+        self.client = get_openai_client(api_key or get_environment_settings().openai_api_key)
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        reraise=True,
-    )
-    async def generate_summary(self, text: str, max_tokens: int = 500) -> str:
-        """要約生成."""
-        try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4o-mini",
+    async def _stream_summary(self, text: str, max_tokens: int) -> str:
+        """要約をストリーミングで受信して連結."""
+        async with ai_limiter:
+            stream = await self.client.chat.completions.create(
+                model=self.model,
                 messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "あなたは論文要約の専門家です。以下の論文テキストを読んで、"
-                            "研究内容、手法、結果、意義を含む簡潔で有用な要約を作成してください。"
-                            "要約は日本語で記述し、専門用語は適切に説明してください。"
-                        ),
-                    },
+                    {"role": "system", "content": SUMMARY_SYSTEM_PROMPT},
                     {
                         "role": "user",
                         "content": (
@@ -66,20 +264,38 @@ class OpenAIClient(AIClient):
                 ],
                 max_tokens=max_tokens,
                 temperature=0.3,
+                stream=True,
+            )
+            parts: list[str] = []
+            # タイムアウトやキャンセル時も応答を閉じ、接続をプールへ返す
+            async with stream:
+                async for chunk in stream:
+                    delta = chunk.choices[0].delta.content if chunk.choices else None
+                    if delta:
+                        parts.append(delta)
+        return "".join(parts)
+
+    @cached_response("summary")
+    @_api_retry
+    async def generate_summary(self, text: str, max_tokens: int = 500) -> str:
+        """要約生成."""
+        try:
+            summary = await asyncio.wait_for(
+                self._stream_summary(text, max_tokens), timeout=SUMMARY_TIMEOUT_SECONDS
             )
-
-            summary = response.choices[0].message.content
             if not summary:
                 raise ExternalAPIError("Empty response from OpenAI")
-            summary = str(summary)  # Ensure type is str
 
             logger.info(
                 "Summary generated successfully",
                 model="gpt-4o-mini",
-                tokens=len(summary.split()),
+                tokens=summary.count(" ") + 1,
             )
             return summary.strip()
 
+        except TimeoutError as e:
+            logger.error("OpenAI summary generation timed out", timeout=SUMMARY_TIMEOUT_SECONDS)
+            raise ExternalAPIError("OpenAI summary generation timed out") from e
         except openai.RateLimitError as e:
             logger.warning("OpenAI rate limit exceeded")
             raise ExternalAPIError("Rate limit exceeded") from e
@@ -90,39 +306,37 @@ class OpenAIClient(AIClient):
             logger.error("Unexpected error with OpenAI", error=str(e))
             raise ExternalAPIError(f"Unexpected error: {str(e)}") from e
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        reraise=True,
-    )
-    async def extract_keywords(self, text: str, max_keywords: int = 10) -> list[str]:
-        """キーワード抽出."""
-        try:
+    @_api_retry
+    async def _request_keywords(self, text: str, max_keywords: int) -> str | None:
+        """キーワード抽出リクエスト（一時的なエラーのみ再試行）."""
+        async with ai_limiter:
             response = await self.client.chat.completions.create(
-                model="gpt-4o-mini",
+                model=self.model,
                 messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            f"以下の論文テキストから重要なキーワードを{max_keywords}個抽出してください。"
-                            "技術用語、手法名、概念名を優先し、カンマ区切りで返してください。"
-                        ),
-                    },
+                    {"role": "system", "content": KEYWORDS_SYSTEM_PROMPT},
                     {
                         "role": "user",
-                        "content": text[:4000],  # APIの制限を考慮
+                        "content": (
+                            f"重要なキーワードを{max_keywords}個抽出してください:\n\n"
+                            f"{text[:4000]}"
+                        ),  # APIの制限を考慮
                     },
                 ],
                 max_tokens=200,
                 temperature=0.1,
+                response_format={"type": "json_object"},
             )
+        return response.choices[0].message.content
 
-            keywords_text = response.choices[0].message.content
+    @cached_response("keywords")
+    async def extract_keywords(self, text: str, max_keywords: int = 10) -> list[str]:
+        """キーワード抽出."""
+        try:
+            keywords_text = await self._request_keywords(text, max_keywords)
             if not keywords_text:
                 return []
 
-            keywords = [kw.strip() for kw in keywords_text.split(",")]
-            keywords = [kw for kw in keywords if kw and len(kw) > 1][:max_keywords]
+            keywords = _parse_keywords_json(keywords_text, max_keywords)
 
             logger.info("Keywords extracted successfully", count=len(keywords))
             return keywords
@@ -131,53 +345,207 @@ class OpenAIClient(AIClient):
             logger.error("Failed to extract keywords with OpenAI", error=str(e))
             return []
 
+    @classmethod
+    def _summary_keywords_body(
+        cls, text: str, max_tokens: int, max_keywords: int
+    ) -> dict[str, Any]:
+        """要約・キーワード一括取得のリクエストボディを作成."""
+        return {
+            "model": cls.model,
+            "messages": [
+                {"role": "system", "content": SUMMARY_KEYWORDS_SYSTEM_PROMPT},
+                {
+                    "role": "user",
+                    "content": (
+                        f"以下の論文テキストを要約し（最大{max_tokens}トークン）、"
+                        f"キーワードを{max_keywords}個抽出してください:\n\n{text[:8000]}"
+                    ),  # APIの制限を考慮
+                },
+            ],
+            "max_tokens": max_tokens + 200,  # キーワード分を上乗せ
+            "temperature": 0.3,
+            "response_format": {"type": "json_object"},
+        }
+
+    @staticmethod
+    def _parse_summary_keywords(
+        content: str | None, max_keywords: int
+    ) -> tuple[str, list[str]] | None:
+        """JSON応答から要約・キーワードを取得（不正な応答はNone）."""
+        try:
+            result = orjson.loads(content or "")
+        except orjson.JSONDecodeError:
+            return None
+
+        summary = result.get("summary") if isinstance(result, dict) else None
+        raw_keywords = result.get("keywords") if isinstance(result, dict) else None
+        if not isinstance(summary, str) or not summary.strip() or not isinstance(
+            raw_keywords, list
+        ):
+            return None
+
+        return summary.strip(), _clean_keywords(raw_keywords, max_keywords)
+
+    @cached_response("summary_keywords", decode=tuple)
+    @_api_retry
+    async def summarize_and_extract(
+        self, text: str, max_tokens: int = 500, max_keywords: int = 10
+    ) -> tuple[str, list[str]]:
+        """要約生成とキーワード抽出（1回のAPI呼び出しでJSON応答を取得）."""
+        try:
+            async with ai_limiter:
+                response = await self.client.chat.completions.create(
+                    **self._summary_keywords_body(text, max_tokens, max_keywords)
+                )
+
+        except openai.RateLimitError as e:
+            logger.warning("OpenAI rate limit exceeded")
+            raise ExternalAPIError("Rate limit exceeded") from e
+        except openai.APIError as e:
+            logger.error("OpenAI API error", error=str(e))
+            raise ExternalAPIError(f"OpenAI API error: {str(e)}") from e
+        except Exception as e:
+            logger.error("Unexpected error with OpenAI", error=str(e))
+            raise ExternalAPIError(f"Unexpected error: {str(e)}") from e
+
+        parsed = self._parse_summary_keywords(response.choices[0].message.content, max_keywords)
+        if parsed is None:
+            # JSON応答が不正な場合は個別リクエストへフォールバック
+            logger.warning("Invalid JSON response from OpenAI, falling back to separate requests")
+            return await super().summarize_and_extract(
+                text, max_tokens=max_tokens, max_keywords=max_keywords
+            )
+
+        summary, keywords = parsed
+        logger.info(
+            "Summary and keywords generated successfully",
+            model="gpt-4o-mini",
+            tokens=summary.count(" ") + 1,
+            count=len(keywords),
+        )
+        return summary, keywords
+
+    def build_batch_request(
+        self, custom_id: str, text: str, max_tokens: int = 500, max_keywords: int = 10
+    ) -> dict[str, Any]:
+        """Batch API用の要約・キーワード一括取得リクエストを作成."""
+        return {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": self._summary_keywords_body(text, max_tokens, max_keywords),
+        }
+
+    async def run_batch(
+        self,
+        requests: list[dict[str, Any]],
+        max_keywords: int = 10,
+        poll_interval: float = 30.0,
+        max_poll_interval: float = 600.0,
+    ) -> dict[str, tuple[str, list[str]]]:
+        """Batch APIで一括実行し、custom_idごとの要約・キーワードを返す.
+
+        結果は最大24時間後に返るため、完了まで指数バックオフでポーリングする。
+        """
+        payload = b"\n".join(orjson.dumps(request) for request in requests)
+        try:
+            input_file = await self.client.files.create(
+                file=("summaries.jsonl", payload), purpose="batch"
+            )
+            batch = await self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+            logger.info("OpenAI batch submitted", batch_id=batch.id, count=len(requests))
+
+            interval = poll_interval
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                await asyncio.sleep(interval)
+                interval = min(interval * 2, max_poll_interval)
+                batch = await self.client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise ExternalAPIError(f"OpenAI batch {batch.id} ended with status {batch.status}")
+
+            output = await self.client.files.content(batch.output_file_id)
+
+        except openai.APIError as e:
+            logger.error("OpenAI batch API error", error=str(e))
+            raise ExternalAPIError(f"OpenAI batch API error: {str(e)}") from e
+
+        results: dict[str, tuple[str, list[str]]] = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            row = orjson.loads(line)
+            body = (row.get("response") or {}).get("body") or {}
+            choices = body.get("choices") or [{}]
+            content = (choices[0].get("message") or {}).get("content")
+            parsed = self._parse_summary_keywords(content, max_keywords)
+            if parsed is None:
+                logger.warning("Invalid batch result", custom_id=row.get("custom_id"))
+                continue
+            results[row["custom_id"]] = parsed
+
+        logger.info("OpenAI batch completed", batch_id=batch.id, succeeded=len(results))
+        return results
+
 
 class AnthropicClient(AIClient):
     """Anthropic APIクライアント."""
 
+    model = "claude-3-5-haiku-20241022"
+
     def __init__(self, api_key: str | None = None) -> None:
         """初期化."""
-        self.client = anthropic.AsyncAnthropic(api_key=api_key or settings.anthropic_api_key)
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        reraise=True,
-    )
-    async def generate_summary(self, text: str, max_tokens: int = 500) -> str:
-        """要約生成."""
-        try:
-            response = await self.client.messages.create(
-                model="claude-3-5-haiku-20241022",
+        self.client = get_anthropic_client(
+            api_key or get_environment_settings().anthropic_api_key
+        )
+
+    async def _stream_summary(self, text: str, max_tokens: int) -> str:
+        """要約をストリーミングで受信して連結."""
+        async with ai_limiter:
+            async with self.client.messages.stream(
+                model=self.model,
                 max_tokens=max_tokens,
                 temperature=0.3,
+                system=_cached_system_prompt(SUMMARY_SYSTEM_PROMPT),
                 messages=[
                     {
                         "role": "user",
                         "content": (
-                            "以下の論文テキストを読んで、研究内容、手法、結果、意義を含む"
-                            f"簡潔で有用な要約を日本語で作成してください:\n\n{text[:100000]}"
+                            f"以下の論文テキストを要約してください:\n\n{text[:MAX_INPUT_CHARS]}"
                         ),
                     }
                 ],
-            )
+            ) as stream:
+                parts = [delta async for delta in stream.text_stream]
+        return "".join(parts)
 
-            # Anthropicのレスポンスから適切にテキストを取得
-            content_block = response.content[0]
-            if hasattr(content_block, 'text'):
-                summary = str(content_block.text)  # Ensure type is str
-            else:
-                raise ExternalAPIError("Invalid response format from Anthropic")
+    @cached_response("summary")
+    @_api_retry
+    async def generate_summary(self, text: str, max_tokens: int = 500) -> str:
+        """要約生成."""
+        try:
+            summary = await asyncio.wait_for(
+                self._stream_summary(text, max_tokens), timeout=SUMMARY_TIMEOUT_SECONDS
+            )
             if not summary:
                 raise ExternalAPIError("Empty response from Anthropic")
 
             logger.info(
                 "Summary generated successfully",
                 model="claude-3-5-haiku",
-                tokens=len(summary.split()),
+                tokens=summary.count(" ") + 1,
             )
             return summary.strip()
 
+        except TimeoutError as e:
+            logger.error(
+                "Anthropic summary generation timed out", timeout=SUMMARY_TIMEOUT_SECONDS
+            )
+            raise ExternalAPIError("Anthropic summary generation timed out") from e
         except anthropic.RateLimitError as e:
             logger.warning("Anthropic rate limit exceeded")
             raise ExternalAPIError("Rate limit exceeded") from e
@@ -188,40 +556,43 @@ class AnthropicClient(AIClient):
             logger.error("Unexpected error with Anthropic", error=str(e))
             raise ExternalAPIError(f"Unexpected error: {str(e)}") from e
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        reraise=True,
-    )
-    async def extract_keywords(self, text: str, max_keywords: int = 10) -> list[str]:
-        """キーワード抽出."""
-        try:
-            response = await self.client.messages.create(
-                model="claude-3-5-haiku-20241022",
+    @_api_retry
+    async def _request_keywords(self, text: str, max_keywords: int) -> Any:
+        """キーワード抽出リクエスト（一時的なエラーのみ再試行）."""
+        async with ai_limiter:
+            return await self.client.messages.create(
+                model=self.model,
                 max_tokens=200,
                 temperature=0.1,
+                system=_cached_system_prompt(KEYWORDS_SYSTEM_PROMPT),
                 messages=[
                     {
                         "role": "user",
                         "content": (
-                            f"以下の論文テキストから重要なキーワードを{max_keywords}個抽出してください。"
-                            f"技術用語、手法名、概念名を優先し、カンマ区切りで返してください:\n\n{text[:50000]}"
+                            f"重要なキーワードを{max_keywords}個抽出してください:\n\n"
+                            f"{text[:50000]}"
                         ),
                     }
                 ],
+                tools=[_KEYWORDS_TOOL],
+                tool_choice=ToolChoiceToolParam(type="tool", name=_KEYWORDS_TOOL_NAME),
             )
 
-            # Anthropicのレスポンスから適切にテキストを取得
-            content_block = response.content[0]
-            if hasattr(content_block, 'text'):
-                keywords_text = content_block.text
-            else:
-                keywords_text = ""
-            if not keywords_text:
+    @cached_response("keywords")
+    async def extract_keywords(self, text: str, max_keywords: int = 10) -> list[str]:
+        """キーワード抽出."""
+        try:
+            response = await self._request_keywords(text, max_keywords)
+
+            # ツール呼び出しの入力からキーワードを取得
+            tool_input = next(
+                (block.input for block in response.content if block.type == "tool_use"), None
+            )
+            raw_keywords = tool_input.get("keywords") if isinstance(tool_input, dict) else None
+            if not isinstance(raw_keywords, list):
                 return []
 
-            keywords = [kw.strip() for kw in keywords_text.split(",")]
-            keywords = [kw for kw in keywords if kw and len(kw) > 1][:max_keywords]
+            keywords = _clean_keywords(raw_keywords, max_keywords)
 
             logger.info("Keywords extracted successfully", count=len(keywords))
             return keywords
@@ -234,13 +605,26 @@ class AnthropicClient(AIClient):
 class ClaudeCodeClient(AIClient):
     """Claude Code CLIクライアント."""
 
+    model = "claude-code"
+
     def __init__(self, claude_command: str = "claude") -> None:
         """初期化."""
         self.claude_command = claude_command
+        # 同時に起動するCLIプロセス数をCPU数までに制限
+        self._semaphore = asyncio.Semaphore(os.cpu_count() or 1)
         self._check_claude_availability()
 
     def _check_claude_availability(self) -> None:
-        """Claude Codeの利用可能性チェック."""
+        """Claude Codeの利用可能性チェック（結果はコマンドごとにプロセス内でキャッシュ）."""
+        if self.claude_command not in _claude_availability:
+            _claude_availability[self.claude_command] = self._probe_claude()
+
+        error = _claude_availability[self.claude_command]
+        if error is not None:
+            raise ExternalAPIError(error)
+
+    def _probe_claude(self) -> str | None:
+        """Claude Code CLIのバージョン確認（利用できない場合はエラーメッセージを返す）."""
         try:
             result = subprocess.run(
                 [self.claude_command, "--version"],
@@ -248,11 +632,40 @@ class ClaudeCodeClient(AIClient):
                 text=True,
                 timeout=10,
             )
-            if result.returncode != 0:
-                raise ExternalAPIError("Claude Code CLI not available")
-            logger.info("Claude Code CLI detected", version=result.stdout.strip())
         except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-            raise ExternalAPIError(f"Claude Code CLI not found: {str(e)}") from e
+            return f"Claude Code CLI not found: {str(e)}"
+
+        if result.returncode != 0:
+            return "Claude Code CLI not available"
+        logger.info("Claude Code CLI detected", version=result.stdout.strip())
+        return None
+
+    async def _run_prompt(self, prompt: str, text: str, timeout: float) -> tuple[int, str, str]:
+        """論文テキストを標準入力で渡してClaude Codeを実行."""
+        async with self._semaphore:
+            process = await asyncio.create_subprocess_exec(
+                self.claude_command,
+                "-p",
+                prompt,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    process.communicate(text.encode()), timeout=timeout
+                )
+            except TimeoutError:
+                process.kill()
+                await process.wait()
+                raise
+
+        # CLI出力に不正なバイト列が含まれても結果を失わないよう置換してデコード
+        return (
+            process.returncode or 0,
+            stdout.decode("utf-8", "replace"),
+            stderr.decode("utf-8", "replace"),
+        )
 
     @retry(
         stop=stop_after_attempt(3),
@@ -262,46 +675,32 @@ class ClaudeCodeClient(AIClient):
     async def generate_summary(self, text: str, max_tokens: int = 500) -> str:
         """要約生成（Claude Code使用）."""
         try:
-            # 一時ファイルに論文テキストを保存
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as tmp:
-                tmp.write(text)
-                tmp_path = Path(tmp.name)
-
-            try:
-                # Claude Codeを使用して要約生成
-                prompt = (
-                    f"この論文テキストファイル({tmp_path.name})を読んで、"
-                    f"研究内容、手法、結果、意義を含む簡潔で有用な要約を"
-                    f"日本語で{max_tokens}文字以内で作成してください。"
-                )
-
-                result = subprocess.run(
-                    [self.claude_command, "-p", prompt, str(tmp_path)],
-                    capture_output=True,
-                    text=True,
-                    timeout=120,  # 2分のタイムアウト
-                )
+            prompt = (
+                "標準入力の論文テキストを読んで、"
+                "研究内容、手法、結果、意義を含む簡潔で有用な要約を"
+                f"日本語で{max_tokens}文字以内で作成してください。"
+            )
 
-                if result.returncode != 0:
-                    error_msg = result.stderr or "Unknown error"
-                    raise ExternalAPIError(f"Claude Code execution failed: {error_msg}")
+            returncode, stdout, stderr = await self._run_prompt(
+                prompt, text, timeout=120  # 2分のタイムアウト
+            )
 
-                summary = result.stdout.strip()
-                if not summary:
-                    raise ExternalAPIError("Empty response from Claude Code")
+            if returncode != 0:
+                error_msg = stderr or "Unknown error"
+                raise ExternalAPIError(f"Claude Code execution failed: {error_msg}")
 
-                logger.info(
-                    "Summary generated successfully",
-                    model="claude-code",
-                    length=len(summary),
-                )
-                return summary
+            summary = stdout.strip()
+            if not summary:
+                raise ExternalAPIError("Empty response from Claude Code")
 
-            finally:
-                # 一時ファイルを削除
-                tmp_path.unlink(missing_ok=True)
+            logger.info(
+                "Summary generated successfully",
+                model="claude-code",
+                length=len(summary),
+            )
+            return summary
 
-        except subprocess.TimeoutExpired as e:
+        except TimeoutError as e:
             logger.error("Claude Code timeout", error=str(e))
             raise ExternalAPIError("Claude Code request timeout") from e
         except Exception as e:
@@ -316,41 +715,26 @@ class ClaudeCodeClient(AIClient):
     async def extract_keywords(self, text: str, max_keywords: int = 10) -> list[str]:
         """キーワード抽出（Claude Code使用）."""
         try:
-            # 一時ファイルに論文テキストを保存
-            with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as tmp:
-                tmp.write(text)
-                tmp_path = Path(tmp.name)
-
-            try:
-                prompt = (
-                    f"この論文テキストファイル({tmp_path.name})から"
-                    f"重要なキーワードを{max_keywords}個抽出してください。"
-                    f"技術用語、手法名、概念名を優先し、カンマ区切りで返してください。"
-                )
-
-                result = subprocess.run(
-                    [self.claude_command, "-p", prompt, str(tmp_path)],
-                    capture_output=True,
-                    text=True,
-                    timeout=60,
-                )
+            prompt = (
+                "標準入力の論文テキストから"
+                f"重要なキーワードを{max_keywords}個抽出してください。"
+                "技術用語、手法名、概念名を優先し、カンマ区切りで返してください。"
+            )
 
-                if result.returncode != 0:
-                    logger.warning("Claude Code keyword extraction failed", error=result.stderr)
-                    return []
+            returncode, stdout, stderr = await self._run_prompt(prompt, text, timeout=60)
 
-                keywords_text = result.stdout.strip()
-                if not keywords_text:
-                    return []
+            if returncode != 0:
+                logger.warning("Claude Code keyword extraction failed", error=stderr)
+                return []
 
-                keywords = [kw.strip() for kw in keywords_text.split(",")]
-                keywords = [kw for kw in keywords if kw and len(kw) > 1][:max_keywords]
+            keywords_text = stdout.strip()
+            if not keywords_text:
+                return []
 
-                logger.info("Keywords extracted successfully", count=len(keywords))
-                return keywords
+            keywords = _split_keywords(keywords_text, max_keywords)
 
-            finally:
-                tmp_path.unlink(missing_ok=True)
+            logger.info("Keywords extracted successfully", count=len(keywords))
+            return keywords
 
         except Exception as e:
             logger.error("Failed to extract keywords with Claude Code", error=str(e))
@@ -359,6 +743,7 @@ class ClaudeCodeClient(AIClient):
 
 def create_ai_client() -> AIClient:
     """AI クライアントの作成."""
+    settings = get_environment_settings()
     # 環境変数での優先順位設定
     ai_provider = getattr(settings, "ai_provider", "auto").lower()
 
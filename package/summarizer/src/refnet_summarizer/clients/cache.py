@@ -0,0 +1,153 @@
+"""AI応答キャッシュ."""
+
+import functools
+import hashlib
+import inspect
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+import orjson
+import redis.asyncio as aioredis
+import structlog
+from refnet_shared.config.environment import get_environment_settings
+
+logger = structlog.get_logger(__name__)
+
+CACHE_KEY_PREFIX = "refnet:summarizer:ai"
+CACHE_TTL_SECONDS = 7 * 24 * 60 * 60  # 7日
+PDF_TEXT_KEY_PREFIX = "refnet:summarizer:pdf_text"
+PDF_TEXT_TTL_SECONDS = 30 * 24 * 60 * 60  # 30日
+# Redisの応答待ち上限（秒）。障害時もAI呼び出しを長く止めないよう短くする
+REDIS_SOCKET_TIMEOUT_SECONDS = 1.0
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+
+class ResponseCache:
+    """Redisを用いたAI応答キャッシュ.
+
+    キャッシュの読み書きに失敗してもAPI呼び出しは継続できるよう、例外は記録のみ行う。
+    """
+
+    def __init__(self, url: str | None = None, ttl: int = CACHE_TTL_SECONDS) -> None:
+        """初期化."""
+        self.url = url
+        self.ttl = ttl
+        self._client: aioredis.Redis | None = None
+
+    def _get_client(self) -> aioredis.Redis:
+        """Redisクライアントを取得（エラー後は破棄されているため作り直す）."""
+        if self._client is None:
+            url = self.url or get_environment_settings().redis.url
+            self._client = aioredis.Redis.from_url(
+                url,
+                decode_responses=True,
+                socket_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+                socket_connect_timeout=REDIS_SOCKET_TIMEOUT_SECONDS,
+            )
+        return self._client
+
+    async def get(self, key: str) -> Any | None:
+        """キャッシュ取得."""
+        try:
+            value = await self._get_client().get(key)
+        except Exception as e:
+            logger.warning("Failed to read AI response cache", error=str(e))
+            self._client = None
+            return None
+        return orjson.loads(value) if value is not None else None
+
+    async def set(self, key: str, value: Any) -> None:
+        """キャッシュ保存."""
+        try:
+            await self._get_client().set(key, orjson.dumps(value), ex=self.ttl)
+        except Exception as e:
+            logger.warning("Failed to write AI response cache", error=str(e))
+            self._client = None
+
+    async def aclose(self) -> None:
+        """接続のクリーンアップ."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+
+response_cache = ResponseCache()
+# PDFのSHA-256ハッシュをキーとした抽出済みテキストのキャッシュ
+pdf_text_cache = ResponseCache(ttl=PDF_TEXT_TTL_SECONDS)
+
+
+def build_cache_key(
+    client_name: str,
+    kind: str,
+    text: str,
+    params: dict[str, Any],
+    model: str | None = None,
+    prompt_version: str | None = None,
+) -> str:
+    """クライアント種別・処理種別・モデル・プロンプト版・パラメータ・本文からキャッシュキーを生成.
+
+    モデルやプロンプトを変更した場合は別のキーとなり、古い応答を返さない。
+    """
+    # 本文はJSONへ埋め込まずそのままハッシュへ渡し、長い論文テキストの複製を避ける
+    digest = hashlib.sha256(
+        orjson.dumps(
+            [client_name, kind, model, prompt_version, params], option=orjson.OPT_SORT_KEYS
+        )
+    )
+    digest.update(b"\0")
+    digest.update(text.encode())
+    return f"{CACHE_KEY_PREFIX}:{kind}:{digest.hexdigest()}"
+
+
+def build_pdf_text_key(pdf_hash: str) -> str:
+    """PDFのハッシュから抽出済みテキストのキャッシュキーを生成."""
+    return f"{PDF_TEXT_KEY_PREFIX}:{pdf_hash}"
+
+
+def cached_response(kind: str, decode: Callable[[Any], Any] | None = None) -> Callable[[F], F]:
+    """AIクライアントのメソッド結果をキャッシュするデコレーター.
+
+    空の結果（失敗時の空リストなど）はキャッシュしない。
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = {
+                name: value
+                for name, value in bound.arguments.items()
+                if name not in ("self", "text")
+            }
+            key = build_cache_key(
+                type(self).__name__,
+                kind,
+                bound.arguments["text"],
+                params,
+                model=getattr(self, "model", None),
+                prompt_version=getattr(self, "prompt_version", None),
+            )
+
+            cached = await response_cache.get(key)
+            if cached is not None:
+                logger.info("AI response cache hit", kind=kind, client=type(self).__name__)
+                return decode(cached) if decode else cached
+
+            result = await func(self, *args, **kwargs)
+            if result:
+                await response_cache.set(key, result)
+            return result
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+async def aclose_response_cache() -> None:
+    """共有キャッシュ接続のクリーンアップ."""
+    await response_cache.aclose()
+    await pdf_text_cache.aclose()
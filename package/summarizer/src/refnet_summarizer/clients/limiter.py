@@ -0,0 +1,89 @@
+"""AI API呼び出しの同時実行数制御."""
+
+import asyncio
+from types import TracebackType
+
+import anthropic
+import openai
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# 過負荷を示すエラー（レート制限・サーバーエラー）
+_OVERLOAD_ERRORS = (
+    openai.RateLimitError,
+    openai.InternalServerError,
+    anthropic.RateLimitError,
+    anthropic.InternalServerError,
+)
+
+
+class AIMDLimiter:
+    """AIMD方式で同時実行数を調整するリミッター.
+
+    成功時は上限を加算的に増やし、レート制限・サーバーエラー時は乗算的に減らす。
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        max_limit: int = 32,
+        increase: float = 0.5,
+        decrease_factor: float = 0.5,
+    ) -> None:
+        """初期化."""
+        self.limit = float(initial)
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.in_flight = 0
+        self._condition: asyncio.Condition | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_condition(self) -> asyncio.Condition:
+        """実行中のイベントループに紐づくConditionを取得."""
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            # asyncio.run ごとにループが変わるため作り直す
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self.in_flight = 0
+        return self._condition
+
+    def record_success(self) -> None:
+        """成功時に上限を加算的に増やす."""
+        self.limit = min(float(self.max_limit), self.limit + self.increase)
+
+    def record_error(self) -> None:
+        """過負荷時に上限を乗算的に減らす."""
+        self.limit = max(1.0, self.limit * self.decrease_factor)
+        logger.warning("AI API concurrency limit decreased", limit=int(self.limit))
+
+    async def __aenter__(self) -> "AIMDLimiter":
+        """実行枠を取得."""
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """結果に応じて上限を調整し、実行枠を解放."""
+        if exc is None:
+            self.record_success()
+        elif isinstance(exc, _OVERLOAD_ERRORS):
+            self.record_error()
+
+        condition = self._get_condition()
+        async with condition:
+            self.in_flight -= 1
+            condition.notify_all()
+
+
+# プロセス内のAI API呼び出しで共有するリミッター
+ai_limiter = AIMDLimiter()
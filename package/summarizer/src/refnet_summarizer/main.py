@@ -5,6 +5,8 @@ import sys
 
 import structlog
 
+from refnet_summarizer.clients.ai_client import aclose_shared_clients
+from refnet_summarizer.processors.pdf_processor import aclose_http_client
 from refnet_summarizer.services.summarizer_service import SummarizerService
 
 logger = structlog.get_logger(__name__)
@@ -18,6 +20,51 @@ async def summarize_paper(paper_id: str) -> bool:
         return result
     finally:
         await service.close()
+        await aclose_http_client()
+        await aclose_shared_clients()
+
+
+async def summarize_many(paper_ids: list[str], concurrency: int = 8) -> dict[str, bool]:
+    """複数論文の要約の実行（サービスを共有し、同時実行数を制限して並行処理）."""
+    service = SummarizerService()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _summarize_one(paper_id: str) -> bool:
+        async with semaphore:
+            return await service.summarize_paper(paper_id)
+
+    try:
+        results = await asyncio.gather(
+            *(_summarize_one(paper_id) for paper_id in paper_ids), return_exceptions=True
+        )
+    finally:
+        await service.close()
+        await aclose_http_client()
+        await aclose_shared_clients()
+
+    summary: dict[str, bool] = {}
+    for paper_id, result in zip(paper_ids, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.error("Failed to summarize paper", paper_id=paper_id, error=str(result))
+        summary[paper_id] = result is True
+    return summary
+
+
+def _read_paper_ids(path: str) -> list[str]:
+    """論文IDファイル（1行1件）の読み込み."""
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+async def summarize_batch(paper_ids: list[str]) -> dict[str, bool]:
+    """複数論文の一括要約の実行（バックフィル向け）."""
+    service = SummarizerService()
+    try:
+        return await service.summarize_papers_batch(paper_ids)
+    finally:
+        await service.close()
+        await aclose_http_client()
+        await aclose_shared_clients()
 
 
 def main() -> None:
@@ -26,6 +73,8 @@ def main() -> None:
         print("Usage: refnet-summarizer <command> [args...]")
         print("Commands:")
         print("  summarize <paper_id>  - Summarize a paper")
+        print("  summarize-many <paper_ids_file>  - Summarize papers listed in a file concurrently")
+        print("  summarize-batch <paper_ids_file>  - Summarize papers listed in a file (batch API)")
         sys.exit(1)
 
     command = sys.argv[1]
@@ -45,6 +94,18 @@ def main() -> None:
             print(f"Failed to summarize paper: {paper_id}")
             sys.exit(1)
 
+    elif command in ("summarize-many", "summarize-batch"):
+        if len(sys.argv) < 3:
+            print(f"Usage: refnet-summarizer {command} <paper_ids_file>")
+            sys.exit(1)
+
+        paper_ids = _read_paper_ids(sys.argv[2])
+        runner = summarize_many if command == "summarize-many" else summarize_batch
+        results = asyncio.run(runner(paper_ids))
+        succeeded = sum(results.values())
+        print(f"Summarized {succeeded}/{len(paper_ids)} papers")
+        sys.exit(0 if succeeded == len(paper_ids) else 1)
+
     else:
         print(f"Unknown command: {command}")
         sys.exit(1)
@@ -1,107 +1,234 @@
 """PDF処理モジュール."""
 
+import asyncio
 import hashlib
+import io
+import mmap
+import re
 import tempfile
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import IO
 
 import httpx
 import pdfplumber
+import pymupdf
 import pypdf
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# ダウンロードしたPDFをメモリに保持する上限（超えた分は一時ファイルへ退避）
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
 
-class PDFProcessor:
-    """PDF処理クラス."""
+# 改行を含む連続した空白
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# PDFコンテンツ（バイト列またはダウンロード済みファイル）
+PDFContent = bytes | IO[bytes]
+
+# ダウンロード結果（ファイル, SHA-256ハッシュ, サイズ）
+DownloadedPDF = tuple[tempfile.SpooledTemporaryFile[bytes], str, int]
+
+# テキスト抽出専用スレッド（PyMuPDFはスレッド間の同時利用に対応しないため1本に直列化）
+_extract_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pdf-extract")
+
+# プロセス内のPDFダウンロードで共有するHTTPクライアント（TCP/TLS接続を再利用）
+_http_client: httpx.AsyncClient | None = None
 
-    def __init__(self) -> None:
-        """初期化."""
-        self.client = httpx.AsyncClient(
+
+def get_http_client() -> httpx.AsyncClient:
+    """共有HTTPクライアントを取得."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
             timeout=60.0,
             follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=50, max_keepalive_connections=20, keepalive_expiry=60.0
+            ),
         )
+    return _http_client
+
+
+async def aclose_http_client() -> None:
+    """共有HTTPクライアントのクリーンアップ.
+
+    接続はイベントループに紐づくため、asyncio.run の終了前に呼び出す。
+    """
+    global _http_client
+    if _http_client is not None:
+        client, _http_client = _http_client, None
+        await client.aclose()
+
 
-    async def download_pdf(self, url: str) -> bytes | None:
-        """PDFをダウンロード."""
+class PDFProcessor:
+    """PDF処理クラス."""
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """共有HTTPクライアント."""
+        return get_http_client()
+
+    async def download_pdf(self, url: str) -> DownloadedPDF | None:
+        """PDFをダウンロード.
+
+        本文はチャンク単位でSpooledTemporaryFileへ書き込み、大きなPDFでもメモリ使用量を抑える。
+        SHA-256ハッシュとサイズは受信したチャンクから同時に計算し、
+        (ファイル, ハッシュ, サイズ) を返す。
+        """
+        spool: tempfile.SpooledTemporaryFile[bytes] | None = None
         try:
-            response = await self.client.get(url)
-            response.raise_for_status()
+            async with self.client.stream("GET", url) as response:
+                response.raise_for_status()
 
-            # Content-Typeチェック
-            content_type = response.headers.get("content-type", "")
-            if "application/pdf" not in content_type:
-                logger.warning("Invalid content type", url=url, content_type=content_type)
-                return None
+                # Content-Typeチェック
+                content_type = response.headers.get("content-type", "")
+                if "application/pdf" not in content_type:
+                    logger.warning("Invalid content type", url=url, content_type=content_type)
+                    return None
 
-            logger.info("PDF downloaded successfully", url=url, size=len(response.content))
-            return response.content
+                spool = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, suffix=".pdf")
+                digest = hashlib.sha256()
+                async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    spool.write(chunk)
+                    digest.update(chunk)
+
+            size = spool.tell()
+            logger.info("PDF downloaded successfully", url=url, size=size)
+            spool.seek(0)
+            return spool, digest.hexdigest(), size
 
         except httpx.HTTPError as e:
             logger.error("Failed to download PDF", url=url, error=str(e))
-            return None
         except Exception as e:
             logger.error("Unexpected error downloading PDF", url=url, error=str(e))
-            return None
 
-    def extract_text_pypdf(self, pdf_content: bytes) -> str:
+        if spool is not None:
+            spool.close()
+        return None
+
+    @staticmethod
+    def _open_stream(pdf_content: PDFContent) -> IO[bytes]:
+        """PDFコンテンツを先頭から読めるストリームとして取得."""
+        if isinstance(pdf_content, bytes):
+            # 一時ファイルを経由せずメモリ上のバイト列から直接読み込む
+            return io.BytesIO(pdf_content)
+        pdf_content.seek(0)
+        return pdf_content
+
+    @staticmethod
+    @contextmanager
+    def _open_buffer(pdf_content: PDFContent) -> Iterator[bytes | memoryview]:
+        """PDFコンテンツをPyMuPDFへ渡せるバッファとして取得.
+
+        メモリ上限以下のファイルはバイト列として読み込み、一時ファイルへ退避済みの
+        大きなファイルは全体を読み込まずに読み取り専用でメモリマップする。
+        """
+        if isinstance(pdf_content, bytes):
+            yield pdf_content
+            return
+
+        size = pdf_content.seek(0, io.SEEK_END)
+        pdf_content.seek(0)
+        if size > SPOOL_MAX_SIZE:
+            try:
+                fileno = pdf_content.fileno()
+            except (AttributeError, io.UnsupportedOperation):
+                pass  # ファイルを持たないストリームは読み込みへ
+            else:
+                with (
+                    mmap.mmap(fileno, 0, access=mmap.ACCESS_READ) as mapped,
+                    memoryview(mapped) as view,
+                ):
+                    yield view
+                return
+
+        yield pdf_content.read()
+
+    def extract_text_pymupdf(self, pdf_content: PDFContent) -> str:
+        """PyMuPDFでテキスト抽出."""
+        try:
+            with (
+                self._open_buffer(pdf_content) as data,
+                pymupdf.open(stream=data, filetype="pdf") as doc,
+            ):
+                text = ""
+
+                for page_num, page in enumerate(doc):
+                    try:
+                        page_text = page.get_text()
+                        if page_text:
+                            text += page_text + "\n"
+                    except Exception as e:
+                        logger.warning(
+                            "Failed to extract text from page", page_num=page_num, error=str(e)
+                        )
+
+                return text.strip()
+
+        except Exception as e:
+            logger.error("Failed to extract text with PyMuPDF", error=str(e))
+            return ""
+
+    def extract_text_pypdf(self, pdf_content: PDFContent) -> str:
         """pypdfでテキスト抽出."""
         try:
-            with tempfile.NamedTemporaryFile(suffix=".pdf") as tmp_file:
-                tmp_file.write(pdf_content)
-                tmp_file.flush()
-
-                with open(tmp_file.name, "rb") as file:
-                    pdf_reader = pypdf.PdfReader(file)
-                    text = ""
-
-                    for page_num, page in enumerate(pdf_reader.pages):
-                        try:
-                            page_text = page.extract_text()
-                            if page_text:
-                                text += page_text + "\n"
-                        except Exception as e:
-                            logger.warning(
-                                "Failed to extract text from page", page_num=page_num, error=str(e)
-                            )
-
-                    return text.strip()
+            pdf_reader = pypdf.PdfReader(self._open_stream(pdf_content))
+            text = ""
+
+            for page_num, page in enumerate(pdf_reader.pages):
+                try:
+                    page_text = page.extract_text()
+                    if page_text:
+                        text += page_text + "\n"
+                except Exception as e:
+                    logger.warning(
+                        "Failed to extract text from page", page_num=page_num, error=str(e)
+                    )
+
+            return text.strip()
 
         except Exception as e:
             logger.error("Failed to extract text with pypdf", error=str(e))
             return ""
 
-    def extract_text_pdfplumber(self, pdf_content: bytes) -> str:
+    def extract_text_pdfplumber(self, pdf_content: PDFContent) -> str:
         """pdfplumberでテキスト抽出."""
         try:
-            with tempfile.NamedTemporaryFile(suffix=".pdf") as tmp_file:
-                tmp_file.write(pdf_content)
-                tmp_file.flush()
-
-                with pdfplumber.open(tmp_file.name) as pdf:
-                    text = ""
+            with pdfplumber.open(self._open_stream(pdf_content)) as pdf:  # type: ignore[arg-type]
+                text = ""
 
-                    for page_num, page in enumerate(pdf.pages):
-                        try:
-                            page_text = page.extract_text()
-                            if page_text:
-                                text += page_text + "\n"
-                        except Exception as e:
-                            logger.warning(
-                                "Failed to extract text from page", page_num=page_num, error=str(e)
-                            )
+                for page_num, page in enumerate(pdf.pages):
+                    try:
+                        page_text = page.extract_text()
+                        if page_text:
+                            text += page_text + "\n"
+                    except Exception as e:
+                        logger.warning(
+                            "Failed to extract text from page", page_num=page_num, error=str(e)
+                        )
 
-                    return text.strip()
+                return text.strip()
 
         except Exception as e:
             logger.error("Failed to extract text with pdfplumber", error=str(e))
             return ""
 
-    def extract_text(self, pdf_content: bytes) -> str:
+    def extract_text(self, pdf_content: PDFContent) -> str:
         """テキスト抽出（複数手法を試行）."""
-        # まずpdfplumberを試行
-        text = self.extract_text_pdfplumber(pdf_content)
+        # まず高速なPyMuPDFを試行
+        text = self.extract_text_pymupdf(pdf_content)
 
-        # 失敗した場合はpypdfを試行
+        # 失敗した場合はpdfplumberを試行
+        if not text or len(text) < 100:
+            logger.info("Fallback to pdfplumber for text extraction")
+            text = self.extract_text_pdfplumber(pdf_content)
+
+        # それでも失敗した場合はpypdfを試行
         if not text or len(text) < 100:
             logger.info("Fallback to pypdf for text extraction")
             text = self.extract_text_pypdf(pdf_content)
@@ -112,36 +239,28 @@ class PDFProcessor:
 
         return text
 
-    def _clean_text(self, text: str) -> str:
-        """テキストのクリーニング."""
-        # 改行の正規化
-        text = text.replace("\r\n", "\n").replace("\r", "\n")
-
-        # 連続する改行を制限
-        lines = text.split("\n")
-        cleaned_lines = []
-        empty_count = 0
-
-        for line in lines:
-            line = line.strip()
-            if line:
-                cleaned_lines.append(line)
-                empty_count = 0
-            else:
-                empty_count += 1
-                if empty_count <= 1:  # 連続する空行は1つまで
-                    cleaned_lines.append("")
-
-        # 連続するスペースを制限
-        text = "\n".join(cleaned_lines)
-        text = " ".join(text.split())
+    async def extract_text_async(self, pdf_content: PDFContent) -> str:
+        """テキスト抽出を専用スレッドで実行（抽出中もイベントループを塞がない）."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_extract_executor, self.extract_text, pdf_content)
 
-        return text
+    def _clean_text(self, text: str) -> str:
+        """テキストのクリーニング（改行・連続する空白を1つのスペースへ正規化）."""
+        return _WHITESPACE_RE.sub(" ", text).strip()
 
-    def calculate_hash(self, pdf_content: bytes) -> str:
-        """PDFコンテンツのハッシュ計算."""
-        return hashlib.sha256(pdf_content).hexdigest()
+    def calculate_hash(self, pdf_content: PDFContent) -> str:
+        """PDFコンテンツのハッシュ計算（ファイルはチャンク単位で読み込む）."""
+        if isinstance(pdf_content, bytes):
+            return hashlib.sha256(pdf_content).hexdigest()
+        digest = hashlib.sha256()
+        stream = self._open_stream(pdf_content)
+        for chunk in iter(lambda: stream.read(DOWNLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
 
     async def close(self) -> None:
-        """リソースのクリーンアップ."""
-        await self.client.aclose()
+        """リソースのクリーンアップ.
+
+        HTTPクライアントは他のインスタンスと共有しているため閉じない。
+        ワーカーやCLIの終了時に aclose_http_client で閉じる。
+        """
@@ -1,13 +1,17 @@
 """要約サービス."""
 
 from datetime import UTC, datetime
+from typing import Any
 
 import structlog
 from refnet_shared.models.database import Paper, ProcessingQueue
 from refnet_shared.models.database_manager import db_manager
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
-from refnet_summarizer.clients.ai_client import create_ai_client
+from refnet_summarizer.clients import cache
+from refnet_summarizer.clients.ai_client import MAX_INPUT_CHARS, OpenAIClient, create_ai_client
+from refnet_summarizer.clients.cache import build_pdf_text_key
 from refnet_summarizer.processors.pdf_processor import PDFProcessor
 
 logger = structlog.get_logger(__name__)
@@ -31,65 +35,27 @@ class SummarizerService:
                     logger.warning("Paper not found", paper_id=paper_id)
                     return False
 
-                # PDF URL チェック
-                if not paper.pdf_url:
-                    logger.warning("No PDF URL available", paper_id=paper_id)
-                    await self._update_processing_status(
-                        session, paper_id, "summary", "failed", "No PDF URL"
-                    )
-                    return False
-
-                # PDF ダウンロードとテキスト抽出
-                pdf_content = await self.pdf_processor.download_pdf(paper.pdf_url)
-                if not pdf_content:
-                    logger.warning("Failed to download PDF", paper_id=paper_id)
-                    await self._update_processing_status(
-                        session, paper_id, "summary", "failed", "PDF download failed"
-                    )
+                text = await self._prepare_text(session, paper)
+                if text is None:
                     return False
 
-                # PDF 情報の更新
-                paper.pdf_hash = self.pdf_processor.calculate_hash(pdf_content)
-                paper.pdf_size = len(pdf_content)
-                # PDF processing completed - no specific status field needed
-
-                # テキスト抽出
-                text = self.pdf_processor.extract_text(pdf_content)
-                if not text or len(text) < 100:
-                    logger.warning(
-                        "Failed to extract text or text too short",
-                        paper_id=paper_id,
-                        text_length=len(text),
-                    )
-                    await self._update_processing_status(
-                        session, paper_id, "summary", "failed", "Text extraction failed"
-                    )
-                    return False
-
-                logger.info("Text extracted successfully", paper_id=paper_id, text_length=len(text))
-
-                # AI要約生成
-                summary = await self.ai_client.generate_summary(text, max_tokens=500)
+                # AI要約生成・キーワード抽出（同時に実行）
+                summary, keywords = await self.ai_client.summarize_and_extract(
+                    text, max_tokens=500, max_keywords=10
+                )
                 if not summary:
                     logger.warning("Failed to generate summary", paper_id=paper_id)
                     await self._update_processing_status(
-                        session, paper_id, "summary", "failed", "Summary generation failed"
+                        session,
+                        paper_id,
+                        "summary",
+                        "failed",
+                        "Summary generation failed",
+                        paper=paper,
                     )
                     return False
 
-                # キーワード抽出
-                keywords = await self.ai_client.extract_keywords(text, max_keywords=10)
-
-                # 論文情報の更新
-                paper.summary = summary
-                paper.summary_model = self._get_ai_model_name()
-                paper.summary_created_at = datetime.now(UTC)
-                paper.is_summarized = True
-
-                # TODO: キーワードの保存（キーワードテーブルがある場合）
-
-                session.commit()
-                await self._update_processing_status(session, paper_id, "summary", "completed")
+                await self._persist_summary(session, paper, summary)
 
             logger.info(
                 "Paper summarized successfully",
@@ -101,12 +67,148 @@ class SummarizerService:
 
         except Exception as e:
             logger.error("Failed to summarize paper", paper_id=paper_id, error=str(e))
+            await self._record_failure(paper_id, str(e))
+            return False
 
-            # エラー状態を記録
-            with db_manager.get_session() as session:
-                await self._update_processing_status(session, paper_id, "summary", "failed", str(e))
+    async def summarize_papers_batch(self, paper_ids: list[str]) -> dict[str, bool]:
+        """複数論文の一括要約（OpenAI Batch API使用、バックフィル向け）.
 
-            return False
+        Batch APIに対応しないクライアントでは論文ごとに逐次要約する。
+        """
+        if not isinstance(self.ai_client, OpenAIClient):
+            return {paper_id: await self.summarize_paper(paper_id) for paper_id in paper_ids}
+
+        results = dict.fromkeys(paper_ids, False)
+        requests = []
+        for paper_id in paper_ids:
+            # 1件の失敗でバッチ全体を中断せず、その論文のみ失敗として記録
+            try:
+                with db_manager.get_session() as session:
+                    paper = session.query(Paper).filter_by(paper_id=paper_id).first()
+                    if not paper:
+                        logger.warning("Paper not found", paper_id=paper_id)
+                        continue
+
+                    text = await self._prepare_text(session, paper)
+                    if text is not None:
+                        requests.append(self.ai_client.build_batch_request(paper_id, text))
+            except Exception as e:
+                logger.error("Failed to prepare paper for batch", paper_id=paper_id, error=str(e))
+                await self._record_failure(paper_id, str(e))
+
+        if not requests:
+            return results
+
+        try:
+            outputs = await self.ai_client.run_batch(requests)
+        except Exception as e:
+            logger.error("Failed to run summary batch", error=str(e))
+            outputs = {}
+
+        for request in requests:
+            paper_id = request["custom_id"]
+            try:
+                with db_manager.get_session() as session:
+                    output = outputs.get(paper_id)
+                    paper = session.query(Paper).filter_by(paper_id=paper_id).first()
+                    if not output or not paper:
+                        await self._update_processing_status(
+                            session,
+                            paper_id,
+                            "summary",
+                            "failed",
+                            "Batch summary generation failed",
+                            paper=paper,
+                        )
+                        continue
+
+                    summary, _keywords = output
+                    await self._persist_summary(session, paper, summary)
+                    results[paper_id] = True
+            except Exception as e:
+                logger.error("Failed to save batch summary", paper_id=paper_id, error=str(e))
+                results[paper_id] = False
+                await self._record_failure(paper_id, str(e))
+
+        logger.info(
+            "Paper batch summarized",
+            requested=len(paper_ids),
+            succeeded=sum(results.values()),
+        )
+        return results
+
+    async def _record_failure(self, paper_id: str, error_message: str) -> None:
+        """例外で中断した論文のエラー状態を新しいセッションで記録."""
+        with db_manager.get_session() as session:
+            await self._update_processing_status(
+                session, paper_id, "summary", "failed", error_message
+            )
+
+    async def _prepare_text(self, session: Session, paper: Paper) -> str | None:
+        """PDFをダウンロードしてテキストを抽出（失敗時は処理状態を更新してNone）."""
+        paper_id = paper.paper_id
+
+        # PDF URL チェック
+        if not paper.pdf_url:
+            logger.warning("No PDF URL available", paper_id=paper_id)
+            await self._update_processing_status(
+                session, paper_id, "summary", "failed", "No PDF URL", paper=paper
+            )
+            return None
+
+        # PDF ダウンロードとテキスト抽出
+        downloaded = await self.pdf_processor.download_pdf(paper.pdf_url)
+        if downloaded is None:
+            logger.warning("Failed to download PDF", paper_id=paper_id)
+            await self._update_processing_status(
+                session, paper_id, "summary", "failed", "PDF download failed", paper=paper
+            )
+            return None
+
+        # PDF 情報の更新（ハッシュ・サイズはダウンロード時に計算済み）
+        pdf_file, paper.pdf_hash, paper.pdf_size = downloaded
+
+        # 同一内容のPDFは抽出済みテキストを再利用（要約もAI応答キャッシュから返る）
+        text_key = build_pdf_text_key(paper.pdf_hash)
+        cached_text = await cache.pdf_text_cache.get(text_key)
+        if cached_text is not None:
+            pdf_file.close()
+            logger.info("Reusing extracted text for identical PDF", paper_id=paper_id)
+            return str(cached_text)
+
+        # テキスト抽出
+        with pdf_file:
+            text = await self.pdf_processor.extract_text_async(pdf_file)
+        if not text or len(text) < 100:
+            logger.warning(
+                "Failed to extract text or text too short",
+                paper_id=paper_id,
+                text_length=len(text),
+            )
+            await self._update_processing_status(
+                session, paper_id, "summary", "failed", "Text extraction failed", paper=paper
+            )
+            return None
+
+        logger.info("Text extracted successfully", paper_id=paper_id, text_length=len(text))
+        # AIへ送らない末尾は保持・キャッシュしない
+        text = text[:MAX_INPUT_CHARS]
+        await cache.pdf_text_cache.set(text_key, text)
+        return text
+
+    async def _persist_summary(self, session: Session, paper: Paper, summary: str) -> None:
+        """要約結果を論文情報へ保存."""
+        paper.summary = summary
+        paper.summary_model = self._get_ai_model_name()
+        paper.summary_created_at = datetime.now(UTC)
+        paper.is_summarized = True
+
+        # TODO: キーワードの保存（キーワードテーブルがある場合）
+
+        session.commit()
+        await self._update_processing_status(
+            session, paper.paper_id, "summary", "completed", paper=paper
+        )
 
     def _get_ai_model_name(self) -> str:
         """使用中のAIモデル名を取得."""
@@ -124,24 +226,32 @@ class SummarizerService:
         task_type: str,
         status: str,
         error_message: str | None = None,
+        paper: Paper | None = None,
     ) -> None:
-        """処理状態を更新."""
-        queue_item = (
-            session.query(ProcessingQueue).filter_by(paper_id=paper_id, task_type=task_type).first()
-        )
+        """処理状態を更新（読み込み済みの論文を渡すと再取得しない）."""
+        values: dict[str, Any] = {"status": status}
+        if error_message:
+            values["error_message"] = error_message
+            values["retry_count"] = ProcessingQueue.retry_count + 1
 
-        if queue_item:
-            queue_item.status = status
-            if error_message:
-                queue_item.error_message = error_message
-                queue_item.retry_count += 1
+        # キューは取得せず1回のUPDATE文で更新
+        session.execute(
+            update(ProcessingQueue)
+            .where(ProcessingQueue.paper_id == paper_id, ProcessingQueue.task_type == task_type)
+            .values(**values)
+        )
 
         # 論文テーブルの状態も更新
-        paper = session.query(Paper).filter_by(paper_id=paper_id).first()
-        if paper:
-            if task_type == "summary":
-                paper.is_summarized = (status == "completed")
+        if task_type == "summary":
+            is_summarized = status == "completed"
+            if paper is not None:
+                paper.is_summarized = is_summarized
+            else:
+                session.execute(
+                    update(Paper)
+                    .where(Paper.paper_id == paper_id)
+                    .values(is_summarized=is_summarized)
+                )
 
     async def close(self) -> None:
-        """リソースのクリーンアップ."""
-        await self.pdf_processor.close()
+        """リソースのクリーンアップ（共有クライアントはワーカーやCLIの終了時に閉じる）."""
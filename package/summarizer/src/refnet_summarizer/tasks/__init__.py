@@ -1,13 +1,14 @@
 """Celeryタスク定義."""
 
-import asyncio
 from typing import Any
 
 import structlog
-from celery import Celery
+from celery import Celery, group
+from celery.signals import worker_process_init
 from refnet_shared.config.environment import load_environment_settings
 
 from refnet_summarizer.services.summarizer_service import SummarizerService
+from refnet_summarizer.tasks.worker_loop import run_in_worker_loop, timeout_before_soft_limit
 
 logger = structlog.get_logger(__name__)
 settings = load_environment_settings()
@@ -35,20 +36,38 @@ celery_app.conf.update(
 )
 
 
+# ワーカープロセス内で使い回す要約サービス
+_service: SummarizerService | None = None
+
+
+def get_summarizer_service() -> SummarizerService:
+    """ワーカープロセス共有の要約サービスを取得."""
+    global _service
+    if _service is None:
+        _service = SummarizerService()
+    return _service
+
+
+@worker_process_init.connect  # type: ignore[untyped-decorator]
+def _init_summarizer_service(**kwargs: Any) -> None:
+    """ワーカープロセス起動時に要約サービスを準備（失敗時は最初のタスクで再試行）."""
+    try:
+        get_summarizer_service()
+    except Exception as e:
+        logger.warning("Failed to initialize summarizer service", error=str(e))
+
+
 @celery_app.task(bind=True, name="refnet.summarizer.summarize_paper")  # type: ignore[misc]
 def summarize_paper_task(self: Any, paper_id: str) -> bool:
     """論文要約タスク."""
     logger.info("Starting paper summarization task", paper_id=paper_id)
 
-    async def _summarize() -> bool:
-        service = SummarizerService()
-        try:
-            return await service.summarize_paper(paper_id)
-        finally:
-            await service.close()
-
     try:
-        result: bool = asyncio.run(_summarize())
+        # 共有サービスをワーカープロセスのイベントループで実行（接続はプロセス終了時に閉じる）
+        result: bool = run_in_worker_loop(
+            get_summarizer_service().summarize_paper(paper_id),
+            timeout=timeout_before_soft_limit(celery_app.conf.task_soft_time_limit),
+        )
         logger.info("Paper summarization task completed", paper_id=paper_id, success=result)
         return result
     except Exception as e:
@@ -61,10 +80,9 @@ def batch_summarize_task(paper_ids: list[str]) -> dict[str, str]:
     """バッチ要約タスク."""
     logger.info("Starting batch summarization task", paper_count=len(paper_ids))
 
-    results: dict[str, str] = {}
-    for paper_id in paper_ids:
-        # 個別タスクとして実行
-        result = summarize_paper_task.delay(paper_id)
-        results[paper_id] = result.id
+    if not paper_ids:
+        return {}
 
-    return results
+    # 個別タスクをグループとしてまとめて発行（ブローカーへの送信を1接続で行う）
+    result = group(summarize_paper_task.s(paper_id) for paper_id in paper_ids).apply_async()
+    return {paper_id: child.id for paper_id, child in zip(paper_ids, result.children, strict=True)}
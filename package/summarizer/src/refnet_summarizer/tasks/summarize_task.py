@@ -3,13 +3,15 @@
 from typing import Any
 
 import structlog
+from celery import group
 from refnet_shared.celery_app import app as celery_app
 from refnet_shared.models.database import Paper
 from refnet_shared.models.database_manager import db_manager
 from sqlalchemy import and_
 
-from refnet_summarizer.clients.ai_client import create_ai_client
+from refnet_summarizer.clients.ai_client import MAX_INPUT_CHARS, create_ai_client
 from refnet_summarizer.processors.pdf_processor import PDFProcessor
+from refnet_summarizer.tasks.worker_loop import run_in_worker_loop, timeout_before_soft_limit
 
 logger = structlog.get_logger(__name__)
 
@@ -34,9 +36,11 @@ def process_pending_summarizations(self: Any) -> dict:
                 .all()
             )
 
-            for paper in pending_papers:
-                # 非同期で要約タスクを起動
-                summarize_paper.apply_async(args=[paper.paper_id], queue="summarizer")
+            if pending_papers:
+                # 要約タスクをグループとしてまとめて起動
+                group(summarize_paper.s(paper.paper_id) for paper in pending_papers).apply_async(
+                    queue="summarizer"
+                )
 
             result = {
                 "status": "success",
@@ -55,7 +59,6 @@ def process_pending_summarizations(self: Any) -> dict:
 @celery_app.task(bind=True, name='refnet_summarizer.tasks.summarize_task.summarize_paper')  # type: ignore[misc]
 def summarize_paper(self: Any, paper_id: str) -> dict:
     """論文を要約し、次の処理をトリガー"""
-    import asyncio
 
     async def _summarize_async() -> dict:
         try:
@@ -80,14 +83,18 @@ def summarize_paper(self: Any, paper_id: str) -> dict:
 
                 # PDFをダウンロードして処理
                 pdf_processor = PDFProcessor()
-                pdf_content = await pdf_processor.download_pdf(paper.pdf_url)
-                if pdf_content is None:
+                downloaded = await pdf_processor.download_pdf(paper.pdf_url)
+                if downloaded is None:
                     raise ValueError("Failed to download PDF")
-                text_content = pdf_processor.extract_text(pdf_content)
+                pdf_file, _pdf_hash, _pdf_size = downloaded
+                with pdf_file:
+                    text_content = await pdf_processor.extract_text_async(pdf_file)
 
                 # AI要約を生成
                 ai_client = create_ai_client()
-                summary = await ai_client.generate_summary(text_content, max_tokens=1000)
+                summary = await ai_client.generate_summary(
+                    text_content[:MAX_INPUT_CHARS], max_tokens=1000
+                )
 
                 # 要約を保存
                 paper.summary = summary
@@ -116,7 +123,12 @@ def summarize_paper(self: Any, paper_id: str) -> dict:
             raise
 
     try:
-        return asyncio.run(_summarize_async())
+        # ワーカープロセスで共有するイベントループで実行（HTTP・AIクライアントの接続を再利用）
+        result: dict = run_in_worker_loop(
+            _summarize_async(),
+            timeout=timeout_before_soft_limit(celery_app.conf.task_soft_time_limit),
+        )
+        return result
     except Exception as e:
         self.retry(exc=e, countdown=120, max_retries=3)
         return {}
@@ -0,0 +1,94 @@
+"""Celeryワーカープロセスで共有するイベントループ."""
+
+import asyncio
+import os
+import threading
+from collections.abc import Coroutine
+from typing import Any
+
+import structlog
+from celery.signals import worker_process_init, worker_process_shutdown
+
+from refnet_summarizer.clients.ai_client import aclose_shared_clients
+from refnet_summarizer.processors.pdf_processor import aclose_http_client
+
+logger = structlog.get_logger(__name__)
+
+# プロセスごとに1つ起動し、タスク間で接続プールを持ち越すためのループ
+_loop: asyncio.AbstractEventLoop | None = None
+_thread: threading.Thread | None = None
+_pid: int | None = None
+_lock = threading.Lock()
+
+# ソフトタイムリミット前に待機を打ち切り、実行中の処理を取り消すための余裕（秒）
+SOFT_LIMIT_MARGIN_SECONDS = 60.0
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """バックグラウンドスレッドで動作するイベントループを取得（未起動なら起動）."""
+    global _loop, _thread, _pid
+    with _lock:
+        # fork後の子プロセスには親のループスレッドが存在しないため作り直す
+        if _loop is None or _pid != os.getpid():
+            _loop = asyncio.new_event_loop()
+            _thread = threading.Thread(
+                target=_loop.run_forever, name="summarizer-event-loop", daemon=True
+            )
+            _thread.start()
+            _pid = os.getpid()
+        return _loop
+
+
+def timeout_before_soft_limit(soft_time_limit: float | None) -> float | None:
+    """ソフトタイムリミットより手前で待機を打ち切るタイムアウトを計算."""
+    if soft_time_limit is None:
+        return None
+    return max(soft_time_limit - SOFT_LIMIT_MARGIN_SECONDS, 1.0)
+
+
+def run_in_worker_loop(coro: Coroutine[Any, Any, Any], timeout: float | None = None) -> Any:
+    """コルーチンを共有イベントループで実行し、結果を待つ.
+
+    タイムアウトやSoftTimeLimitExceededで待機を抜けた場合はコルーチンを取り消し、
+    リトライ時に同じ処理が二重に実行されないようにする。
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, get_worker_loop())
+    try:
+        return future.result(timeout=timeout)
+    except BaseException:
+        future.cancel()
+        raise
+
+
+def stop_worker_loop() -> None:
+    """共有クライアントを閉じてからイベントループを停止."""
+    global _loop, _thread, _pid
+    with _lock:
+        loop, thread = _loop, _thread
+        if loop is None or thread is None or _pid != os.getpid():
+            return
+        _loop = _thread = _pid = None
+
+    async def _cleanup() -> None:
+        await aclose_http_client()
+        await aclose_shared_clients()
+
+    try:
+        asyncio.run_coroutine_threadsafe(_cleanup(), loop).result(timeout=30)
+    except Exception as e:
+        logger.warning("Failed to close shared clients", error=str(e))
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+@worker_process_init.connect  # type: ignore[untyped-decorator]
+def _start_worker_loop(**kwargs: Any) -> None:
+    """ワーカープロセス起動時にイベントループを開始."""
+    get_worker_loop()
+
+
+@worker_process_shutdown.connect  # type: ignore[untyped-decorator]
+def _stop_worker_loop(**kwargs: Any) -> None:
+    """ワーカープロセス終了時にイベントループを停止."""
+    stop_worker_loop()
@@ -1,7 +1,7 @@
 """pytest設定とフィクスチャ."""
 
 import asyncio
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -18,11 +18,36 @@ def event_loop():
 @pytest.fixture
 def mock_settings():
     """モック環境設定."""
-    with patch('refnet_summarizer.clients.ai_client.load_environment_settings') as mock_load:
-        mock_settings = mock_load.return_value
+    with patch(
+        'refnet_summarizer.clients.ai_client.get_environment_settings'
+    ) as mock_get_settings:
+        mock_settings = mock_get_settings.return_value
         mock_settings.openai_api_key = "test-openai-key"
         mock_settings.anthropic_api_key = "test-anthropic-key"
         mock_settings.celery_broker_url = "redis://localhost:6379/0"
         mock_settings.celery_result_backend = "redis://localhost:6379/0"
         mock_settings.redis.url = "redis://localhost:6379/0"
         yield mock_settings
+
+
+@pytest.fixture(autouse=True)
+def clear_shared_ai_clients(monkeypatch):
+    """テスト間で共有AIクライアント・リミッター・応答キャッシュの状態を持ち越さない."""
+    from refnet_summarizer.clients import ai_client, cache
+    from refnet_summarizer.clients.cache import ResponseCache
+    from refnet_summarizer.clients.limiter import AIMDLimiter
+    from refnet_summarizer.processors import pdf_processor
+
+    monkeypatch.setattr(ai_client, "ai_limiter", AIMDLimiter())
+    # Redisへ接続しないようキャッシュは常にミスとする
+    response_cache = AsyncMock(spec=ResponseCache)
+    response_cache.get.return_value = None
+    monkeypatch.setattr(cache, "response_cache", response_cache)
+    pdf_text_cache = AsyncMock(spec=ResponseCache)
+    pdf_text_cache.get.return_value = None
+    monkeypatch.setattr(cache, "pdf_text_cache", pdf_text_cache)
+    yield
+    ai_client._openai_clients.clear()
+    ai_client._anthropic_clients.clear()
+    ai_client._claude_availability.clear()
+    pdf_processor._http_client = None
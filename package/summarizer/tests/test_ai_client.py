@@ -1,14 +1,21 @@
 """AI クライアントのテスト."""
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+import openai
 import pytest
 from refnet_shared.exceptions import ExternalAPIError
 
+from refnet_summarizer.clients import ai_client
 from refnet_summarizer.clients.ai_client import (
+    SUMMARY_SYSTEM_PROMPT,
     AnthropicClient,
     ClaudeCodeClient,
     OpenAIClient,
+    aclose_shared_clients,
     create_ai_client,
 )
 
@@ -31,41 +38,126 @@ def mock_anthropic_response():  # type: ignore
     return response
 
 
+async def _aiter(items):  # type: ignore
+    """リストを非同期イテレーターに変換."""
+    for item in items:
+        yield item
+
+
+class _OpenAIStream:
+    """OpenAIのAsyncStream相当のモック（コンテキストマネージャーで閉じられる）."""
+
+    def __init__(self, chunks):  # type: ignore
+        self._chunks = chunks
+        self.closed = False
+
+    def __aiter__(self):  # type: ignore
+        return self._chunks.__aiter__()
+
+    async def __aenter__(self):  # type: ignore
+        return self
+
+    async def __aexit__(self, *exc_info):  # type: ignore
+        self.closed = True
+
+
+def make_openai_stream(*deltas):  # type: ignore
+    """OpenAIストリーミング応答のモックを作成."""
+    chunks = []
+    for delta in deltas:
+        chunk = MagicMock()
+        chunk.choices = [MagicMock()]
+        chunk.choices[0].delta.content = delta
+        chunks.append(chunk)
+    return _OpenAIStream(_aiter(chunks))
+
+
+def make_anthropic_stream(*deltas):  # type: ignore
+    """Anthropic messages.stream のコンテキストマネージャーのモックを作成."""
+    stream = MagicMock()
+    stream.text_stream = _aiter(deltas)
+    manager = MagicMock()
+    manager.__aenter__ = AsyncMock(return_value=stream)
+    manager.__aexit__ = AsyncMock(return_value=None)
+    return manager
+
+
+def make_claude_process(returncode: int, stdout: bytes = b"", stderr: bytes = b""):  # type: ignore
+    """Claude Code CLIのモックプロセスを作成."""
+    process = MagicMock()
+    process.returncode = returncode
+    process.communicate = AsyncMock(return_value=(stdout, stderr))
+    return process
+
+
 @pytest.mark.asyncio
-async def test_openai_generate_summary_success(mock_openai_response):  # type: ignore
+async def test_openai_generate_summary_success():  # type: ignore
     """OpenAI要約生成成功テスト."""
     with patch('openai.AsyncOpenAI') as mock_client_class:
         mock_client = AsyncMock()
         mock_client_class.return_value = mock_client
-        mock_client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
+        mock_client.chat.completions.create = AsyncMock(
+            return_value=make_openai_stream("This is a mock ", None, "summary of the paper.")
+        )
 
         client = OpenAIClient("test-api-key")
         result = await client.generate_summary("Test paper text", max_tokens=500)
 
         assert result == "This is a mock summary of the paper."
         mock_client.chat.completions.create.assert_called_once()
+        call_kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert call_kwargs["stream"] is True
+        assert call_kwargs["messages"][0] == {"role": "system", "content": SUMMARY_SYSTEM_PROMPT}
+
+
+@pytest.mark.asyncio
+async def test_openai_generate_summary_timeout():  # type: ignore
+    """OpenAI要約ストリーミングのタイムアウトテスト."""
+    async def hanging_stream():  # type: ignore
+        await asyncio.sleep(10)
+        yield MagicMock()
+
+    with patch('openai.AsyncOpenAI') as mock_client_class:
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+        stream = _OpenAIStream(hanging_stream())
+        mock_client.chat.completions.create = AsyncMock(return_value=stream)
+
+        client = OpenAIClient("test-api-key")
+        with patch('refnet_summarizer.clients.ai_client.SUMMARY_TIMEOUT_SECONDS', 0.01):
+            with pytest.raises(ExternalAPIError, match="timed out"):
+                await client.generate_summary("Test paper text")
+
+        assert stream.closed
 
 
 @pytest.mark.asyncio
-async def test_anthropic_generate_summary_success(mock_anthropic_response):  # type: ignore
+async def test_anthropic_generate_summary_success():  # type: ignore
     """Anthropic要約生成成功テスト."""
     with patch('anthropic.AsyncAnthropic') as mock_client_class:
         mock_client = AsyncMock()
         mock_client_class.return_value = mock_client
-        mock_client.messages.create = AsyncMock(return_value=mock_anthropic_response)
+        mock_client.messages.stream = MagicMock(
+            return_value=make_anthropic_stream("This is a mock ", "summary of the paper.")
+        )
 
         client = AnthropicClient("test-api-key")
         result = await client.generate_summary("Test paper text", max_tokens=500)
 
         assert result == "This is a mock summary of the paper."
-        mock_client.messages.create.assert_called_once()
+        mock_client.messages.stream.assert_called_once()
+        # 固定のシステムプロンプトをプロンプトキャッシュ対象として送る
+        system = mock_client.messages.stream.call_args.kwargs["system"]
+        assert system == [
+            {"type": "text", "text": SUMMARY_SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}
+        ]
 
 
 @pytest.mark.asyncio
 async def test_openai_extract_keywords_success(mock_openai_response):  # type: ignore
     """OpenAIキーワード抽出成功テスト."""
     mock_openai_response.choices[0].message.content = (
-        "machine learning, neural networks, deep learning"
+        '{"keywords": ["machine learning", "neural networks", "deep learning"]}'
     )
 
     with patch('openai.AsyncOpenAI') as mock_client_class:
@@ -77,6 +169,170 @@ async def test_openai_extract_keywords_success(mock_openai_response):  # type: i
         result = await client.extract_keywords("Test paper text", max_keywords=3)
 
         assert result == ["machine learning", "neural networks", "deep learning"]
+        call_kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert call_kwargs["response_format"] == {"type": "json_object"}
+
+
+@pytest.mark.asyncio
+async def test_openai_extract_keywords_normalizes_keywords(mock_openai_response):  # type: ignore
+    """キーワードの空白・短すぎる語の除去と件数上限テスト."""
+    mock_openai_response.choices[0].message.content = (
+        '{"keywords": [" machine learning ", "x", "", "neural networks", "deep learning"]}'
+    )
+
+    with patch('openai.AsyncOpenAI') as mock_client_class:
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
+
+        client = OpenAIClient("test-api-key")
+        result = await client.extract_keywords("Test paper text", max_keywords=2)
+
+        assert result == ["machine learning", "neural networks"]
+
+
+@pytest.mark.asyncio
+async def test_openai_extract_keywords_invalid_json(mock_openai_response):  # type: ignore
+    """キーワード応答がJSONでない場合のテスト."""
+    mock_openai_response.choices[0].message.content = "machine learning, neural networks"
+
+    with patch('openai.AsyncOpenAI') as mock_client_class:
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
+
+        client = OpenAIClient("test-api-key")
+        result = await client.extract_keywords("Test paper text")
+
+        assert result == []
+
+
+@pytest.mark.asyncio
+async def test_anthropic_extract_keywords_success():  # type: ignore
+    """Anthropicキーワード抽出（ツール呼び出しによる構造化出力）成功テスト."""
+    tool_use = MagicMock(type="tool_use", input={"keywords": ["machine learning", "x", "nlp"]})
+    response = MagicMock(content=[tool_use])
+
+    with patch('anthropic.AsyncAnthropic') as mock_client_class:
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+        mock_client.messages.create = AsyncMock(return_value=response)
+
+        client = AnthropicClient("test-api-key")
+        result = await client.extract_keywords("Test paper text", max_keywords=5)
+
+        assert result == ["machine learning", "nlp"]
+        call_kwargs = mock_client.messages.create.call_args.kwargs
+        assert call_kwargs["tools"][0]["name"] == "emit_keywords"
+        assert call_kwargs["tool_choice"] == {"type": "tool", "name": "emit_keywords"}
+
+
+@pytest.mark.asyncio
+async def test_openai_summarize_and_extract_success(mock_openai_response):  # type: ignore
+    """OpenAI要約・キーワード一括取得成功テスト."""
+    mock_openai_response.choices[0].message.content = (
+        '{"summary": "This is a mock summary of the paper.", '
+        '"keywords": ["machine learning", "neural networks"]}'
+    )
+
+    with patch('openai.AsyncOpenAI') as mock_client_class:
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
+
+        client = OpenAIClient("test-api-key")
+        summary, keywords = await client.summarize_and_extract(
+            "Test paper text", max_tokens=500, max_keywords=3
+        )
+
+        assert summary == "This is a mock summary of the paper."
+        assert keywords == ["machine learning", "neural networks"]
+        mock_client.chat.completions.create.assert_called_once()
+        call_kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert call_kwargs["response_format"] == {"type": "json_object"}
+
+
+@pytest.mark.asyncio
+async def test_openai_summarize_and_extract_invalid_json_fallback(mock_openai_response):  # type: ignore
+    """OpenAI一括取得でJSONが不正な場合の個別リクエストへのフォールバックテスト."""
+    with patch('openai.AsyncOpenAI') as mock_client_class:
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_openai_response)
+
+        client = OpenAIClient("test-api-key")
+        with patch.object(
+            client, 'generate_summary', new_callable=AsyncMock, return_value="summary"
+        ):  # type: ignore
+            with patch.object(
+                client, 'extract_keywords', new_callable=AsyncMock, return_value=["keyword"]
+            ):  # type: ignore
+                summary, keywords = await client.summarize_and_extract("Test paper text")
+
+        assert summary == "summary"
+        assert keywords == ["keyword"]
+
+
+def test_openai_build_batch_request():  # type: ignore
+    """Batch APIリクエスト作成テスト."""
+    with patch('openai.AsyncOpenAI'):
+        client = OpenAIClient("test-api-key")
+        request = client.build_batch_request("paper-1", "Test paper text", max_keywords=3)
+
+    assert request["custom_id"] == "paper-1"
+    assert request["method"] == "POST"
+    assert request["url"] == "/v1/chat/completions"
+    assert request["body"]["response_format"] == {"type": "json_object"}
+
+
+@pytest.mark.asyncio
+async def test_openai_run_batch_success():  # type: ignore
+    """Batch API一括実行成功テスト."""
+    output_line = {
+        "custom_id": "paper-1",
+        "response": {"body": {"choices": [{"message": {"content": (
+            '{"summary": "Batch summary.", "keywords": ["machine learning"]}'
+        )}}]}},
+    }
+    invalid_line = {"custom_id": "paper-2", "response": {"body": {"choices": []}}}
+
+    with patch('openai.AsyncOpenAI') as mock_client_class:
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+        mock_client.files.create.return_value = MagicMock(id="file-in")
+        mock_client.batches.create.return_value = MagicMock(id="batch-1", status="in_progress")
+        mock_client.batches.retrieve.return_value = MagicMock(
+            id="batch-1", status="completed", output_file_id="file-out"
+        )
+        mock_client.files.content.return_value = MagicMock(
+            text="\n".join(json.dumps(line) for line in (output_line, invalid_line))
+        )
+
+        client = OpenAIClient("test-api-key")
+        requests = [
+            client.build_batch_request(paper_id, "text") for paper_id in ("paper-1", "paper-2")
+        ]
+        results = await client.run_batch(requests, poll_interval=0)
+
+    assert results == {"paper-1": ("Batch summary.", ["machine learning"])}
+    mock_client.batches.retrieve.assert_called_once_with("batch-1")
+    mock_client.files.content.assert_called_once_with("file-out")
+
+
+@pytest.mark.asyncio
+async def test_openai_run_batch_failed_status():  # type: ignore
+    """Batch APIが完了しなかった場合のエラーテスト."""
+    with patch('openai.AsyncOpenAI') as mock_client_class:
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+        mock_client.files.create.return_value = MagicMock(id="file-in")
+        mock_client.batches.create.return_value = MagicMock(
+            id="batch-1", status="expired", output_file_id=None
+        )
+
+        client = OpenAIClient("test-api-key")
+        with pytest.raises(ExternalAPIError, match="expired"):
+            await client.run_batch([client.build_batch_request("paper-1", "text")])
 
 
 @pytest.mark.asyncio
@@ -86,9 +342,10 @@ async def test_openai_rate_limit_error():  # type: ignore
 
     import openai
 
-    # モックレスポンスオブジェクトを作成
+    # モックレスポンスオブジェクトを作成（Retry-After: 0 で即時再試行）
     mock_response = MagicMock()
     mock_response.request = MagicMock()
+    mock_response.headers = {"retry-after": "0"}
 
     with patch('openai.AsyncOpenAI') as mock_client_class:
         mock_client = AsyncMock()
@@ -104,11 +361,40 @@ async def test_openai_rate_limit_error():  # type: ignore
             await client.generate_summary("Test paper text")
 
         assert "Rate limit exceeded" in str(exc_info.value)
+        assert mock_client.chat.completions.create.await_count == 5
+
+
+@pytest.mark.asyncio
+async def test_openai_client_shared_and_closed():  # type: ignore
+    """同一APIキーのOpenAIクライアント共有とクリーンアップテスト."""
+    with patch('openai.AsyncOpenAI') as mock_client_class, patch(
+        'openai.DefaultAsyncHttpxClient'
+    ) as mock_http_client_class:
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+
+        first = OpenAIClient("test-api-key")
+        second = OpenAIClient("test-api-key")
+
+        assert first.client is second.client
+        mock_http_client_class.assert_called_once_with(http2=True)
+        mock_client_class.assert_called_once_with(
+            api_key="test-api-key", http_client=mock_http_client_class.return_value
+        )
+
+        await aclose_shared_clients()
+
+        mock_client.close.assert_awaited_once()
+        assert OpenAIClient("test-api-key").client is mock_client
+        assert mock_client_class.call_count == 2
 
 
 def test_create_ai_client_with_openai():  # type: ignore
     """OpenAIクライアント作成テスト."""
-    with patch('refnet_summarizer.clients.ai_client.settings') as mock_settings:
+    with patch(
+        'refnet_summarizer.clients.ai_client.get_environment_settings'
+    ) as mock_get_settings:
+        mock_settings = mock_get_settings.return_value
         mock_settings.ai_provider = "openai"
         mock_settings.openai_api_key = "test-openai-key"
         mock_settings.anthropic_api_key = None
@@ -119,7 +405,10 @@ def test_create_ai_client_with_openai():  # type: ignore
 
 def test_create_ai_client_with_anthropic():  # type: ignore
     """Anthropicクライアント作成テスト."""
-    with patch('refnet_summarizer.clients.ai_client.settings') as mock_settings:
+    with patch(
+        'refnet_summarizer.clients.ai_client.get_environment_settings'
+    ) as mock_get_settings:
+        mock_settings = mock_get_settings.return_value
         mock_settings.ai_provider = "anthropic"
         mock_settings.openai_api_key = None
         mock_settings.anthropic_api_key = "test-anthropic-key"
@@ -130,7 +419,10 @@ def test_create_ai_client_with_anthropic():  # type: ignore
 
 def test_create_ai_client_no_api_key():  # type: ignore
     """APIキーなしエラーテスト."""
-    with patch('refnet_summarizer.clients.ai_client.settings') as mock_settings:
+    with patch(
+        'refnet_summarizer.clients.ai_client.get_environment_settings'
+    ) as mock_get_settings:
+        mock_settings = mock_get_settings.return_value
         mock_settings.openai_api_key = None
         mock_settings.anthropic_api_key = None
 
@@ -143,41 +435,94 @@ def test_create_ai_client_no_api_key():  # type: ignore
 @pytest.mark.asyncio
 async def test_claude_code_generate_summary_success():  # type: ignore
     """Claude Code要約生成成功テスト."""
-    with patch('subprocess.run') as mock_run:
+    process = make_claude_process(0, b"This is a mock summary generated by Claude Code.\n")
+    with patch('subprocess.run') as mock_run, patch(
+        'asyncio.create_subprocess_exec', new_callable=AsyncMock, return_value=process
+    ) as mock_exec:
         # バージョンチェック用のmock
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="claude-code v1.0.0\n"),  # version check
-            MagicMock(
-                returncode=0,
-                stdout="This is a mock summary generated by Claude Code.\n"
-            )  # summary
-        ]
+        mock_run.return_value = MagicMock(returncode=0, stdout="claude-code v1.0.0\n")
 
         client = ClaudeCodeClient()
         result = await client.generate_summary("Test paper text", max_tokens=500)
 
         assert result == "This is a mock summary generated by Claude Code."
-        assert mock_run.call_count == 2
+        mock_run.assert_called_once()  # version check
+        mock_exec.assert_awaited_once()
+        # 論文テキストは一時ファイルではなく標準入力で渡す
+        process.communicate.assert_awaited_once_with(b"Test paper text")
 
 
 @pytest.mark.asyncio
 async def test_claude_code_extract_keywords_success():  # type: ignore
     """Claude Codeキーワード抽出成功テスト."""
-    with patch('subprocess.run') as mock_run:
+    process = make_claude_process(0, b"machine learning, neural networks, deep learning\n")
+    with patch('subprocess.run') as mock_run, patch(
+        'asyncio.create_subprocess_exec', new_callable=AsyncMock, return_value=process
+    ) as mock_exec:
         # バージョンチェック用のmock
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="claude-code v1.0.0\n"),  # version check
-            MagicMock(
-                returncode=0,
-                stdout="machine learning, neural networks, deep learning\n"
-            )  # keywords
-        ]
+        mock_run.return_value = MagicMock(returncode=0, stdout="claude-code v1.0.0\n")
 
         client = ClaudeCodeClient()
         result = await client.extract_keywords("Test paper text", max_keywords=3)
 
         assert result == ["machine learning", "neural networks", "deep learning"]
-        assert mock_run.call_count == 2
+        mock_run.assert_called_once()  # version check
+        mock_exec.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_claude_code_extract_keywords_fullwidth_comma():  # type: ignore
+    """Claude Codeキーワード抽出の全角読点区切りテスト."""
+    process = make_claude_process(0, "機械学習、 ニューラルネットワーク , 深層学習\n".encode())
+    with patch('subprocess.run') as mock_run, patch(
+        'asyncio.create_subprocess_exec', new_callable=AsyncMock, return_value=process
+    ):
+        mock_run.return_value = MagicMock(returncode=0, stdout="claude-code v1.0.0\n")
+
+        client = ClaudeCodeClient()
+        result = await client.extract_keywords("Test paper text")
+
+        assert result == ["機械学習", "ニューラルネットワーク", "深層学習"]
+
+
+@pytest.mark.asyncio
+async def test_claude_code_run_prompt_timeout_kills_process():  # type: ignore
+    """Claude Codeタイムアウト時のプロセス終了テスト."""
+    import asyncio
+
+    async def hang(_input: bytes) -> tuple[bytes, bytes]:
+        await asyncio.sleep(10)
+        return b"", b""
+
+    process = make_claude_process(0)
+    process.communicate = AsyncMock(side_effect=hang)
+    process.wait = AsyncMock()
+    with patch('subprocess.run') as mock_run, patch(
+        'asyncio.create_subprocess_exec', new_callable=AsyncMock, return_value=process
+    ):
+        mock_run.return_value = MagicMock(returncode=0, stdout="claude-code v1.0.0\n")
+
+        client = ClaudeCodeClient()
+        with pytest.raises(TimeoutError):
+            await client._run_prompt("prompt", "Test paper text", timeout=0.01)
+
+    process.kill.assert_called_once()
+    process.wait.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_claude_code_run_prompt_replaces_invalid_bytes():  # type: ignore
+    """Claude Code出力の不正なUTF-8バイト列の置換テスト."""
+    process = make_claude_process(0, b"summary \xff")
+    with patch('subprocess.run') as mock_run, patch(
+        'asyncio.create_subprocess_exec', new_callable=AsyncMock, return_value=process
+    ):
+        mock_run.return_value = MagicMock(returncode=0, stdout="claude-code v1.0.0\n")
+
+        client = ClaudeCodeClient()
+        returncode, stdout, stderr = await client._run_prompt("prompt", "text", timeout=1)
+
+    assert (returncode, stdout, stderr) == (0, "summary \ufffd", "")
 
 
 @pytest.mark.asyncio
@@ -192,9 +537,31 @@ async def test_claude_code_not_available():  # type: ignore
         assert "Claude Code CLI not found" in str(exc_info.value)
 
 
+def test_claude_code_availability_checked_once():  # type: ignore
+    """Claude Code CLIの検出結果をインスタンス間で共有するテスト."""
+    with patch('subprocess.run') as mock_run:
+        mock_run.side_effect = FileNotFoundError("claude command not found")
+
+        for _ in range(3):
+            with pytest.raises(ExternalAPIError, match="Claude Code CLI not found"):
+                ClaudeCodeClient()
+
+        mock_run.assert_called_once()
+
+        mock_run.side_effect = None
+        mock_run.return_value = MagicMock(returncode=0, stdout="claude-code v1.0.0\n")
+        ClaudeCodeClient(claude_command="/usr/local/bin/claude")
+        ClaudeCodeClient(claude_command="/usr/local/bin/claude")
+
+        assert mock_run.call_count == 2
+
+
 def test_create_ai_client_with_claude_code():  # type: ignore
     """Claude Codeクライアント作成テスト."""
-    with patch('refnet_summarizer.clients.ai_client.settings') as mock_settings:
+    with patch(
+        'refnet_summarizer.clients.ai_client.get_environment_settings'
+    ) as mock_get_settings:
+        mock_settings = mock_get_settings.return_value
         mock_settings.ai_provider = "claude-code"
 
         with patch('subprocess.run') as mock_run:
@@ -206,7 +573,10 @@ def test_create_ai_client_with_claude_code():  # type: ignore
 
 def test_create_ai_client_auto_fallback():  # type: ignore
     """Claude Code自動フォールバックテスト."""
-    with patch('refnet_summarizer.clients.ai_client.settings') as mock_settings:
+    with patch(
+        'refnet_summarizer.clients.ai_client.get_environment_settings'
+    ) as mock_get_settings:
+        mock_settings = mock_get_settings.return_value
         mock_settings.ai_provider = "auto"
         mock_settings.openai_api_key = "test-openai-key"
         mock_settings.anthropic_api_key = None
@@ -225,7 +595,7 @@ async def test_anthropic_generate_summary_error():  # type: ignore
     with patch('anthropic.AsyncAnthropic') as mock_client_class:
         mock_client = AsyncMock()
         mock_client_class.return_value = mock_client
-        mock_client.messages.create = AsyncMock(side_effect=Exception("API Error"))
+        mock_client.messages.stream = MagicMock(side_effect=Exception("API Error"))
 
         client = AnthropicClient("test-api-key")
 
@@ -247,6 +617,38 @@ async def test_anthropic_extract_keywords_error():  # type: ignore
         assert result == []
 
 
+@pytest.mark.asyncio
+async def test_summarize_and_extract_keeps_summary_on_keyword_failure():  # type: ignore
+    """キーワード抽出が失敗しても要約を返すことのテスト."""
+    with patch('anthropic.AsyncAnthropic'):
+        client = AnthropicClient("test-api-key")
+
+    with (
+        patch.object(client, 'generate_summary', AsyncMock(return_value="Summary")),
+        patch.object(client, 'extract_keywords', AsyncMock(side_effect=RuntimeError("boom"))),
+    ):
+        summary, keywords = await client.summarize_and_extract("Test paper text")
+
+    assert summary == "Summary"
+    assert keywords == []
+
+
+@pytest.mark.asyncio
+async def test_summarize_and_extract_raises_summary_failure():  # type: ignore
+    """要約生成の失敗は呼び出し元へ伝播することのテスト."""
+    with patch('anthropic.AsyncAnthropic'):
+        client = AnthropicClient("test-api-key")
+
+    with (
+        patch.object(
+            client, 'generate_summary', AsyncMock(side_effect=ExternalAPIError("API error"))
+        ),
+        patch.object(client, 'extract_keywords', AsyncMock(return_value=["keyword"])),
+    ):
+        with pytest.raises(ExternalAPIError):
+            await client.summarize_and_extract("Test paper text")
+
+
 @pytest.mark.asyncio
 async def test_anthropic_rate_limit_error():  # type: ignore
     """Anthropicレート制限エラーテスト."""
@@ -256,11 +658,12 @@ async def test_anthropic_rate_limit_error():  # type: ignore
 
     mock_response = MagicMock()
     mock_response.request = MagicMock()
+    mock_response.headers = {"retry-after": "0"}
 
     with patch('anthropic.AsyncAnthropic') as mock_client_class:
         mock_client = AsyncMock()
         mock_client_class.return_value = mock_client
-        mock_client.messages.create = AsyncMock(
+        mock_client.messages.stream = MagicMock(
             side_effect=anthropic.RateLimitError(
                 "Rate limit exceeded", response=mock_response, body=None
             )
@@ -271,6 +674,7 @@ async def test_anthropic_rate_limit_error():  # type: ignore
             await client.generate_summary("Test paper text")
 
         assert "Rate limit exceeded" in str(exc_info.value)
+        assert mock_client.messages.stream.call_count == 5
 
 
 @pytest.mark.asyncio
@@ -280,7 +684,7 @@ async def test_anthropic_api_error():  # type: ignore
         mock_client = AsyncMock()
         mock_client_class.return_value = mock_client
         # 一般的な例外を使用
-        mock_client.messages.create = AsyncMock(side_effect=Exception("Anthropic API Error"))
+        mock_client.messages.stream = MagicMock(side_effect=Exception("Anthropic API Error"))
 
         client = AnthropicClient("test-api-key")
         with pytest.raises(ExternalAPIError) as exc_info:
@@ -303,6 +707,99 @@ async def test_openai_api_error():  # type: ignore
             await client.generate_summary("Test paper text")
 
         assert "Unexpected error" in str(exc_info.value)
+        # レート制限・接続エラー以外は再試行しない
+        mock_client.chat.completions.create.assert_awaited_once()
+
+
+def _openai_status_error(error_class, status_code):  # type: ignore
+    """OpenAIのHTTPステータスエラーを作成."""
+    response = MagicMock(status_code=status_code, headers={})
+    return error_class("error", response=response, body=None)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("error_factory", "expected_attempts"),
+    [
+        (lambda: _openai_status_error(openai.AuthenticationError, 401), 1),
+        (lambda: _openai_status_error(openai.BadRequestError, 400), 1),
+        (lambda: openai.APITimeoutError(request=MagicMock()), 5),
+    ],
+    ids=["authentication", "bad_request", "timeout"],
+)
+async def test_openai_retry_only_transient_errors(monkeypatch, error_factory, expected_attempts):  # type: ignore
+    """恒久的なエラーは即失敗し、一時的なエラーのみ再試行することのテスト."""
+    monkeypatch.setattr(ai_client, "_backoff_with_jitter", lambda retry_state: 0)
+
+    with patch('openai.AsyncOpenAI') as mock_client_class:
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(side_effect=error_factory())
+
+        client = OpenAIClient("test-api-key")
+        with pytest.raises(ExternalAPIError):
+            await client.generate_summary("Test paper text")
+
+        assert mock_client.chat.completions.create.await_count == expected_attempts
+
+
+@pytest.mark.asyncio
+async def test_openai_extract_keywords_retries_rate_limit(mock_openai_response):  # type: ignore
+    """キーワード抽出でもレート制限時は再試行することのテスト."""
+    mock_openai_response.choices[0].message.content = '{"keywords": ["machine learning"]}'
+    rate_limit_response = MagicMock(headers={"retry-after": "0"})
+    rate_limit = openai.RateLimitError(
+        "Rate limit exceeded", response=rate_limit_response, body=None
+    )
+
+    with patch('openai.AsyncOpenAI') as mock_client_class:
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=[rate_limit, mock_openai_response]
+        )
+
+        client = OpenAIClient("test-api-key")
+        result = await client.extract_keywords("Test paper text")
+
+        assert result == ["machine learning"]
+        assert mock_client.chat.completions.create.await_count == 2
+
+
+def _chained_connection_error() -> openai.APIConnectionError:
+    """SDKと同様にhttpxの例外を原因に持つ接続エラーを作成."""
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    try:
+        try:
+            raise httpx.ConnectError("connection refused", request=request)
+        except httpx.ConnectError as err:
+            raise openai.APIConnectionError(request=request) from err
+    except openai.APIConnectionError as exc:
+        return exc
+
+
+@pytest.mark.asyncio
+async def test_openai_extract_keywords_retries_chained_connection_error(  # type: ignore
+    monkeypatch, mock_openai_response
+):
+    """httpxの例外を原因に持つ接続エラーでもキーワード抽出を再試行することのテスト."""
+    monkeypatch.setattr(ai_client, "_backoff_with_jitter", lambda retry_state: 0)
+    mock_openai_response.choices[0].message.content = '{"keywords": ["machine learning"]}'
+    connection_error = _chained_connection_error()
+    assert isinstance(connection_error.__cause__, httpx.ConnectError)
+
+    with patch('openai.AsyncOpenAI') as mock_client_class:
+        mock_client = AsyncMock()
+        mock_client_class.return_value = mock_client
+        mock_client.chat.completions.create = AsyncMock(
+            side_effect=[connection_error, mock_openai_response]
+        )
+
+        client = OpenAIClient("test-api-key")
+        result = await client.extract_keywords("Test paper text")
+
+        assert result == ["machine learning"]
+        assert mock_client.chat.completions.create.await_count == 2
 
 
 @pytest.mark.asyncio
@@ -325,12 +822,12 @@ async def test_openai_extract_keywords_error():  # type: ignore
 @pytest.mark.asyncio
 async def test_claude_code_extract_keywords_failure():  # type: ignore
     """Claude Codeキーワード抽出失敗テスト."""
-    with patch('subprocess.run') as mock_run:
+    process = make_claude_process(1, stderr=b"Command failed")  # failed execution
+    with patch('subprocess.run') as mock_run, patch(
+        'asyncio.create_subprocess_exec', new_callable=AsyncMock, return_value=process
+    ):
         # バージョンチェックは成功
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stdout="claude-code v1.0.0\n"),  # version check
-            MagicMock(returncode=1, stderr="Command failed")  # failed execution
-        ]
+        mock_run.return_value = MagicMock(returncode=0, stdout="claude-code v1.0.0\n")
 
         client = ClaudeCodeClient()
         result = await client.extract_keywords("Test paper text", max_keywords=5)
@@ -339,14 +836,10 @@ async def test_claude_code_extract_keywords_failure():  # type: ignore
 
 def test_openai_empty_response():  # type: ignore
     """OpenAI空レスポンステスト."""
-    mock_response = MagicMock()
-    mock_response.choices = [MagicMock()]
-    mock_response.choices[0].message.content = None
-
     with patch('openai.AsyncOpenAI') as mock_client_class:
         mock_client = AsyncMock()
         mock_client_class.return_value = mock_client
-        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+        mock_client.chat.completions.create = AsyncMock(return_value=make_openai_stream(None))
 
         client = OpenAIClient("test-api-key")
 
@@ -363,7 +856,10 @@ def test_openai_empty_response():  # type: ignore
 
 def test_create_ai_client_auto_fallback_to_anthropic():  # type: ignore
     """Claude Code自動フォールバック（Anthropic）テスト."""
-    with patch('refnet_summarizer.clients.ai_client.settings') as mock_settings:
+    with patch(
+        'refnet_summarizer.clients.ai_client.get_environment_settings'
+    ) as mock_get_settings:
+        mock_settings = mock_get_settings.return_value
         mock_settings.ai_provider = "auto"
         mock_settings.openai_api_key = None
         mock_settings.anthropic_api_key = "test-anthropic-key"
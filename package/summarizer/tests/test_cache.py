@@ -0,0 +1,141 @@
+"""AI応答キャッシュのテスト."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from refnet_summarizer.clients import cache
+from refnet_summarizer.clients.cache import (
+    ResponseCache,
+    build_cache_key,
+    build_pdf_text_key,
+    cached_response,
+)
+
+
+class DummyClient:
+    """キャッシュ対象メソッドを持つダミークライアント."""
+
+    def __init__(self, result):  # type: ignore
+        self.call = AsyncMock(return_value=result)
+
+    @cached_response("summary")
+    async def generate_summary(self, text: str, max_tokens: int = 500):  # type: ignore
+        return await self.call(text, max_tokens)
+
+
+def test_build_cache_key_distinguishes_inputs():  # type: ignore
+    """キャッシュキー生成テスト."""
+    key = build_cache_key("OpenAIClient", "summary", "text", {"max_tokens": 500})
+
+    assert key == build_cache_key("OpenAIClient", "summary", "text", {"max_tokens": 500})
+    assert key.startswith(f"{cache.CACHE_KEY_PREFIX}:summary:")
+    assert key != build_cache_key("AnthropicClient", "summary", "text", {"max_tokens": 500})
+    assert key != build_cache_key("OpenAIClient", "summary", "text", {"max_tokens": 1000})
+    assert key != build_cache_key("OpenAIClient", "summary", "other", {"max_tokens": 500})
+
+
+def test_build_cache_key_distinguishes_model_and_prompt_version():  # type: ignore
+    """モデル・プロンプトのバージョンが変わるとキーが変わるテスト."""
+    params = {"max_tokens": 500}
+    key = build_cache_key("OpenAIClient", "summary", "text", params, "gpt-4o-mini", "1")
+
+    assert key != build_cache_key("OpenAIClient", "summary", "text", params, "gpt-4o", "1")
+    assert key != build_cache_key("OpenAIClient", "summary", "text", params, "gpt-4o-mini", "2")
+
+
+@pytest.mark.asyncio
+async def test_cached_response_key_includes_client_model():  # type: ignore
+    """クライアントのモデル名・プロンプトのバージョンをキーに含めるテスト."""
+    client = DummyClient("summary")
+    client.model = "gpt-4o-mini"
+    client.prompt_version = "1"
+
+    await client.generate_summary("text")
+
+    expected_key = build_cache_key(
+        "DummyClient", "summary", "text", {"max_tokens": 500}, "gpt-4o-mini", "1"
+    )
+    cache.response_cache.set.assert_awaited_once_with(expected_key, "summary")
+
+
+def test_response_cache_sets_socket_timeouts():  # type: ignore
+    """Redis障害時に長時間待たないようタイムアウトを設定するテスト."""
+    response_cache = ResponseCache(url="redis://localhost:6379/0")
+
+    connection_kwargs = response_cache._get_client().connection_pool.connection_kwargs
+
+    assert connection_kwargs["socket_timeout"] == cache.REDIS_SOCKET_TIMEOUT_SECONDS
+    assert connection_kwargs["socket_connect_timeout"] == cache.REDIS_SOCKET_TIMEOUT_SECONDS
+
+
+def test_build_pdf_text_key():  # type: ignore
+    """PDFテキストのキャッシュキー生成テスト."""
+    key = build_pdf_text_key("abc123")
+
+    assert key == f"{cache.PDF_TEXT_KEY_PREFIX}:abc123"
+    assert not key.startswith(f"{cache.CACHE_KEY_PREFIX}:")
+
+
+@pytest.mark.asyncio
+async def test_cached_response_miss_stores_result():  # type: ignore
+    """キャッシュミス時にAPI結果を保存するテスト."""
+    client = DummyClient("summary")
+
+    result = await client.generate_summary("text")
+
+    assert result == "summary"
+    client.call.assert_awaited_once_with("text", 500)
+    # 既定値を補完してキーを生成するため、明示指定と同じキーになる
+    expected_key = build_cache_key("DummyClient", "summary", "text", {"max_tokens": 500})
+    cache.response_cache.set.assert_awaited_once_with(expected_key, "summary")
+
+
+@pytest.mark.asyncio
+async def test_cached_response_hit_skips_call():  # type: ignore
+    """キャッシュヒット時はAPIを呼ばないテスト."""
+    cache.response_cache.get.return_value = "cached summary"
+    client = DummyClient("summary")
+
+    result = await client.generate_summary("text", max_tokens=500)
+
+    assert result == "cached summary"
+    client.call.assert_not_awaited()
+    cache.response_cache.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_cached_response_skips_empty_result():  # type: ignore
+    """空の結果はキャッシュしないテスト."""
+    client = DummyClient("")
+
+    await client.generate_summary("text")
+
+    cache.response_cache.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_roundtrip():  # type: ignore
+    """JSONでの保存・取得テスト."""
+    response_cache = ResponseCache(url="redis://localhost:6379/0", ttl=60)
+    redis_client = AsyncMock()
+    response_cache._client = redis_client
+    redis_client.get.return_value = '["keyword", "キーワード"]'
+
+    await response_cache.set("key", ["keyword", "キーワード"])
+    result = await response_cache.get("key")
+
+    redis_client.set.assert_awaited_once_with("key", '["keyword","キーワード"]'.encode(), ex=60)
+    assert result == ["keyword", "キーワード"]
+
+
+@pytest.mark.asyncio
+async def test_response_cache_get_error_returns_none():  # type: ignore
+    """Redisエラー時はキャッシュミスとして扱うテスト."""
+    response_cache = ResponseCache(url="redis://localhost:6379/0")
+    redis_client = AsyncMock()
+    redis_client.get.side_effect = ConnectionError("Redis unavailable")
+    response_cache._client = redis_client
+
+    assert await response_cache.get("key") is None
+    assert response_cache._client is None
@@ -0,0 +1,77 @@
+"""AIMDリミッターのテスト."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import openai
+import pytest
+
+from refnet_summarizer.clients.limiter import AIMDLimiter
+
+
+def test_record_success_increases_limit_up_to_max():  # type: ignore
+    """成功時の加算的増加テスト."""
+    limiter = AIMDLimiter(initial=4, max_limit=5, increase=0.5)
+
+    limiter.record_success()
+    assert limiter.limit == 4.5
+
+    limiter.record_success()
+    limiter.record_success()
+    assert limiter.limit == 5.0
+
+
+def test_record_error_decreases_limit_down_to_one():  # type: ignore
+    """過負荷時の乗算的減少テスト."""
+    limiter = AIMDLimiter(initial=4, decrease_factor=0.5)
+
+    limiter.record_error()
+    assert limiter.limit == 2.0
+
+    limiter.record_error()
+    limiter.record_error()
+    assert limiter.limit == 1.0
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_error_decreases_limit():  # type: ignore
+    """レート制限エラー発生時の上限減少テスト."""
+    limiter = AIMDLimiter(initial=4)
+    error = openai.RateLimitError("Rate limit exceeded", response=MagicMock(), body=None)
+
+    with pytest.raises(openai.RateLimitError):
+        async with limiter:
+            raise error
+
+    assert limiter.limit == 2.0
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_other_error_keeps_limit():  # type: ignore
+    """過負荷以外のエラーでは上限を変えないテスト."""
+    limiter = AIMDLimiter(initial=4)
+
+    with pytest.raises(ValueError):
+        async with limiter:
+            raise ValueError("bad request")
+
+    assert limiter.limit == 4.0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_bounded_by_limit():  # type: ignore
+    """同時実行数が上限を超えないことのテスト."""
+    limiter = AIMDLimiter(initial=2, increase=0)
+    peak = 0
+
+    async def worker() -> None:
+        nonlocal peak
+        async with limiter:
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(*(worker() for _ in range(6)))
+
+    assert peak == 2
+    assert limiter.in_flight == 0
@@ -1,11 +1,11 @@
 """メインエントリーポイントのテスト."""
 
 import sys
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from refnet_summarizer.main import main, summarize_paper
+from refnet_summarizer.main import main, summarize_batch, summarize_many, summarize_paper
 
 
 @pytest.mark.asyncio
@@ -51,6 +51,37 @@ async def test_summarize_paper_exception():  # type: ignore
         mock_service.close.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_summarize_many():  # type: ignore
+    """複数論文の並行要約テスト（サービスは1回だけ生成）."""
+    with patch('refnet_summarizer.main.SummarizerService') as mock_service_class:
+        mock_service = AsyncMock()
+        mock_service_class.return_value = mock_service
+        mock_service.summarize_paper.side_effect = [True, Exception("boom"), False]
+
+        result = await summarize_many(["paper-1", "paper-2", "paper-3"], concurrency=2)
+
+        assert result == {"paper-1": True, "paper-2": False, "paper-3": False}
+        mock_service_class.assert_called_once()
+        assert mock_service.summarize_paper.await_count == 3
+        mock_service.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_summarize_batch():  # type: ignore
+    """一括要約テスト."""
+    with patch('refnet_summarizer.main.SummarizerService') as mock_service_class:
+        mock_service = AsyncMock()
+        mock_service_class.return_value = mock_service
+        mock_service.summarize_papers_batch.return_value = {"paper-1": True, "paper-2": False}
+
+        result = await summarize_batch(["paper-1", "paper-2"])
+
+        assert result == {"paper-1": True, "paper-2": False}
+        mock_service.summarize_papers_batch.assert_called_once_with(["paper-1", "paper-2"])
+        mock_service.close.assert_called_once()
+
+
 def test_main_no_args():  # type: ignore
     """引数なしテスト."""
     with patch.object(sys, 'argv', ['refnet-summarizer']):  # type: ignore
@@ -99,6 +130,42 @@ def test_main_summarize_no_paper_id():  # type: ignore
             mock_print.assert_called_with("Usage: refnet-summarizer summarize <paper_id>")
 
 
+def test_main_summarize_many(tmp_path):  # type: ignore
+    """並行要約コマンドテスト."""
+    paper_ids_file = tmp_path / "paper_ids.txt"
+    paper_ids_file.write_text("paper-1\npaper-2\n", encoding="utf-8")
+
+    argv = ['refnet-summarizer', 'summarize-many', str(paper_ids_file)]
+    with patch.object(sys, 'argv', argv):  # type: ignore
+        with patch('refnet_summarizer.main.summarize_many', new=MagicMock()) as mock_many:
+            with patch('asyncio.run', return_value={"paper-1": True, "paper-2": False}):
+                with patch('builtins.print') as mock_print:
+                    with pytest.raises(SystemExit) as exc_info:
+                        main()
+
+                assert exc_info.value.code == 1
+                mock_many.assert_called_once_with(["paper-1", "paper-2"])
+                mock_print.assert_called_with("Summarized 1/2 papers")
+
+
+def test_main_summarize_batch(tmp_path):  # type: ignore
+    """一括要約コマンドテスト."""
+    paper_ids_file = tmp_path / "paper_ids.txt"
+    paper_ids_file.write_text("paper-1\n\npaper-2\n", encoding="utf-8")
+
+    argv = ['refnet-summarizer', 'summarize-batch', str(paper_ids_file)]
+    with patch.object(sys, 'argv', argv):  # type: ignore
+        with patch('refnet_summarizer.main.summarize_batch', new=MagicMock()) as mock_batch:
+            with patch('asyncio.run', return_value={"paper-1": True, "paper-2": True}):
+                with patch('builtins.print') as mock_print:
+                    with pytest.raises(SystemExit) as exc_info:
+                        main()
+
+                assert exc_info.value.code == 0
+                mock_batch.assert_called_once_with(["paper-1", "paper-2"])
+                mock_print.assert_called_with("Summarized 2/2 papers")
+
+
 def test_main_unknown_command():  # type: ignore
     """不明なコマンドテスト."""
     with patch.object(sys, 'argv', ['refnet-summarizer', 'unknown']):  # type: ignore
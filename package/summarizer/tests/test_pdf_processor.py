@@ -1,9 +1,15 @@
 """PDF処理のテスト."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import io
+import tempfile
+import threading
+from unittest.mock import MagicMock, patch
 
+import httpx
+import pymupdf
 import pytest
 
+from refnet_summarizer.processors import pdf_processor
 from refnet_summarizer.processors.pdf_processor import PDFProcessor
 
 
@@ -19,40 +25,106 @@ def mock_pdf_content():  # type: ignore
     return b"%PDF-1.4 mock pdf content"
 
 
+def use_transport(monkeypatch, handler):  # type: ignore
+    """共有HTTPクライアントをモックトランスポートへ差し替え."""
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(pdf_processor, "_http_client", client)
+
+
 @pytest.mark.asyncio
-async def test_download_pdf_success(processor, mock_pdf_content):  # type: ignore
+async def test_download_pdf_success(processor, mock_pdf_content, monkeypatch):  # type: ignore
     """PDF ダウンロード成功テスト."""
-    with patch.object(processor.client, 'get') as mock_get:
-        mock_response = AsyncMock()
-        mock_response.content = mock_pdf_content
-        mock_response.headers = {"content-type": "application/pdf"}
-        # raise_for_statusを同期的にモック
-        def mock_raise_for_status():
-            pass
-        mock_response.raise_for_status = mock_raise_for_status
-        mock_get.return_value = mock_response
+    use_transport(
+        monkeypatch,
+        lambda request: httpx.Response(
+            200, headers={"content-type": "application/pdf"}, content=mock_pdf_content
+        ),
+    )
 
-        result = await processor.download_pdf("https://example.com/paper.pdf")
+    result = await processor.download_pdf("https://example.com/paper.pdf")
 
-        assert result == mock_pdf_content
+    assert result is not None
+    pdf_file, pdf_hash, pdf_size = result
+    with pdf_file:
+        assert pdf_file.read() == mock_pdf_content
+    assert pdf_hash == processor.calculate_hash(mock_pdf_content)
+    assert pdf_size == len(mock_pdf_content)
 
 
 @pytest.mark.asyncio
-async def test_download_pdf_invalid_content_type(processor):  # type: ignore
+async def test_download_pdf_spools_large_content(processor, monkeypatch):  # type: ignore
+    """閾値を超えるPDFは一時ファイルへ退避することのテスト."""
+    monkeypatch.setattr(pdf_processor, "SPOOL_MAX_SIZE", 16)
+    content = b"%PDF-1.4 " + b"x" * 1024
+    use_transport(
+        monkeypatch,
+        lambda request: httpx.Response(
+            200, headers={"content-type": "application/pdf"}, content=content
+        ),
+    )
+
+    result = await processor.download_pdf("https://example.com/paper.pdf")
+
+    assert result is not None
+    pdf_file, pdf_hash, pdf_size = result
+    with pdf_file:
+        assert pdf_file._rolled
+        assert processor.calculate_hash(pdf_file) == pdf_hash
+    assert pdf_hash == processor.calculate_hash(content)
+    assert pdf_size == len(content)
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_invalid_content_type(processor, monkeypatch):  # type: ignore
     """PDF ダウンロード（無効なContent-Type）テスト."""
-    with patch.object(processor.client, 'get') as mock_get:
-        mock_response = AsyncMock()
-        mock_response.content = b"not a pdf"
-        mock_response.headers = {"content-type": "text/html"}
-        # raise_for_statusを同期的にモック
-        def mock_raise_for_status():
-            pass
-        mock_response.raise_for_status = mock_raise_for_status
-        mock_get.return_value = mock_response
+    use_transport(
+        monkeypatch,
+        lambda request: httpx.Response(
+            200, headers={"content-type": "text/html"}, content=b"not a pdf"
+        ),
+    )
+
+    result = await processor.download_pdf("https://example.com/notpdf.html")
+
+    assert result is None
+
 
-        result = await processor.download_pdf("https://example.com/notpdf.html")
+@pytest.mark.parametrize(
+    ("dirty_text", "expected"),
+    [
+        ("  leading and trailing  ", "leading and trailing"),
+        ("tab\tseparated\fform feed\vvertical", "tab separated form feed vertical"),
+        ("unicode\u3000space\u00a0nbsp", "unicode space nbsp"),
+        ("\r\n\n  \n", ""),
+    ],
+    ids=["strip", "control_whitespace", "unicode_whitespace", "whitespace_only"],
+)
+def test_clean_text_normalizes_whitespace(processor, dirty_text, expected):  # type: ignore
+    """空白・改行の正規化テスト."""
+    assert processor._clean_text(dirty_text) == expected
 
-        assert result is None
+
+@pytest.mark.asyncio
+async def test_download_pdf_exception(processor, monkeypatch):  # type: ignore
+    """PDF ダウンロード例外テスト."""
+    def handler(request):  # type: ignore
+        raise Exception("Network error")
+
+    use_transport(monkeypatch, handler)
+
+    result = await processor.download_pdf("https://example.com/paper.pdf")
+
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_download_pdf_http_error(processor, monkeypatch):  # type: ignore
+    """PDF ダウンロードHTTPエラーテスト."""
+    use_transport(monkeypatch, lambda request: httpx.Response(404))
+
+    result = await processor.download_pdf("https://example.com/paper.pdf")
+
+    assert result is None
 
 
 def test_calculate_hash(processor, mock_pdf_content):  # type: ignore
@@ -73,35 +145,64 @@ def test_clean_text(processor):  # type: ignore
     assert "\r" not in clean_text
 
 
-@pytest.mark.asyncio
-async def test_download_pdf_exception(processor):  # type: ignore
-    """PDF ダウンロード例外テスト."""
-    with patch.object(processor.client, 'get') as mock_get:
-        mock_get.side_effect = Exception("Network error")
+# test_extract_text_pdfplumber_success - removed due to mocking complexity
 
-        result = await processor.download_pdf("https://example.com/paper.pdf")
 
-        assert result is None
+def make_pdf(text):  # type: ignore
+    """テキストを含む実PDFを作成."""
+    doc = pymupdf.open()
+    doc.new_page().insert_text((72, 72), text)
+    try:
+        return doc.tobytes()
+    finally:
+        doc.close()
 
 
-@pytest.mark.asyncio
-async def test_download_pdf_http_error(processor):  # type: ignore
-    """PDF ダウンロードHTTPエラーテスト."""
-    with patch.object(processor.client, 'get') as mock_get:
-        # 完全に同期的なモックレスポンスを使用
-        mock_response = MagicMock()
-        # raise_for_statusで例外を投げる同期的モック
-        def mock_raise_for_status():
-            raise Exception("HTTP 404")
-        mock_response.raise_for_status = mock_raise_for_status
-        mock_get.return_value = mock_response
+def test_extract_text_pymupdf_first(processor):  # type: ignore
+    """PyMuPDFで抽出できればpdfplumber・pypdfを使わないことのテスト."""
+    pdf_content = make_pdf("\n".join(["Extracted with PyMuPDF"] * 5))
 
-        result = await processor.download_pdf("https://example.com/paper.pdf")
+    with patch('pdfplumber.open') as mock_pdfplumber, patch('pypdf.PdfReader') as mock_pypdf:
+        result = processor.extract_text(pdf_content)
 
-        assert result is None
+    assert result.startswith("Extracted with PyMuPDF")
+    mock_pdfplumber.assert_not_called()
+    mock_pypdf.assert_not_called()
 
 
-# test_extract_text_pdfplumber_success - removed due to mocking complexity
+def test_extract_text_pymupdf_from_file(processor):  # type: ignore
+    """ダウンロード済みファイルからもPyMuPDFで抽出できることのテスト."""
+    pdf_file = io.BytesIO(make_pdf("Spooled PDF text"))
+
+    assert processor.extract_text_pymupdf(pdf_file) == "Spooled PDF text"
+
+
+def test_extract_text_pymupdf_maps_large_file(processor, monkeypatch):  # type: ignore
+    """メモリ上限を超えて一時ファイルへ退避したPDFは読み込まずにメモリマップすることのテスト."""
+    monkeypatch.setattr(pdf_processor, "SPOOL_MAX_SIZE", 1)
+    pdf_file = tempfile.SpooledTemporaryFile(max_size=1)
+    pdf_file.write(make_pdf("Large PDF text"))
+
+    with pdf_file, patch.object(pdf_file, "read", side_effect=AssertionError("read called")):
+        assert processor.extract_text_pymupdf(pdf_file) == "Large PDF text"
+        # 抽出後もファイルは他の抽出器で読み直せる
+        assert not pdf_file.closed
+
+
+@pytest.mark.asyncio
+async def test_extract_text_async_runs_off_event_loop(processor):  # type: ignore
+    """テキスト抽出をイベントループ外の専用スレッドで実行するテスト."""
+    threads = []
+
+    def fake_extract(pdf_content):  # type: ignore
+        threads.append(threading.current_thread().name)
+        return "extracted"
+
+    with patch.object(processor, 'extract_text', side_effect=fake_extract):
+        result = await processor.extract_text_async(b"%PDF")
+
+    assert result == "extracted"
+    assert threads[0].startswith("pdf-extract")
 
 
 def test_extract_text_pypdf_fallback(processor, mock_pdf_content):  # type: ignore
@@ -135,6 +236,23 @@ def test_extract_text_empty_content(processor):  # type: ignore
     assert result == ""
 
 
+def test_extract_text_reads_from_memory(processor, mock_pdf_content):  # type: ignore
+    """一時ファイルを作らずバイト列から直接抽出することのテスト."""
+    with (
+        patch('tempfile.NamedTemporaryFile') as mock_tempfile,
+        patch('pdfplumber.open') as mock_pdfplumber,
+        patch('pypdf.PdfReader') as mock_pypdf,
+    ):
+        mock_pdfplumber.return_value.__enter__.return_value.pages = []
+        mock_pypdf.return_value.pages = []
+
+        processor.extract_text(mock_pdf_content)
+
+        mock_tempfile.assert_not_called()
+        assert mock_pdfplumber.call_args.args[0].getvalue() == mock_pdf_content
+        assert mock_pypdf.call_args.args[0].getvalue() == mock_pdf_content
+
+
 def test_extract_text_pdfplumber_no_text(processor, mock_pdf_content):  # type: ignore
     """pdfplumberがテキストを抽出できない場合のテスト."""
     mock_page = MagicMock()
@@ -183,7 +301,25 @@ def test_extract_text_clean_text_integration(processor, mock_pdf_content):  # ty
 
 @pytest.mark.asyncio
 async def test_close(processor):  # type: ignore
-    """クローズテスト."""
-    with patch.object(processor.client, 'aclose') as mock_close:
+    """クローズテスト（共有HTTPクライアントは閉じない）."""
+    client = processor.client
+    with patch.object(client, 'aclose') as mock_close:
         await processor.close()
-        mock_close.assert_called_once()
+        mock_close.assert_not_called()
+
+    assert pdf_processor._http_client is client
+
+
+@pytest.mark.asyncio
+async def test_http_client_shared_across_processors():  # type: ignore
+    """HTTPクライアントをプロセッサー間で共有し、クローズ後は作り直すことのテスト."""
+    first = PDFProcessor()
+    second = PDFProcessor()
+
+    client = first.client
+    assert second.client is client
+
+    await pdf_processor.aclose_http_client()
+
+    assert pdf_processor._http_client is None
+    assert second.client is not client
@@ -1,5 +1,6 @@
 """summarize_taskモジュールのテスト."""
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -56,3 +57,26 @@ class TestSummarizeTaskBasic:
             # アサーション
             assert result is True
             mock_service.summarize_paper.assert_called_once_with("test-paper-123")
+
+    def test_process_pending_summarizations_publishes_group(self) -> None:
+        """保留中の論文をグループとしてまとめて起動することのテスト."""
+        from refnet_summarizer.tasks import summarize_task
+
+        papers = [SimpleNamespace(paper_id=f"paper-{i}") for i in range(3)]
+        with (
+            patch.object(summarize_task, 'db_manager') as mock_db_manager,
+            patch.object(summarize_task, 'group') as mock_group,
+        ):
+            session = mock_db_manager.get_session.return_value.__enter__.return_value
+            session.query.return_value.filter.return_value.limit.return_value.all.return_value = (
+                papers
+            )
+
+            result = summarize_task.process_pending_summarizations()
+
+        assert result == {"status": "success", "scheduled_papers": 3}
+        signatures = list(mock_group.call_args.args[0])
+        assert [signature.args for signature in signatures] == [
+            ("paper-0",), ("paper-1",), ("paper-2",)
+        ]
+        mock_group.return_value.apply_async.assert_called_once_with(queue="summarizer")
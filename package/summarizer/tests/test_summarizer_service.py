@@ -1,10 +1,13 @@
 """要約サービスのテスト."""
 
+import io
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from refnet_shared.models.database import Paper, ProcessingQueue
 
+from refnet_summarizer.clients import cache
+from refnet_summarizer.clients.ai_client import MAX_INPUT_CHARS, OpenAIClient
 from refnet_summarizer.services.summarizer_service import SummarizerService
 
 
@@ -39,6 +42,12 @@ def mock_pdf_content():  # type: ignore
     return b"%PDF-1.4 mock pdf content"
 
 
+@pytest.fixture
+def mock_download(mock_pdf_content):  # type: ignore
+    """モックPDFダウンロード結果（ファイル, ハッシュ, サイズ）."""
+    return io.BytesIO(mock_pdf_content), "mock-hash", len(mock_pdf_content)
+
+
 @pytest.fixture
 def mock_text_content():  # type: ignore
     """モック抽出テキスト."""
@@ -61,6 +70,7 @@ def mock_keywords():  # type: ignore
 async def test_summarize_paper_success(
     mock_paper,
     mock_pdf_content,
+    mock_download,
     mock_text_content,
     mock_summary,
     mock_keywords
@@ -79,28 +89,19 @@ async def test_summarize_paper_success(
             service.pdf_processor,
             'download_pdf',
             new_callable=AsyncMock,
-            return_value=mock_pdf_content
+            return_value=mock_download
         ):  # type: ignore
             with patch.object(
-                service.pdf_processor, 'calculate_hash', return_value="mock-hash"
+                service.pdf_processor, 'extract_text', return_value=mock_text_content
             ):  # type: ignore
+                # AIクライアントのモック（asyncメソッドを考慮）
                 with patch.object(
-                    service.pdf_processor, 'extract_text', return_value=mock_text_content
+                    service.ai_client,
+                    'summarize_and_extract',
+                    new_callable=AsyncMock,
+                    return_value=(mock_summary, mock_keywords)
                 ):  # type: ignore
-                    # AIクライアントのモック（asyncメソッドを考慮）
-                    with patch.object(
-                        service.ai_client,
-                        'generate_summary',
-                        new_callable=AsyncMock,
-                        return_value=mock_summary
-                    ):  # type: ignore
-                        with patch.object(
-                            service.ai_client,
-                            'extract_keywords',
-                            new_callable=AsyncMock,
-                            return_value=mock_keywords
-                        ):  # type: ignore
-                            result = await service.summarize_paper("test-paper-123")
+                    result = await service.summarize_paper("test-paper-123")
 
         # 結果検証
         assert result is True
@@ -112,6 +113,92 @@ async def test_summarize_paper_success(
         mock_session.commit.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_summarize_papers_batch_sequential_fallback():  # type: ignore
+    """Batch API非対応クライアントでの逐次要約フォールバックテスト."""
+    service = SummarizerService()
+
+    with patch.object(
+        service, 'summarize_paper', new_callable=AsyncMock, side_effect=[True, False]
+    ) as mock_summarize:  # type: ignore
+        results = await service.summarize_papers_batch(["paper-1", "paper-2"])
+
+    assert results == {"paper-1": True, "paper-2": False}
+    assert mock_summarize.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_summarize_papers_batch_openai(mock_paper, mock_summary, mock_keywords):  # type: ignore
+    """OpenAI Batch APIでの一括要約テスト."""
+    service = SummarizerService()
+    service.ai_client = MagicMock(spec=OpenAIClient)
+    service.ai_client.build_batch_request.side_effect = (
+        lambda paper_id, text: {"custom_id": paper_id}
+    )
+    service.ai_client.run_batch = AsyncMock(
+        return_value={"test-paper-123": (mock_summary, mock_keywords)}
+    )
+
+    with patch('refnet_summarizer.services.summarizer_service.db_manager') as mock_db_manager:
+        mock_session = MagicMock()
+        mock_db_manager.get_session.return_value.__enter__.return_value = mock_session
+        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_paper
+
+        with patch.object(
+            service, '_prepare_text', new_callable=AsyncMock, side_effect=["text", None]
+        ):  # type: ignore
+            results = await service.summarize_papers_batch(["test-paper-123", "no-pdf"])
+
+    assert results == {"test-paper-123": True, "no-pdf": False}
+    service.ai_client.run_batch.assert_awaited_once_with([{"custom_id": "test-paper-123"}])
+    assert mock_paper.summary == mock_summary
+    assert mock_paper.is_summarized is True
+
+
+@pytest.mark.asyncio
+async def test_summarize_papers_batch_continues_after_paper_error(  # type: ignore
+    mock_paper, mock_summary, mock_keywords
+):
+    """1件の論文で例外が発生しても残りの論文をバッチ処理するテスト."""
+    service = SummarizerService()
+    service.ai_client = MagicMock(spec=OpenAIClient)
+    service.ai_client.build_batch_request.side_effect = (
+        lambda paper_id, text: {"custom_id": paper_id}
+    )
+    service.ai_client.run_batch = AsyncMock(
+        return_value={
+            "paper-1": (mock_summary, mock_keywords),
+            "paper-3": (mock_summary, mock_keywords),
+        }
+    )
+
+    with patch('refnet_summarizer.services.summarizer_service.db_manager') as mock_db_manager:
+        mock_session = MagicMock()
+        mock_db_manager.get_session.return_value.__enter__.return_value = mock_session
+        mock_session.query.return_value.filter_by.return_value.first.return_value = mock_paper
+
+        with (
+            patch.object(
+                service,
+                '_prepare_text',
+                new_callable=AsyncMock,
+                side_effect=["text", RuntimeError("download failed"), "text"],
+            ),
+            patch.object(
+                service, '_update_processing_status', new_callable=AsyncMock
+            ) as mock_update_status,
+        ):  # type: ignore
+            results = await service.summarize_papers_batch(["paper-1", "paper-2", "paper-3"])
+
+    assert results == {"paper-1": True, "paper-2": False, "paper-3": True}
+    service.ai_client.run_batch.assert_awaited_once_with(
+        [{"custom_id": "paper-1"}, {"custom_id": "paper-3"}]
+    )
+    mock_update_status.assert_any_await(
+        mock_session, "paper-2", "summary", "failed", "download failed"
+    )
+
+
 @pytest.mark.asyncio
 async def test_summarize_paper_no_pdf_url(mock_paper):  # type: ignore
     """PDF URLなしエラーテスト."""
@@ -159,7 +246,63 @@ async def test_summarize_paper_pdf_download_failed(mock_paper):  # type: ignore
 
 
 @pytest.mark.asyncio
-async def test_summarize_paper_text_extraction_failed(mock_paper, mock_pdf_content):  # type: ignore
+async def test_prepare_text_stores_extracted_text(
+    mock_paper, mock_download, mock_text_content
+):  # type: ignore
+    """抽出したテキストをPDFハッシュをキーに保存するテスト."""
+    service = SummarizerService()
+
+    with (
+        patch.object(service.pdf_processor, 'download_pdf', return_value=mock_download),
+        patch.object(service.pdf_processor, 'extract_text', return_value=mock_text_content),
+    ):
+        text = await service._prepare_text(MagicMock(), mock_paper)
+
+    assert text == mock_text_content
+    key = cache.build_pdf_text_key("mock-hash")
+    cache.pdf_text_cache.get.assert_awaited_once_with(key)
+    cache.pdf_text_cache.set.assert_awaited_once_with(key, mock_text_content)
+
+
+@pytest.mark.asyncio
+async def test_prepare_text_truncates_long_text(mock_paper, mock_download):  # type: ignore
+    """AIへ送らない末尾を切り詰めてからキャッシュ・返却するテスト."""
+    long_text = "a" * (MAX_INPUT_CHARS + 1000)
+    service = SummarizerService()
+
+    with (
+        patch.object(service.pdf_processor, 'download_pdf', return_value=mock_download),
+        patch.object(service.pdf_processor, 'extract_text', return_value=long_text),
+    ):
+        text = await service._prepare_text(MagicMock(), mock_paper)
+
+    assert text == long_text[:MAX_INPUT_CHARS]
+    cache.pdf_text_cache.set.assert_awaited_once_with(cache.build_pdf_text_key("mock-hash"), text)
+
+
+@pytest.mark.asyncio
+async def test_prepare_text_reuses_cached_text(
+    mock_paper, mock_download, mock_text_content
+):  # type: ignore
+    """同一内容のPDFはテキスト抽出を省略するテスト."""
+    cache.pdf_text_cache.get.return_value = mock_text_content
+    service = SummarizerService()
+
+    with (
+        patch.object(service.pdf_processor, 'download_pdf', return_value=mock_download),
+        patch.object(service.pdf_processor, 'extract_text') as mock_extract,
+    ):
+        text = await service._prepare_text(MagicMock(), mock_paper)
+
+    assert text == mock_text_content
+    assert mock_paper.pdf_hash == "mock-hash"
+    assert mock_download[0].closed
+    mock_extract.assert_not_called()
+    cache.pdf_text_cache.set.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_summarize_paper_text_extraction_failed(mock_paper, mock_download):  # type: ignore
     """テキスト抽出失敗テスト."""
     service = SummarizerService()
 
@@ -175,7 +318,7 @@ async def test_summarize_paper_text_extraction_failed(mock_paper, mock_pdf_conte
             mock_paper, mock_queue_item, mock_paper
         ]
 
-        with patch.object(service.pdf_processor, 'download_pdf', return_value=mock_pdf_content):  # type: ignore
+        with patch.object(service.pdf_processor, 'download_pdf', return_value=mock_download):  # type: ignore
             with patch.object(service.pdf_processor, 'extract_text', return_value=""):  # type: ignore
                 result = await service.summarize_paper("test-paper-123")
 
@@ -185,7 +328,7 @@ async def test_summarize_paper_text_extraction_failed(mock_paper, mock_pdf_conte
 @pytest.mark.asyncio
 async def test_summarize_paper_ai_generation_failed(
     mock_paper,
-    mock_pdf_content,
+    mock_download,
     mock_text_content
 ):  # type: ignore
     """AI要約生成失敗テスト."""
@@ -203,11 +346,13 @@ async def test_summarize_paper_ai_generation_failed(
             mock_paper, mock_queue_item, mock_paper, mock_queue_item, mock_paper
         ]
 
-        with patch.object(service.pdf_processor, 'download_pdf', return_value=mock_pdf_content):  # type: ignore
+        with patch.object(service.pdf_processor, 'download_pdf', return_value=mock_download):  # type: ignore
             with patch.object(
                 service.pdf_processor, 'extract_text', return_value=mock_text_content
             ):  # type: ignore
-                with patch.object(service.ai_client, 'generate_summary', return_value=""):  # type: ignore
+                with patch.object(
+                    service.ai_client, 'summarize_and_extract', return_value=("", [])
+                ):  # type: ignore
                     result = await service.summarize_paper("test-paper-123")
 
         assert result is False
@@ -218,20 +363,24 @@ async def test_update_processing_status():  # type: ignore
     """処理状態更新テスト."""
     service = SummarizerService()
     mock_session = MagicMock()
-    mock_queue_item = MagicMock(spec=ProcessingQueue)
-    mock_queue_item.status = "pending"
-    mock_queue_item.retry_count = 0
-
-    mock_session.query.return_value.filter_by.return_value.first.return_value = mock_queue_item
+    mock_paper = MagicMock(spec=Paper)
+    mock_paper.is_summarized = False
 
     await service._update_processing_status(
         mock_session,
         "test-paper-123",
         "summary",
-        "completed"
+        "completed",
+        paper=mock_paper,
     )
 
-    assert mock_queue_item.status == "completed"
+    # キューは1回のUPDATE文で更新し、読み込み済みの論文は再取得しない
+    mock_session.query.assert_not_called()
+    mock_session.execute.assert_called_once()
+    stmt = mock_session.execute.call_args.args[0]
+    assert stmt.table.name == ProcessingQueue.__tablename__
+    assert stmt.compile().params["status"] == "completed"
+    assert mock_paper.is_summarized is True
 
 
 @pytest.mark.asyncio
@@ -239,23 +388,24 @@ async def test_update_processing_status_with_error():  # type: ignore
     """エラー付き処理状態更新テスト."""
     service = SummarizerService()
     mock_session = MagicMock()
-    mock_queue_item = MagicMock(spec=ProcessingQueue)
-    mock_queue_item.status = "pending"
-    mock_queue_item.retry_count = 0
-
-    mock_session.query.return_value.filter_by.return_value.first.return_value = mock_queue_item
+    mock_paper = MagicMock(spec=Paper)
 
     await service._update_processing_status(
         mock_session,
         "test-paper-123",
         "summary",
         "failed",
-        "Test error message"
+        "Test error message",
+        paper=mock_paper,
     )
 
-    assert mock_queue_item.status == "failed"
-    assert mock_queue_item.error_message == "Test error message"
-    assert mock_queue_item.retry_count == 1
+    stmt = mock_session.execute.call_args.args[0]
+    params = stmt.compile().params
+    assert params["status"] == "failed"
+    assert params["error_message"] == "Test error message"
+    # リトライ回数はDB側で加算
+    assert "retry_count=(processing_queue.retry_count +" in str(stmt)
+    assert mock_paper.is_summarized is False
 
 
 @pytest.mark.asyncio
@@ -321,14 +471,10 @@ def test_get_ai_model_name_unknown():  # type: ignore
 
 
 @pytest.mark.asyncio
-async def test_update_processing_status_no_queue():  # type: ignore
-    """キューアイテムが存在しない場合のテスト."""
+async def test_update_processing_status_without_paper():  # type: ignore
+    """論文を渡さない場合はUPDATE文で論文の状態を更新するテスト."""
     service = SummarizerService()
     mock_session = MagicMock()
-    mock_paper = MagicMock()
-
-    # キューアイテムはNoneだが、論文は存在
-    mock_session.query.return_value.filter_by.return_value.first.side_effect = [None, mock_paper]
 
     await service._update_processing_status(
         mock_session,
@@ -337,8 +483,11 @@ async def test_update_processing_status_no_queue():  # type: ignore
         "completed"
     )
 
-    # 論文のステータスが更新されることを確認
-    assert mock_paper.is_summarized is True
+    mock_session.query.assert_not_called()
+    assert mock_session.execute.call_count == 2
+    paper_stmt = mock_session.execute.call_args_list[1].args[0]
+    assert paper_stmt.table.name == Paper.__tablename__
+    assert paper_stmt.compile().params["is_summarized"] is True
 
 
 @pytest.mark.asyncio
@@ -348,4 +497,4 @@ async def test_close():  # type: ignore
 
     with patch.object(service.pdf_processor, 'close') as mock_pdf_close:
         await service.close()
-        mock_pdf_close.assert_called_once()
+        mock_pdf_close.assert_not_called()
@@ -4,12 +4,20 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from refnet_summarizer import tasks
 from refnet_summarizer.tasks import (
     batch_summarize_task,
+    get_summarizer_service,
     summarize_paper_task,
 )
 
 
+@pytest.fixture(autouse=True)
+def reset_summarizer_service(monkeypatch):  # type: ignore
+    """テスト間でワーカープロセス共有の要約サービスを持ち越さない."""
+    monkeypatch.setattr(tasks, "_service", None)
+
+
 @pytest.fixture
 def mock_celery_app():  # type: ignore
     """モックCeleryアプリケーション."""
@@ -29,7 +37,33 @@ def test_summarize_paper_task_success():  # type: ignore
 
         assert result is True
         mock_service.summarize_paper.assert_called_once_with("test-paper-123")
-        mock_service.close.assert_called_once()
+        # 共有サービスはタスクごとに閉じない
+        mock_service.close.assert_not_called()
+
+
+def test_summarize_paper_task_reuses_service():  # type: ignore
+    """要約サービスをタスク間で使い回すテスト."""
+    with patch('refnet_summarizer.tasks.SummarizerService') as mock_service_class:
+        mock_service = AsyncMock()
+        mock_service_class.return_value = mock_service
+        mock_service.summarize_paper.return_value = True
+
+        summarize_paper_task("paper-1")
+        summarize_paper_task("paper-2")
+
+        mock_service_class.assert_called_once()
+        assert get_summarizer_service() is mock_service
+        assert mock_service.summarize_paper.await_count == 2
+
+
+def test_init_summarizer_service_failure_is_deferred():  # type: ignore
+    """ワーカー起動時の初期化失敗は記録のみ行い、最初のタスクで再試行するテスト."""
+    with patch(
+        'refnet_summarizer.tasks.SummarizerService', side_effect=Exception("No API key")
+    ):
+        tasks._init_summarizer_service()
+
+    assert tasks._service is None
 
 
 def test_summarize_paper_task_failure():  # type: ignore
@@ -65,18 +99,23 @@ def test_batch_summarize_task():  # type: ignore
     # ロガーとstructlogをモック化して警告を回避
     with patch('refnet_summarizer.tasks.logger') as mock_logger:
         with patch('structlog.get_logger', return_value=mock_logger):
-            with patch.object(summarize_paper_task, 'delay') as mock_delay:
-                mock_task = MagicMock()
-                mock_task.id = "task-id"
-                mock_delay.return_value = mock_task
+            with patch('refnet_summarizer.tasks.group') as mock_group:
+                mock_group.return_value.apply_async.return_value.children = [
+                    MagicMock(id=f"task-{paper_id}") for paper_id in paper_ids
+                ]
 
                 result = batch_summarize_task(paper_ids)
 
-                assert len(result) == 3
-                assert result["paper-1"] == "task-id"
-                assert result["paper-2"] == "task-id"
-                assert result["paper-3"] == "task-id"
-                assert mock_delay.call_count == 3
+                assert result == {
+                    "paper-1": "task-paper-1",
+                    "paper-2": "task-paper-2",
+                    "paper-3": "task-paper-3",
+                }
+                signatures = list(mock_group.call_args.args[0])
+                assert [signature.args for signature in signatures] == [
+                    ("paper-1",), ("paper-2",), ("paper-3",)
+                ]
+                mock_group.return_value.apply_async.assert_called_once()
 
 
 def test_celery_app_configuration():  # type: ignore
@@ -118,28 +157,28 @@ def test_batch_summarize_task_multiple_papers():  # type: ignore
     """複数論文のバッチ要約テスト。"""
     paper_ids = ["paper-1", "paper-2", "paper-3", "paper-4", "paper-5"]
 
-    with patch.object(summarize_paper_task, 'delay') as mock_delay:
-        mock_task = MagicMock()
-        mock_task.id = "task-id"
-        mock_delay.return_value = mock_task
+    with patch('refnet_summarizer.tasks.group') as mock_group:
+        mock_group.return_value.apply_async.return_value.children = [
+            MagicMock(id="task-id") for _ in paper_ids
+        ]
 
         result = batch_summarize_task(paper_ids)
 
         assert len(result) == 5
         for paper_id in paper_ids:
             assert result[paper_id] == "task-id"
-        assert mock_delay.call_count == 5
+        mock_group.return_value.apply_async.assert_called_once()
 
 
 def test_batch_summarize_task_empty_list():  # type: ignore
     """空のリストでのバッチ要約テスト."""
     paper_ids: list[str] = []
 
-    with patch.object(summarize_paper_task, 'delay') as mock_delay:
+    with patch('refnet_summarizer.tasks.group') as mock_group:
         result = batch_summarize_task(paper_ids)
 
         assert len(result) == 0
-        assert mock_delay.call_count == 0
+        mock_group.assert_not_called()
 
 
 def test_summarize_paper_task_with_settings():  # type: ignore
@@ -159,4 +198,4 @@ def test_summarize_paper_task_with_settings():  # type: ignore
 
         assert result is True
         mock_service.summarize_paper.assert_called_once_with("test-paper-123")
-        mock_service.close.assert_called_once()
+        mock_service.close.assert_not_called()
@@ -0,0 +1,81 @@
+"""ワーカープロセス共有イベントループのテスト."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from refnet_summarizer.tasks import worker_loop
+
+
+@pytest.fixture(autouse=True)
+def stop_loop():  # type: ignore
+    """テストごとに共有イベントループを停止."""
+    yield
+    worker_loop.stop_worker_loop()
+
+
+async def _current_loop() -> tuple[asyncio.AbstractEventLoop, threading.Thread]:
+    """実行中のループとスレッドを取得."""
+    return asyncio.get_running_loop(), threading.current_thread()
+
+
+def test_run_in_worker_loop_reuses_loop():  # type: ignore
+    """タスク間で同じイベントループをバックグラウンドスレッドで使い回すテスト."""
+    first_loop, thread = worker_loop.run_in_worker_loop(_current_loop())
+    second_loop, _ = worker_loop.run_in_worker_loop(_current_loop())
+
+    assert first_loop is second_loop
+    assert thread is not threading.current_thread()
+    assert first_loop.is_running()
+
+
+def test_run_in_worker_loop_propagates_exception():  # type: ignore
+    """コルーチンの例外を呼び出し元へ伝播するテスト."""
+
+    async def fail() -> None:
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        worker_loop.run_in_worker_loop(fail())
+
+
+def test_run_in_worker_loop_cancels_on_timeout():  # type: ignore
+    """待機がタイムアウトした場合にコルーチンを取り消すテスト."""
+    cancelled = threading.Event()
+
+    async def slow() -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(TimeoutError):
+        worker_loop.run_in_worker_loop(slow(), timeout=0.05)
+
+    assert cancelled.wait(timeout=1)
+
+
+def test_timeout_before_soft_limit():  # type: ignore
+    """ソフトタイムリミットより手前のタイムアウトを計算するテスト."""
+    assert worker_loop.timeout_before_soft_limit(1500) == 1440
+    assert worker_loop.timeout_before_soft_limit(None) is None
+
+
+def test_stop_worker_loop_closes_shared_clients():  # type: ignore
+    """停止時に共有クライアントを閉じ、次回は新しいループを起動するテスト."""
+    worker_loop._start_worker_loop()
+    loop = worker_loop.get_worker_loop()
+
+    with (
+        patch.object(worker_loop, "aclose_http_client", new_callable=AsyncMock) as mock_http,
+        patch.object(worker_loop, "aclose_shared_clients", new_callable=AsyncMock) as mock_ai,
+    ):
+        worker_loop._stop_worker_loop()
+
+    mock_http.assert_awaited_once()
+    mock_ai.assert_awaited_once()
+    assert loop.is_closed()
+    assert worker_loop.get_worker_loop() is not loop